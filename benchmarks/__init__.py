@@ -0,0 +1,45 @@
+"""Benchmarks of Nuke integration on synthetic scenes.
+
+Code paths are measured outside of Nuke with in-memory stand-in of the
+`nuke` module (see `nuke_stub`). Scenes are generated by `scenes`, measured
+cases are defined in `cases`.
+
+Run all cases and write results to JSON file:
+
+    python -m benchmarks --sizes 1000 10000 50000 --output results.json
+
+Run from repository root. Packages which are not available in the
+environment, e.g. ayon-core or pyblish, are replaced by stand-ins (see
+`host_stubs`), so integration modules and publish plugins can be measured
+without them.
+"""
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLIENT_DIR = os.path.join(REPO_ROOT, "client")
+
+
+def install_nuke_stub():
+    """Register stand-in as `nuke` module and make addon importable.
+
+    Returns:
+        module: Stand-in `nuke` module.
+    """
+    from . import nuke_stub
+
+    if CLIENT_DIR not in sys.path:
+        sys.path.insert(0, CLIENT_DIR)
+    sys.modules["nuke"] = nuke_stub
+    return nuke_stub
+
+
+def install_host_stubs():
+    """Register stand-ins of ayon-core, pyblish and qtpy if missing.
+
+    Returns:
+        list[str]: Names of packages replaced by stand-ins.
+    """
+    from . import host_stubs
+
+    return host_stubs.install()
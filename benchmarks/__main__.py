@@ -0,0 +1,170 @@
+"""Run benchmarks and write results as JSON.
+
+Usage:
+    python -m benchmarks [--sizes 1000 10000 50000] [--instances 50]
+        [--containers 200] [--repeat 5] [--case "registry.*"]
+        [--output results.json]
+"""
+import sys
+import json
+import time
+import fnmatch
+import argparse
+import platform
+import statistics
+import datetime
+
+from . import install_nuke_stub, install_host_stubs
+
+DEFAULT_SIZES = (1000, 10000, 50000)
+
+
+def _parse_args(args):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark Nuke integration on synthetic scenes.",
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+        help="Number of nodes of generated scenes.",
+    )
+    parser.add_argument(
+        "--instances", type=int, default=50,
+        help="Number of publish instances in each scene.",
+    )
+    parser.add_argument(
+        "--containers", type=int, default=200,
+        help="Number of loaded containers in each scene.",
+    )
+    parser.add_argument(
+        "--members", type=int, default=3,
+        help="Number of member nodes of each container.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5,
+        help="Number of timed runs of each case.",
+    )
+    parser.add_argument(
+        "--case", dest="case_patterns", action="append", default=[],
+        help="Run only cases matching the pattern, can be repeated.",
+    )
+    parser.add_argument(
+        "--output",
+        help="Path to JSON file with results, printed to stdout if not set.",
+    )
+    return parser.parse_args(args)
+
+
+def run_case(case_func, scene, repeat):
+    """Prepare and time the case.
+
+    Args:
+        case_func (Callable): Case function registered by `benchmark`.
+        scene (dict[str, Any]): Scene created by `build_scene`.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        dict[str, Any]: Result with timings in seconds or with reason why
+            the case was skipped.
+    """
+    try:
+        func = case_func(scene)
+    except ImportError as exc:
+        return {"status": "skipped", "reason": str(exc)}
+
+    timings = []
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            duration = time.perf_counter() - start
+            if getattr(func, "returns_duration", False):
+                duration = result
+            timings.append(duration)
+    finally:
+        cleanup = getattr(func, "cleanup", None)
+        if cleanup is not None:
+            cleanup()
+    return {
+        "status": "ok",
+        "repeat": repeat,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "max": max(timings),
+    }
+
+
+def main(args=None):
+    options = _parse_args(sys.argv[1:] if args is None else args)
+    install_nuke_stub()
+    stubbed_packages = install_host_stubs()
+
+    from ayon_nuke.version import __version__
+
+    from .cases import CASES
+    from .scenes import build_scene
+
+    cases = [
+        (name, func)
+        for name, func in CASES
+        if not options.case_patterns or any(
+            fnmatch.fnmatchcase(name, pattern)
+            for pattern in options.case_patterns
+        )
+    ]
+
+    results = []
+    for size in options.sizes:
+        scene = build_scene(
+            size,
+            instance_count=options.instances,
+            container_count=options.containers,
+            members_per_container=options.members,
+        )
+        scene_info = {
+            "nodes": scene["node_count"],
+            "instances": len(scene["instance_nodes"]),
+            "containers": len(scene["container_nodes"]),
+            "groups": len(scene["groups"]),
+            "backdrops": len(scene["backdrops"]),
+        }
+        for name, case_func in cases:
+            result = {"case": name, "size": size, "scene": scene_info}
+            result.update(run_case(case_func, scene, options.repeat))
+            results.append(result)
+            if result["status"] == "ok":
+                line = "{:>7} {:<40} {:>12.3f} ms".format(
+                    size, name, result["min"] * 1000
+                )
+            else:
+                line = "{:>7} {:<40} {:>15}".format(size, name, "skipped")
+            print(line, file=sys.stderr)
+
+    output = {
+        "addon_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "stubbed_packages": stubbed_packages,
+        "created": datetime.datetime.now(
+            datetime.timezone.utc
+        ).isoformat(),
+        "options": {
+            "sizes": options.sizes,
+            "instances": options.instances,
+            "containers": options.containers,
+            "members": options.members,
+            "repeat": options.repeat,
+        },
+        "results": results,
+    }
+    if options.output:
+        with open(options.output, "w") as stream:
+            json.dump(output, stream, indent=4)
+    else:
+        json.dump(output, sys.stdout, indent=4)
+        print()
+
+
+if __name__ == "__main__":
+    main()
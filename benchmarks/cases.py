@@ -0,0 +1,525 @@
+"""Measured benchmark cases.
+
+Case is a function which receives scene created by `scenes.build_scene`,
+prepares the data and returns callable which is timed. Cases are
+registered with `benchmark` decorator in order of definition.
+
+Cases named with `baseline` suffix measure the straightforward
+implementation which the optimized code path replaced, so both can be
+compared on the same scene.
+
+Returned callable can have `cleanup` attribute with function called after
+the timed runs, e.g. to remove files created by the preparation. Callable
+with `returns_duration` attribute set to True returns the measured
+duration in seconds, e.g. of code run in another process.
+
+Case raising `ImportError` during preparation is reported as skipped.
+"""
+import os
+import re
+import tempfile
+import importlib.util
+
+import nuke
+
+import ayon_nuke
+
+from ayon_nuke.node_data_codec import (
+    AVALON_KNOB_PREFIXES,
+    INSTANCE_DATA_KNOB,
+    decode_node_data,
+    encode_node_data,
+    get_node_data_cache,
+)
+
+from .scenes import (
+    CONTAINER_ID_KNOB,
+    CREATOR_IDENTIFIERS,
+    PROJECT_ROOTS,
+)
+
+FIRST_FRAME = 1001
+LAST_FRAME = 1100
+# Number of containers used by member queries
+MEMBER_QUERY_COUNT = 10
+# First user knob in `writeKnobs` output
+_USER_KNOB_REGEX = re.compile(r"(?<=addUserKnob {)([0-9]*) (\S*)(?=[ |}])")
+PUBLISH_PLUGINS_DIR = os.path.join(
+    os.path.dirname(ayon_nuke.__file__), "plugins", "publish"
+)
+
+CASES = []
+
+
+def benchmark(name):
+    """Register function as benchmark case.
+
+    Args:
+        name (str): Unique name of the case.
+    """
+    def decorator(func):
+        CASES.append((name, func))
+        return func
+    return decorator
+
+
+def _get_instance_data(scene):
+    return [
+        decode_node_data(node[INSTANCE_DATA_KNOB].value())
+        for node in scene["instance_nodes"]
+    ]
+
+
+def _get_dirmap_mapping():
+    return {
+        "source_path": list(PROJECT_ROOTS),
+        "destination_path": [
+            root.replace("/mnt/projects", "/Volumes/projects")
+            for root in PROJECT_ROOTS
+        ],
+    }
+
+
+def _make_codec_cases(codec_name):
+    @benchmark("codec.encode[{}]".format(codec_name))
+    def encode_case(scene):
+        items = _get_instance_data(scene)
+        return lambda: [encode_node_data(item, codec_name) for item in items]
+
+    @benchmark("codec.decode[{}]".format(codec_name))
+    def decode_case(scene):
+        values = [
+            encode_node_data(item, codec_name)
+            for item in _get_instance_data(scene)
+        ]
+        return lambda: [decode_node_data(value) for value in values]
+
+
+_make_codec_cases("json")
+_make_codec_cases("zjson")
+
+
+@benchmark("node_data.get_node_data_view[cold]")
+def get_node_data_view_cold(scene):
+    from ayon_nuke.api.node_data import get_node_data_view
+
+    nodes = scene["instance_nodes"]
+    cache = get_node_data_cache()
+
+    def run():
+        cache.clear()
+        for node in nodes:
+            get_node_data_view(node, INSTANCE_DATA_KNOB)
+    return run
+
+
+@benchmark("node_data.get_node_data_view[warm]")
+def get_node_data_view_warm(scene):
+    from ayon_nuke.api.node_data import get_node_data_view
+
+    nodes = scene["instance_nodes"]
+    return lambda: [
+        get_node_data_view(node, INSTANCE_DATA_KNOB)
+        for node in nodes
+    ]
+
+
+@benchmark("node_data.get_node_data[warm]")
+def get_node_data_warm(scene):
+    from ayon_nuke.api.node_data import get_node_data
+
+    nodes = scene["instance_nodes"]
+    return lambda: [
+        get_node_data(node, INSTANCE_DATA_KNOB)
+        for node in nodes
+    ]
+
+
+@benchmark("node_data.read_avalon_data")
+def read_avalon_data(scene):
+    from ayon_nuke.api.node_data import read_avalon_data
+
+    nodes = nuke.allNodes(recurseGroups=True)
+    return lambda: [read_avalon_data(node) for node in nodes]
+
+
+def _read_avalon_data_tcl(node):
+    """Previous `read_avalon_data` parsing TCL of user knobs."""
+    data = {}
+    tcl_script = node.writeKnobs(nuke.WRITE_USER_KNOB_DEFS)
+    result = _USER_KNOB_REGEX.search(tcl_script)
+    if not result:
+        return data
+
+    first_user_knob = result.group(2)
+    for knob in reversed(node.allKnobs()):
+        knob_name = knob.name()
+        if not knob_name:
+            continue
+        try:
+            knob_type = nuke.knob(knob.fullyQualifiedName(), type=True)
+            value = knob.value()
+        except Exception:
+            continue
+        if knob_type not in (20, 26) or (knob_type == 26 and value):
+            for prefix in AVALON_KNOB_PREFIXES:
+                if knob_name.startswith(prefix):
+                    data[knob_name[len(prefix):]] = value
+                    break
+        if knob_name == first_user_knob:
+            break
+    return data
+
+
+@benchmark("node_data.read_avalon_data.baseline")
+def read_avalon_data_baseline(scene):
+    nodes = nuke.allNodes(recurseGroups=True)
+    return lambda: [_read_avalon_data_tcl(node) for node in nodes]
+
+
+@benchmark("registry.scan.baseline")
+def registry_scan_baseline(scene):
+    def run():
+        instance_nodes = []
+        avalon_nodes = []
+        for node in nuke.allNodes(recurseGroups=True):
+            knobs = node.knobs()
+            if INSTANCE_DATA_KNOB in knobs:
+                instance_nodes.append(node)
+            if any(
+                knob_name.startswith(AVALON_KNOB_PREFIXES)
+                for knob_name in knobs
+            ):
+                avalon_nodes.append(node)
+        return instance_nodes, avalon_nodes
+    return run
+
+
+@benchmark("registry.build")
+def registry_build(scene):
+    from ayon_nuke.api.scene_registry import SceneRegistry
+
+    registry = SceneRegistry()
+
+    def run():
+        registry.reset()
+        registry.get_instance_nodes()
+    return run
+
+
+def _run_registry_queries(registry, scene):
+    for creator_id in CREATOR_IDENTIFIERS:
+        registry.get_instance_nodes(creator_id)
+    registry.get_avalon_nodes()
+    for representation_id in scene["representation_ids"]:
+        registry.get_container_nodes(representation_id)
+    for container_id in scene["container_ids"]:
+        registry.get_member_nodes(container_id)
+
+
+@benchmark("registry.queries[batch]")
+def registry_queries_batch(scene):
+    from ayon_nuke.api.scene_registry import SceneRegistry
+
+    registry = SceneRegistry()
+
+    def run():
+        with registry.batch():
+            _run_registry_queries(registry, scene)
+    return run
+
+
+@benchmark("registry.queries[tracking]")
+def registry_queries_tracking(scene):
+    from ayon_nuke.api.scene_registry import SceneRegistry
+
+    registry = SceneRegistry()
+    registry.tracking = True
+    # Index is built by the first query and kept up to date by callbacks
+    registry.get_instance_nodes()
+    return lambda: _run_registry_queries(registry, scene)
+
+
+@benchmark("registry.members[batch]")
+def registry_members_batch(scene):
+    from ayon_nuke.api.scene_registry import SceneRegistry
+
+    registry = SceneRegistry()
+    container_ids = scene["container_ids"][:MEMBER_QUERY_COUNT]
+
+    def run():
+        with registry.batch():
+            for container_id in container_ids:
+                registry.get_member_nodes(container_id)
+    return run
+
+
+@benchmark("registry.members.baseline")
+def registry_members_baseline(scene):
+    container_ids = scene["container_ids"][:MEMBER_QUERY_COUNT]
+
+    def run():
+        for container_id in container_ids:
+            [
+                node
+                for node in nuke.allNodes(recurseGroups=True)
+                if node.knobs().get(CONTAINER_ID_KNOB) is not None
+                and node[CONTAINER_ID_KNOB].value() == container_id
+            ]
+    return run
+
+
+@benchmark("frame_paths.template")
+def frame_paths_template(scene):
+    from ayon_nuke.api.frame_paths import get_frame_paths
+
+    nodes = scene["write_nodes"]
+    return lambda: [
+        get_frame_paths(node, FIRST_FRAME, LAST_FRAME)
+        for node in nodes
+    ]
+
+
+@benchmark("frame_paths.baseline")
+def frame_paths_baseline(scene):
+    nodes = scene["write_nodes"]
+    return lambda: [
+        sorted({
+            node["file"].evaluate(frame)
+            for frame in range(FIRST_FRAME, LAST_FRAME + 1)
+        })
+        for node in nodes
+    ]
+
+
+@benchmark("dirmap.resolve[cold]")
+def dirmap_resolve_cold(scene):
+    from ayon_nuke.api.dirmap_resolver import DirmapResolver
+
+    mapping = _get_dirmap_mapping()
+    paths = [node["file"].value() for node in scene["read_nodes"]]
+
+    def run():
+        resolver = DirmapResolver(mapping)
+        for path in paths:
+            resolver.resolve(path)
+    return run
+
+
+@benchmark("dirmap.resolve[warm]")
+def dirmap_resolve_warm(scene):
+    from ayon_nuke.api.dirmap_resolver import DirmapResolver
+
+    resolver = DirmapResolver(_get_dirmap_mapping())
+    paths = [node["file"].value() for node in scene["read_nodes"]]
+    for path in paths:
+        resolver.resolve(path)
+    return lambda: [resolver.resolve(path) for path in paths]
+
+
+@benchmark("dirmap.resolve.baseline")
+def dirmap_resolve_baseline(scene):
+    mapping = _get_dirmap_mapping()
+    pairs = list(zip(mapping["source_path"], mapping["destination_path"]))
+    paths = [node["file"].value() for node in scene["read_nodes"]]
+
+    def run():
+        # Replace each source path and check existence of the result
+        for path in paths:
+            for source_path, destination_path in pairs:
+                mapped_path = path.replace(source_path, destination_path)
+                if mapped_path != path and os.path.exists(mapped_path):
+                    break
+    return run
+
+
+@benchmark("nk_reader.parse")
+def nk_reader_parse(scene):
+    from ayon_nuke.nk_reader import iter_nk_lines
+
+    from .scenes import iter_script_lines
+
+    lines = list(iter_script_lines())
+    return lambda: sum(1 for _ in iter_nk_lines(lines))
+
+
+@benchmark("pipeline.list_instances")
+def pipeline_list_instances(scene):
+    from ayon_nuke.api.pipeline import list_instances
+
+    return list_instances
+
+
+@benchmark("pipeline.ls")
+def pipeline_ls(scene):
+    from ayon_nuke.api.pipeline import ls
+
+    return lambda: list(ls())
+
+
+@benchmark("plugin._collect_and_cache_nodes")
+def plugin_collect_and_cache_nodes(scene):
+    from ayon_nuke.api.plugin import _collect_and_cache_nodes
+
+    class CreateContext:
+        pass
+
+    class Creator:
+        def __init__(self):
+            self.collection_shared_data = {}
+            self.create_context = CreateContext()
+
+    return lambda: _collect_and_cache_nodes(Creator())
+
+
+@benchmark("lib.get_dependent_nodes")
+def lib_get_dependent_nodes(scene):
+    from ayon_nuke.api.lib import get_dependent_nodes
+
+    groups = [group.nodes() for group in scene["groups"]]
+    return lambda: [get_dependent_nodes(nodes) for nodes in groups]
+
+
+@benchmark("lib.get_backdrop_nodes")
+def lib_get_backdrop_nodes(scene):
+    from ayon_nuke.api.lib import get_backdrop_nodes
+
+    backdrops = scene["backdrops"]
+    return lambda: [get_backdrop_nodes(backdrop) for backdrop in backdrops]
+
+
+@benchmark("lib.find_free_space_to_paste_nodes")
+def lib_find_free_space_to_paste_nodes(scene):
+    from ayon_nuke.api.lib import find_free_space_to_paste_nodes
+
+    nodes = scene["container_nodes"][:10]
+    return lambda: find_free_space_to_paste_nodes(nodes)
+
+
+def _load_publish_plugin(file_name, class_name):
+    """Load publish plugin class from file the way pyblish does."""
+    module_name = "benchmarks.publish_plugins.{}".format(
+        os.path.splitext(file_name)[0]
+    )
+    spec = importlib.util.spec_from_file_location(
+        module_name, os.path.join(PUBLISH_PLUGINS_DIR, file_name)
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, class_name)
+
+
+def _create_publish_context():
+    import pyblish.api
+
+    context = pyblish.api.Context()
+    context.data.update({"handleStart": 0, "handleEnd": 0, "fps": 25.0})
+    return context
+
+
+def _render_files(root, node):
+    """Point file knob of node to existing files of all frames.
+
+    Args:
+        root (str): Directory in which output directory is created.
+        node (nuke.Node): Read or Write node.
+    """
+    output_dir = os.path.join(root, node.name())
+    os.makedirs(output_dir)
+    node["file"].setValue(
+        "{}/{}_v001.%04d.exr".format(
+            output_dir.replace("\\", "/"), node.name()
+        )
+    )
+    for frame in range(FIRST_FRAME, LAST_FRAME + 1):
+        open(node["file"].evaluate(frame), "w").close()
+
+
+def _with_rendered_files(nodes, run):
+    """Render files of nodes for `run` and remove them in cleanup."""
+    temp_dir = tempfile.TemporaryDirectory(prefix="ayon_nuke_benchmark_")
+    for node in nodes:
+        _render_files(temp_dir.name, node)
+    run.cleanup = temp_dir.cleanup
+    return run
+
+
+@benchmark("publish.collect_writes")
+def publish_collect_writes(scene):
+    plugin_class = _load_publish_plugin(
+        "collect_writes.py", "CollectNukeWrites"
+    )
+    groups = scene["instance_nodes"]
+
+    def run():
+        # write nodes and frame ranges are cached on class by instance name
+        plugin_class._write_nodes.clear()
+        plugin_class._frame_ranges.clear()
+        context = _create_publish_context()
+        plugin = plugin_class()
+        for group in groups:
+            instance = context.create_instance(
+                group.name(),
+                productBaseType="render",
+                families=[],
+                render_target="frames",
+                transientData={"node": group},
+                representations=[],
+            )
+            plugin.process(instance)
+    return _with_rendered_files(scene["write_nodes"], run)
+
+
+@benchmark("publish.collect_reads")
+def publish_collect_reads(scene):
+    plugin_class = _load_publish_plugin(
+        "collect_reads.py", "CollectNukeReads"
+    )
+    nodes = scene["read_nodes"][:len(scene["instance_nodes"])]
+
+    def run():
+        context = _create_publish_context()
+        plugin = plugin_class()
+        for node in nodes:
+            instance = context.create_instance(
+                node.name(),
+                productBaseType="source",
+                productName="source" + node.name(),
+                transientData={"node": node},
+            )
+            plugin.process(instance)
+    return _with_rendered_files(nodes, run)
+
+
+@benchmark("publish.collect_backdrop")
+def publish_collect_backdrop(scene):
+    plugin_class = _load_publish_plugin(
+        "collect_backdrop.py", "CollectBackdrops"
+    )
+    backdrops = scene["backdrops"]
+
+    def run():
+        context = _create_publish_context()
+        plugin = plugin_class()
+        for backdrop in backdrops:
+            instance = context.create_instance(
+                backdrop.name(),
+                transientData={"node": backdrop},
+            )
+            plugin.process(instance)
+    return run
+
+
+def _make_startup_case(render_only):
+    @benchmark("startup[{}]".format("render_only" if render_only else "full"))
+    def startup_case(scene):
+        from .startup import run_startup
+
+        def run():
+            return run_startup(render_only)["duration"]
+        run.returns_duration = True
+        return run
+
+
+_make_startup_case(True)
+_make_startup_case(False)
@@ -0,0 +1,293 @@
+"""Stand-in modules of ayon-core, ayon-api, pyblish and qtpy.
+
+Integration modules like `ayon_nuke.api.lib` or publish plugins import
+a lot of names from these packages at import time, but the measured code
+paths use only a few of them. The stand-ins define values and classes
+which the measured code calls, any other attribute of a stand-in module
+is a placeholder class which can be called, subclassed and has any
+attribute, so module level code of the integration can be executed.
+
+Nothing is connected to AYON server, project is `benchmark`, project
+settings contain only `PROJECT_SETTINGS` and anatomy and colorspace data
+are empty.
+
+Use `benchmarks.install_host_stubs` to register the modules.
+"""
+import os
+import sys
+import types
+import logging
+
+PROJECT_NAME = "benchmark"
+FOLDER_PATH = "/shots/sh0010"
+TASK_NAME = "compositing"
+PROJECT_SETTINGS = {
+    "nuke": {
+        "dirmap": {
+            "enabled": True,
+            "paths": {
+                "source_path": ["/mnt/projects"],
+                "destination_path": ["/Volumes/projects"],
+            },
+        },
+    },
+}
+
+# Packages replaced by stand-ins when they are not installed
+STUB_PACKAGES = ("ayon_core", "ayon_api", "pyblish", "qtpy")
+
+
+class _PlaceholderMeta(type):
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _make_placeholder(name, cls.__module__)
+
+
+class Placeholder(metaclass=_PlaceholderMeta):
+    """Object accepting any arguments and having any attribute."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _make_placeholder(name, self.__class__.__module__)
+
+    def __call__(self, *args, **kwargs):
+        return Placeholder()
+
+    def __bool__(self):
+        return False
+
+    def __iter__(self):
+        return iter(())
+
+
+def _make_placeholder(name, module_name):
+    return _PlaceholderMeta(name, (Placeholder,), {"__module__": module_name})
+
+
+class StubModule(types.ModuleType):
+    """Module creating placeholders for undefined attributes."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = _make_placeholder(name, self.__name__)
+        setattr(self, name, value)
+        return value
+
+
+class Logger:
+    @staticmethod
+    def get_logger(name):
+        return logging.getLogger(name)
+
+
+def env_value_to_bool(env_key=None, value=None, default=False):
+    if value is None:
+        value = os.getenv(env_key)
+    if value is None:
+        return default
+    return value.lower() in ("1", "yes", "true", "on")
+
+
+class Host(Placeholder):
+    name = "nuke"
+
+    def get_containers(self):
+        from ayon_nuke.api.pipeline import ls
+
+        return ls()
+
+
+_host = Host()
+
+
+class AYONPyblishPluginMixin:
+    """Publish plugin mixin without attribute definitions."""
+
+    @classmethod
+    def get_attr_values_from_data(cls, data):
+        return {}
+
+    def set_representation_colorspace(
+        self, representation, context, colorspace=None
+    ):
+        if colorspace:
+            representation["colorspaceData"] = {"colorspace": colorspace}
+
+
+class Plugin:
+    order = 0
+    label = None
+    hosts = []
+    families = []
+    targets = []
+    log = logging.getLogger("pyblish.plugin")
+
+
+class ContextPlugin(Plugin):
+    pass
+
+
+class InstancePlugin(Plugin):
+    pass
+
+
+class Instance(list):
+    """Publish instance with data."""
+
+    def __init__(self, name, parent=None):
+        super().__init__()
+        self.name = name
+        self.context = parent
+        self.data = {"name": name}
+
+    def __repr__(self):
+        return self.name
+
+    __hash__ = object.__hash__
+
+
+class Context(list):
+    """Publish context holding instances."""
+
+    def __init__(self):
+        super().__init__()
+        self.data = {}
+
+    def create_instance(self, name, **kwargs):
+        instance = Instance(name, parent=self)
+        instance.data.update(kwargs)
+        self.append(instance)
+        return instance
+
+
+def _module_attributes():
+    return {
+        "ayon_core.lib": {
+            "Logger": Logger,
+            "env_value_to_bool": env_value_to_bool,
+        },
+        "ayon_core.lib.transcoding": {
+            "VIDEO_EXTENSIONS": {".mov", ".mp4", ".mxf", ".avi", ".mkv"},
+            "IMAGE_EXTENSIONS": {".exr", ".dpx", ".png", ".jpg", ".tif"},
+        },
+        "ayon_core.pipeline": {
+            "AYON_CONTAINER_ID": "ayon.load.container",
+            "AYON_INSTANCE_ID": "ayon.create.instance",
+            "AVALON_CONTAINER_ID": "pyblish.avalon.container",
+            "AVALON_INSTANCE_ID": "pyblish.avalon.instance",
+            "registered_host": lambda: _host,
+            "install_host": lambda host: host.install(),
+            "get_current_host_name": lambda: "nuke",
+            "get_current_project_name": lambda: PROJECT_NAME,
+            "get_current_folder_path": lambda: FOLDER_PATH,
+            "get_current_task_name": lambda: TASK_NAME,
+            "get_current_context": lambda: {
+                "project_name": PROJECT_NAME,
+                "folder_path": FOLDER_PATH,
+                "task_name": TASK_NAME,
+            },
+        },
+        "ayon_core.pipeline.publish": {
+            "AYONPyblishPluginMixin": AYONPyblishPluginMixin,
+            "ColormanagedPyblishPluginMixin": AYONPyblishPluginMixin,
+            "OptionalPyblishPluginMixin": AYONPyblishPluginMixin,
+            "PublishValidationError": type(
+                "PublishValidationError", (Exception,), {}
+            ),
+            "KnownPublishError": type("KnownPublishError", (Exception,), {}),
+        },
+        "ayon_core.settings": {
+            "get_project_settings": lambda project_name: PROJECT_SETTINGS,
+        },
+        "pyblish.api": {
+            "CollectorOrder": 0,
+            "ValidatorOrder": 1,
+            "ExtractorOrder": 2,
+            "IntegratorOrder": 3,
+            "Plugin": Plugin,
+            "ContextPlugin": ContextPlugin,
+            "InstancePlugin": InstancePlugin,
+            "Context": Context,
+            "Instance": Instance,
+        },
+    }
+
+
+def _get_module(name):
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    module = StubModule(name)
+    # mark as package so submodules can be imported
+    module.__path__ = []
+    sys.modules[name] = module
+    parent_name, _, child_name = name.rpartition(".")
+    if parent_name:
+        setattr(_get_module(parent_name), child_name, module)
+    return module
+
+
+class _StubFinder:
+    """Import submodules of stubbed packages as stand-in modules."""
+
+    def __init__(self, packages):
+        self.packages = packages
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname.split(".")[0] not in self.packages:
+            return None
+        import importlib.machinery
+
+        return importlib.machinery.ModuleSpec(fullname, self)
+
+    def create_module(self, spec):
+        return _get_module(spec.name)
+
+    def exec_module(self, module):
+        pass
+
+
+def install(packages=None):
+    """Register stand-ins of packages which can't be imported.
+
+    Args:
+        packages (Optional[Iterable[str]]): Top level package names, all
+            of `STUB_PACKAGES` by default.
+
+    Returns:
+        list[str]: Names of stubbed packages.
+    """
+    import importlib.util
+
+    if packages is None:
+        packages = STUB_PACKAGES
+    stubbed = []
+    for package in packages:
+        module = sys.modules.get(package)
+        if module is None:
+            if importlib.util.find_spec(package) is None:
+                stubbed.append(package)
+        elif isinstance(module, StubModule):
+            stubbed.append(package)
+    if not stubbed:
+        return stubbed
+
+    for finder in sys.meta_path:
+        if isinstance(finder, _StubFinder):
+            finder.packages.update(stubbed)
+            break
+    else:
+        sys.meta_path.append(_StubFinder(set(stubbed)))
+    for module_name, attributes in _module_attributes().items():
+        if module_name.split(".")[0] not in stubbed:
+            continue
+        module = _get_module(module_name)
+        for key, value in attributes.items():
+            setattr(module, key, value)
+    return stubbed
@@ -0,0 +1,800 @@
+"""In-memory stand-in of the `nuke` module.
+
+Implements the subset of Nuke python API used by the measured code paths:
+nodes with knobs, groups, node inputs and dependencies, node graph
+positions, callbacks and undo. Nodes live only in memory, nothing is
+rendered or evaluated. Knob values of file knobs are evaluated for frames
+by replacing the padding token with the frame number.
+
+Use `benchmarks.install_nuke_stub` to register the module as `nuke`.
+"""
+import re
+from collections import defaultdict
+
+GUI = False
+NUKE_VERSION_MAJOR = 15
+NUKE_VERSION_MINOR = 1
+NUKE_VERSION_STRING = "15.1v1"
+env = {
+    "gui": False,
+    "NukeVersionMajor": NUKE_VERSION_MAJOR,
+    "NukeVersionMinor": NUKE_VERSION_MINOR,
+    "NukeVersionString": NUKE_VERSION_STRING,
+}
+
+# Dependency types
+INPUTS = 1
+HIDDEN_INPUTS = 2
+EXPRESSIONS = 4
+
+# Knob flags
+INVISIBLE = 1024
+STARTLINE = 4096
+
+# `filename` types
+REPLACE = 1
+
+# `writeKnobs` flags
+WRITE_NON_DEFAULT_ONLY = 2
+WRITE_USER_KNOB_DEFS = 4
+
+# Knob type ids used by `addUserKnob` and `knob(..., type=True)`
+KNOB_TYPE_IDS = {
+    "String_Knob": 1,
+    "File_Knob": 2,
+    "Int_Knob": 3,
+    "Enumeration_Knob": 4,
+    "Boolean_Knob": 6,
+    "Double_Knob": 7,
+    "Tab_Knob": 20,
+    "Text_Knob": 26,
+    "Multiline_Eval_String_Knob": 41,
+}
+
+# Screen size of node in node graph
+NODE_SCREEN_WIDTH = 80
+NODE_SCREEN_HEIGHT = 18
+
+# Output format of image nodes
+FORMAT_WIDTH = 1920
+FORMAT_HEIGHT = 1080
+
+_PADDING_REGEX = re.compile(r"%(\d*)d|#+|\$F(\d*)")
+
+_callbacks = defaultdict(list)
+_this_nodes = []
+_this_knobs = []
+_current_frame = 1001
+
+
+class Knob:
+    """Knob with python value."""
+    default_value = ""
+
+    def __init__(self, name, label=None, value=None):
+        self._name = name
+        self._label = label or name
+        self._value = self.default_value if value is None else value
+        self._flags = 0
+        self._node = None
+
+    def __repr__(self):
+        return "<{} '{}'>".format(self.Class(), self._name)
+
+    def Class(self):
+        return self.__class__.__name__
+
+    def name(self):
+        return self._name
+
+    def label(self):
+        return self._label
+
+    def node(self):
+        return self._node
+
+    def fullyQualifiedName(self):
+        return "{}.{}".format(self._node.fullName(), self._name)
+
+    def value(self):
+        return self._value
+
+    def getValue(self):
+        return self._value
+
+    def setValue(self, value):
+        self._value = value
+        return True
+
+    def evaluate(self, frame=None):
+        return self._value
+
+    def setFlag(self, flag):
+        self._flags |= flag
+
+    def clearFlag(self, flag):
+        self._flags &= ~flag
+
+    def getFlag(self, flag):
+        return bool(self._flags & flag)
+
+    def setVisible(self, visible):
+        if visible:
+            self.clearFlag(INVISIBLE)
+        else:
+            self.setFlag(INVISIBLE)
+
+    def visible(self):
+        return not self.getFlag(INVISIBLE)
+
+    def toScript(self):
+        return str(self._value)
+
+
+class String_Knob(Knob):
+    pass
+
+
+class Multiline_Eval_String_Knob(String_Knob):
+    pass
+
+
+class Text_Knob(Knob):
+    pass
+
+
+class Tab_Knob(Knob):
+    pass
+
+
+class File_Knob(Knob):
+    """File path knob, padding token is replaced on evaluation."""
+
+    def evaluate(self, frame=None):
+        if frame is None:
+            frame = _current_frame
+        frame = int(frame)
+        return _PADDING_REGEX.sub(
+            lambda match: _format_padding(match, frame), self._value
+        )
+
+
+class Int_Knob(Knob):
+    default_value = 0
+
+    def setValue(self, value):
+        self._value = int(value)
+        return True
+
+
+class Double_Knob(Knob):
+    default_value = 0.0
+
+    def setValue(self, value):
+        self._value = float(value)
+        return True
+
+
+class Boolean_Knob(Knob):
+    default_value = False
+
+    def setValue(self, value):
+        self._value = bool(value)
+        return True
+
+
+class Enumeration_Knob(Knob):
+
+    def __init__(self, name, label=None, values=None):
+        values = list(values or [])
+        super().__init__(name, label, values[0] if values else "")
+        self._values = values
+
+    def values(self):
+        return list(self._values)
+
+
+def _format_padding(match, frame):
+    token = match.group(0)
+    if token.startswith("#"):
+        width = len(token)
+    else:
+        width = int(match.group(1) or match.group(2) or 0)
+    return "{:0{}d}".format(frame, width)
+
+
+# Knobs created with every node of class
+_CLASS_KNOBS = {
+    "Read": (
+        lambda: File_Knob("file"),
+        lambda: Int_Knob("first", value=1001),
+        lambda: Int_Knob("last", value=1100),
+        lambda: String_Knob("colorspace", value="default"),
+    ),
+    "Write": (
+        lambda: File_Knob("file"),
+        lambda: String_Knob("file_type", value="exr"),
+        lambda: Int_Knob("first", value=1001),
+        lambda: Int_Knob("last", value=1100),
+        lambda: Boolean_Knob("use_limit"),
+        lambda: String_Knob("colorspace", value="default"),
+        lambda: String_Knob("channels", value="rgba"),
+    ),
+    "BackdropNode": (
+        lambda: Int_Knob("bdwidth", value=400),
+        lambda: Int_Knob("bdheight", value=300),
+        lambda: String_Knob("label"),
+    ),
+}
+_NO_INPUT_CLASSES = {"Read", "Root", "BackdropNode", "Input", "Constant"}
+_MULTI_INPUT_CLASSES = {"Merge2", "Switch", "Dissolve"}
+_NO_OUTPUT_CLASSES = {"Root", "BackdropNode", "Viewer", "Output"}
+
+
+class Node:
+    """Node in node graph of a group."""
+
+    def __init__(self, node_class, name, parent):
+        self._class = node_class
+        self._parent = parent
+        self._erased = False
+        self._inputs = []
+        self._outputs = {}
+        self._knobs = {}
+        self.addKnob(String_Knob("name", value=name))
+        self.addKnob(Int_Knob("xpos"))
+        self.addKnob(Int_Knob("ypos"))
+        self.addKnob(Int_Knob("tile_color"))
+        if node_class not in ("Root", "BackdropNode"):
+            self.addKnob(Boolean_Knob("disable"))
+        for knob_factory in _CLASS_KNOBS.get(node_class, ()):
+            self.addKnob(knob_factory())
+        # knobs added later are user knobs
+        self._builtin_knob_names = set(self._knobs)
+
+    def __repr__(self):
+        return "<{} '{}'>".format(self._class, self._knobs["name"].value())
+
+    def __getitem__(self, knob_name):
+        self._check_alive()
+        knob = self._knobs.get(knob_name)
+        if knob is None:
+            raise NameError("knob {} does not exist".format(knob_name))
+        return knob
+
+    def _check_alive(self):
+        if self._erased:
+            raise ValueError("A PythonObject is not attached to a node")
+
+    def Class(self):
+        return self._class
+
+    def name(self):
+        self._check_alive()
+        return self._knobs["name"].value()
+
+    def setName(self, name):
+        self._knobs["name"].setValue(name)
+
+    def fullName(self):
+        self._check_alive()
+        name = self._knobs["name"].value()
+        parent = self._parent
+        if parent is None or parent is _root:
+            return name
+        return "{}.{}".format(parent.fullName(), name)
+
+    def parent(self):
+        return self._parent
+
+    def knobs(self):
+        self._check_alive()
+        return dict(self._knobs)
+
+    def knob(self, name):
+        return self._knobs.get(name)
+
+    def allKnobs(self):
+        self._check_alive()
+        return list(self._knobs.values())
+
+    def writeKnobs(self, flags=0):
+        """Knobs as TCL, `addUserKnob` lines need `WRITE_USER_KNOB_DEFS`."""
+        self._check_alive()
+        lines = []
+        for knob_name, knob in self._knobs.items():
+            if (
+                flags & WRITE_USER_KNOB_DEFS
+                and knob_name not in self._builtin_knob_names
+            ):
+                lines.append("addUserKnob {{{} {}}}".format(
+                    KNOB_TYPE_IDS.get(knob.Class(), 1), knob_name
+                ))
+            value = knob.toScript()
+            if flags & WRITE_NON_DEFAULT_ONLY and not value:
+                continue
+            if not value or any(char in value for char in " \t\n\"{}"):
+                value = '"{}"'.format(
+                    value.replace("\\", "\\\\").replace('"', '\\"')
+                )
+            lines.append("{} {}".format(knob_name, value))
+        return "\n".join(lines)
+
+    def addKnob(self, knob):
+        knob._node = self
+        self._knobs[knob.name()] = knob
+
+    def removeKnob(self, knob):
+        self._knobs.pop(knob.name(), None)
+        knob._node = None
+
+    def xpos(self):
+        return self._knobs["xpos"].value()
+
+    def ypos(self):
+        return self._knobs["ypos"].value()
+
+    def setXpos(self, xpos):
+        self._knobs["xpos"].setValue(xpos)
+
+    def setYpos(self, ypos):
+        self._knobs["ypos"].setValue(ypos)
+
+    def setXYpos(self, xpos, ypos):
+        self.setXpos(xpos)
+        self.setYpos(ypos)
+
+    def width(self):
+        return FORMAT_WIDTH
+
+    def height(self):
+        return FORMAT_HEIGHT
+
+    def pixelAspect(self):
+        return 1.0
+
+    def screenWidth(self):
+        return NODE_SCREEN_WIDTH
+
+    def screenHeight(self):
+        return NODE_SCREEN_HEIGHT
+
+    def maxInputs(self):
+        if self._class in _NO_INPUT_CLASSES:
+            return 0
+        if self._class in _MULTI_INPUT_CLASSES:
+            return 10000
+        return 1
+
+    def maxOutputs(self):
+        if self._class in _NO_OUTPUT_CLASSES:
+            return 0
+        return 1
+
+    def inputs(self):
+        return len(self._inputs)
+
+    def input(self, idx):
+        if idx < len(self._inputs):
+            return self._inputs[idx]
+        return None
+
+    def setInput(self, idx, node):
+        while len(self._inputs) <= idx:
+            self._inputs.append(None)
+        previous = self._inputs[idx]
+        if previous is not None:
+            self._disconnect_output(previous)
+        self._inputs[idx] = node
+        if node is not None:
+            node._outputs[self] = node._outputs.get(self, 0) + 1
+        while self._inputs and self._inputs[-1] is None:
+            self._inputs.pop()
+        return True
+
+    def _disconnect_output(self, node):
+        count = node._outputs.get(self, 0) - 1
+        if count > 0:
+            node._outputs[self] = count
+        else:
+            node._outputs.pop(self, None)
+
+    def dependencies(self, what=INPUTS | HIDDEN_INPUTS | EXPRESSIONS):
+        if not what & INPUTS:
+            return []
+        return list(dict.fromkeys(
+            node for node in self._inputs if node is not None
+        ))
+
+    def dependent(
+        self, what=INPUTS | HIDDEN_INPUTS | EXPRESSIONS, forceEvaluate=True
+    ):
+        if not what & INPUTS:
+            return []
+        return list(self._outputs)
+
+    def setSelected(self, selected):
+        self._selected = selected
+
+    def isSelected(self):
+        return getattr(self, "_selected", False)
+
+
+class Group(Node):
+    """Node containing other nodes."""
+
+    def __init__(self, node_class, name, parent):
+        super().__init__(node_class, name, parent)
+        self._nodes = []
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end()
+
+    def begin(self):
+        _group_stack.append(self)
+
+    def end(self):
+        if len(_group_stack) > 1:
+            _group_stack.pop()
+
+    def nodes(self):
+        return list(self._nodes)
+
+    def node(self, name):
+        for node in self._nodes:
+            if node.name() == name:
+                return node
+        return None
+
+
+class LiveGroup(Group):
+    pass
+
+
+class Gizmo(Group):
+    pass
+
+
+class Root(Group):
+    """Root of the script."""
+
+    def __init__(self):
+        super().__init__("Root", "root", None)
+        for knob in (
+            String_Knob("name", value=""),
+            Int_Knob("first_frame", value=1001),
+            Int_Knob("last_frame", value=1100),
+            Double_Knob("fps", value=25.0),
+            Boolean_Knob("lock_range"),
+            String_Knob("format", value="HD_1080"),
+            String_Knob("colorManagement", value="OCIO"),
+        ):
+            self.addKnob(knob)
+        self._builtin_knob_names = set(self._knobs)
+
+    def name(self):
+        return "root"
+
+    def fullName(self):
+        return "root"
+
+
+class BackdropNode(Node):
+
+    def getNodes(self):
+        x_min, y_min = self.xpos(), self.ypos()
+        x_max = x_min + self["bdwidth"].value()
+        y_max = y_min + self["bdheight"].value()
+        return [
+            node
+            for node in self._parent._nodes
+            if node is not self
+            and x_min <= node.xpos()
+            and y_min <= node.ypos()
+            and node.xpos() + node.screenWidth() <= x_max
+            and node.ypos() + node.screenHeight() <= y_max
+        ]
+
+
+_NODE_TYPES = {
+    "Group": Group,
+    "LiveGroup": LiveGroup,
+    "Gizmo": Gizmo,
+    "BackdropNode": BackdropNode,
+}
+
+_root = Root()
+_group_stack = [_root]
+_name_counters = defaultdict(int)
+
+
+class Undo:
+    """Undo stack, actions are not recorded."""
+    _disabled = 0
+
+    @staticmethod
+    def begin(name=None):
+        pass
+
+    @staticmethod
+    def end():
+        pass
+
+    @staticmethod
+    def name(name):
+        pass
+
+    @classmethod
+    def disable(cls):
+        cls._disabled += 1
+
+    @classmethod
+    def enable(cls):
+        cls._disabled = max(0, cls._disabled - 1)
+
+    @classmethod
+    def disabled(cls):
+        return cls._disabled > 0
+
+
+def root():
+    return _root
+
+
+def thisGroup():
+    return _group_stack[-1]
+
+
+def thisNode():
+    if _this_nodes:
+        return _this_nodes[-1]
+    return _root
+
+
+def thisKnob():
+    if _this_knobs:
+        return _this_knobs[-1]
+    return None
+
+
+def _unique_name(group, node_class):
+    names = {node.name() for node in group._nodes}
+    while True:
+        _name_counters[node_class] += 1
+        name = "{}{}".format(node_class, _name_counters[node_class])
+        if name not in names:
+            return name
+
+
+def createNode(node_class, args=None, inpanel=True, name=None):
+    """Create node in current group.
+
+    Args:
+        node_class (str): Node class.
+        args (Optional[str]): Knob name and value pairs separated by
+            whitespace, values can't contain whitespace.
+        inpanel (Optional[bool]): Ignored.
+        name (Optional[str]): Name of node, stand-in only. Name is not
+            checked for uniqueness, which is faster for big scenes.
+
+    Returns:
+        Node: Created node.
+    """
+    group = thisGroup()
+    if name is None:
+        name = _unique_name(group, node_class)
+    node_type = _NODE_TYPES.get(node_class, Node)
+    node = node_type(node_class, name, group)
+    group._nodes.append(node)
+    if args:
+        words = args.split()
+        for knob_name, value in zip(words[::2], words[1::2]):
+            knob = node.knob(knob_name)
+            if knob is None:
+                knob = String_Knob(knob_name)
+                node.addKnob(knob)
+            knob.setValue(value)
+    _run_node_callbacks("onCreate", node)
+    return node
+
+
+def delete(node):
+    """Erase node and its children."""
+    node._check_alive()
+    _run_node_callbacks("onDestroy", node)
+    if isinstance(node, Group):
+        for child in list(node._nodes):
+            delete(child)
+    for idx in range(len(node._inputs)):
+        node.setInput(idx, None)
+    for output in list(node._outputs):
+        for idx, input_node in enumerate(output._inputs):
+            if input_node is node:
+                output.setInput(idx, None)
+    node._parent._nodes.remove(node)
+    node._erased = True
+
+
+def allNodes(filter=None, group=None, recurseGroups=False):
+    """Nodes of group, optionally with nodes of nested groups."""
+    if group is None:
+        group = thisGroup()
+    output = []
+    _collect_nodes(group, filter, recurseGroups, output)
+    return output
+
+
+def _collect_nodes(group, node_class, recurse, output):
+    for node in group._nodes:
+        if node_class is None or node.Class() == node_class:
+            output.append(node)
+        if recurse and isinstance(node, Group):
+            _collect_nodes(node, node_class, recurse, output)
+
+
+def selectedNodes(filter=None):
+    return [
+        node
+        for node in allNodes(filter)
+        if node.isSelected()
+    ]
+
+
+def knob(name, value=None, type=False):
+    """Knob value by full name, e.g. 'Group1.Read1.file'.
+
+    Returns type id of the knob when `type` is True.
+    """
+    node_name, _, knob_name = name.rpartition(".")
+    node = toNode(node_name)
+    knob = None if node is None else node.knob(knob_name)
+    if knob is None:
+        raise ValueError("No such knob: {}".format(name))
+    if type:
+        return KNOB_TYPE_IDS.get(knob.Class(), 1)
+    if value is not None:
+        knob.setValue(value)
+    return knob.toScript()
+
+
+def toNode(name):
+    """Node by full name, e.g. 'Group1.Read1'."""
+    if name == "root":
+        return _root
+    node = _root
+    for part in name.split("."):
+        if not isinstance(node, Group):
+            return None
+        node = node.node(part)
+        if node is None:
+            return None
+    return node
+
+
+def filename(node, type=None):
+    """Value of file knob, padding token is kept unless REPLACE is used."""
+    knob = node.knob("file")
+    if knob is None:
+        return None
+    if type == REPLACE:
+        return knob.evaluate(_current_frame)
+    return knob.value() or None
+
+
+def frame(value=None):
+    global _current_frame
+    if value is not None:
+        _current_frame = int(value)
+    return _current_frame
+
+
+def scriptName():
+    name = _root["name"].value()
+    if not name:
+        raise RuntimeError("Script is not saved")
+    return name
+
+
+def scriptClear():
+    """Remove all nodes, callbacks are kept."""
+    global _root
+    _run_callbacks("onScriptClose")
+    _root = Root()
+    _group_stack[:] = [_root]
+    _name_counters.clear()
+    _this_nodes.clear()
+    _this_knobs.clear()
+
+
+def executeInMainThread(call, args=(), kwargs=None):
+    call(*args, **(kwargs or {}))
+
+
+def executeInMainThreadWithResult(call, args=(), kwargs=None):
+    return call(*args, **(kwargs or {}))
+
+
+def activeViewer():
+    return None
+
+
+def message(text):
+    pass
+
+
+def critical(text):
+    pass
+
+
+def _add_callback(name, call, args=(), kwargs=None, nodeClass="*"):
+    _callbacks[name].append((call, args, kwargs or {}, nodeClass))
+
+
+def _run_callbacks(name):
+    for call, args, kwargs, _ in list(_callbacks[name]):
+        call(*args, **kwargs)
+
+
+def _run_node_callbacks(name, node, knob=None):
+    callbacks = _callbacks.get(name)
+    if not callbacks:
+        return
+    _this_nodes.append(node)
+    _this_knobs.append(knob)
+    try:
+        for call, args, kwargs, node_class in list(callbacks):
+            if node_class in ("*", node.Class()):
+                call(*args, **kwargs)
+    finally:
+        _this_nodes.pop()
+        _this_knobs.pop()
+
+
+def knobChanged(node, knob):
+    """Run knob changed callbacks, stand-in only.
+
+    Nuke runs the callbacks for changes done in properties panel. Code
+    simulating user changes has to call this function explicitly.
+    """
+    _run_node_callbacks("knobChanged", node, knob)
+
+
+def removeAllCallbacks():
+    """Remove all registered callbacks, stand-in only."""
+    _callbacks.clear()
+
+
+def addOnCreate(call, args=(), kwargs=None, nodeClass="*"):
+    _add_callback("onCreate", call, args, kwargs, nodeClass)
+
+
+def addOnUserCreate(call, args=(), kwargs=None, nodeClass="*"):
+    _add_callback("onUserCreate", call, args, kwargs, nodeClass)
+
+
+def addOnDestroy(call, args=(), kwargs=None, nodeClass="*"):
+    _add_callback("onDestroy", call, args, kwargs, nodeClass)
+
+
+def addKnobChanged(call, args=(), kwargs=None, nodeClass="*"):
+    _add_callback("knobChanged", call, args, kwargs, nodeClass)
+
+
+def addOnScriptLoad(call, args=(), kwargs=None, nodeClass="Root"):
+    _add_callback("onScriptLoad", call, args, kwargs, nodeClass)
+
+
+def addOnScriptSave(call, args=(), kwargs=None, nodeClass="Root"):
+    _add_callback("onScriptSave", call, args, kwargs, nodeClass)
+
+
+def addOnScriptClose(call, args=(), kwargs=None, nodeClass="Root"):
+    _add_callback("onScriptClose", call, args, kwargs, nodeClass)
+
+
+def addFilenameFilter(call, args=(), kwargs=None, nodeClass="*"):
+    _add_callback("filenameFilter", call, args, kwargs, nodeClass)
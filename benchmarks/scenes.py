@@ -0,0 +1,347 @@
+"""Synthetic Nuke scenes for benchmarks.
+
+Scene is built in stand-in `nuke` module from chains of image nodes.
+Publish instances are groups with Write node inside, like instances of
+write creators. Containers are Read nodes with `avalon:` knobs and member
+nodes sharing the `containerId` knob. Part of the chains is wrapped in
+groups and nodes are covered by backdrops.
+
+Example:
+    >>> import benchmarks
+    >>> benchmarks.install_nuke_stub()
+    >>> from benchmarks.scenes import build_scene
+    >>> scene = build_scene(10000, instance_count=50, container_count=200)
+"""
+import random
+import itertools
+
+import nuke
+
+from ayon_nuke.node_data_codec import (
+    INSTANCE_DATA_KNOB,
+    encode_node_data,
+)
+
+CONTAINER_ID_KNOB = "containerId"
+CREATOR_IDENTIFIERS = (
+    "create_write_render",
+    "create_write_prerender",
+    "create_write_image",
+)
+PROJECT_ROOTS = tuple(
+    "/mnt/projects/project{:02d}".format(idx) for idx in range(8)
+)
+CHAIN_CLASSES = ("Grade", "ColorCorrect", "Transform", "Blur", "Merge2")
+CHAIN_LENGTH = 10
+NODE_SPACING_X = 120
+NODE_SPACING_Y = 60
+# Number of nodes covered by one backdrop
+NODES_PER_BACKDROP = 50
+
+# Classes of knobs in `addUserKnob` of `.nk` script
+_USER_KNOB_TYPES = {
+    "String_Knob": 1,
+    "Int_Knob": 3,
+    "Boolean_Knob": 6,
+    "Double_Knob": 7,
+    "Tab_Knob": 20,
+    "Text_Knob": 26,
+}
+_DEFAULT_KNOB_NAMES = {"name", "xpos", "ypos"}
+
+
+def _random_id(rng):
+    return "{:032x}".format(rng.getrandbits(128))
+
+
+def _add_string_knob(node, knob_name, value):
+    knob = nuke.String_Knob(knob_name)
+    knob.setValue(value)
+    node.addKnob(knob)
+    return knob
+
+
+def get_instance_data(idx, creator_identifier, folder_path):
+    """Instance data as stored by write creators.
+
+    Args:
+        idx (int): Index of instance.
+        creator_identifier (str): Identifier of creator.
+        folder_path (str): Folder path.
+
+    Returns:
+        dict: Instance data.
+    """
+    product_type = creator_identifier.rsplit("_", 1)[-1]
+    return {
+        "id": "ayon.create.instance",
+        "instance_id": "instance{:06d}".format(idx),
+        "productType": product_type,
+        "productName": "{}Main{}".format(product_type, idx),
+        "folderPath": folder_path,
+        "task": "compositing",
+        "variant": "Main{}".format(idx),
+        "active": True,
+        "creator_identifier": creator_identifier,
+        "creator_attributes": {
+            "render_target": "frames_farm",
+            "review": True,
+        },
+        "publish_attributes": {
+            "CollectFramesFixDef": {"frames_to_fix": ""},
+            "ValidateCorrectAssetContext": {"active": True},
+            "ExtractReviewIntermediates": {"active": True},
+        },
+    }
+
+
+class _SceneBuilder:
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.node_count = 0
+        self.column = 0
+        self.scene = {
+            "instance_nodes": [],
+            "container_nodes": [],
+            "container_ids": [],
+            "representation_ids": [],
+            "read_nodes": [],
+            "write_nodes": [],
+            "groups": [],
+            "backdrops": [],
+        }
+
+    def create_node(self, node_class, row=0, input_node=None):
+        node = nuke.createNode(
+            node_class,
+            name="{}{}".format(node_class, self.node_count + 1),
+        )
+        node.setXYpos(
+            self.column * NODE_SPACING_X, row * NODE_SPACING_Y
+        )
+        if input_node is not None:
+            node.setInput(0, input_node)
+        self.node_count += 1
+        return node
+
+    def shot_path(self, idx):
+        root = PROJECT_ROOTS[idx % len(PROJECT_ROOTS)]
+        return "{}/shots/sh{:04d}".format(root, idx * 10)
+
+    def add_instance(self, idx):
+        creator_identifier = CREATOR_IDENTIFIERS[
+            idx % len(CREATOR_IDENTIFIERS)]
+        folder_path = "/shots/sh{:04d}".format(idx * 10)
+        group = self.create_node("Group")
+        _add_string_knob(
+            group,
+            INSTANCE_DATA_KNOB,
+            encode_node_data(
+                get_instance_data(idx, creator_identifier, folder_path)
+            ),
+        )
+        with group:
+            input_node = self.create_node("Input")
+            write = self.create_node("Write", 1, input_node)
+            padding = ("%04d", "####", "$F4")[idx % 3]
+            write["file"].setValue(
+                "{}/work/renders/{}_v001.{}.exr".format(
+                    self.shot_path(idx), group.name(), padding
+                )
+            )
+            self.create_node("Output", 2, write)
+        self.scene["instance_nodes"].append(group)
+        self.scene["write_nodes"].append(write)
+        self.column += 1
+
+    def add_container(self, idx, member_count):
+        container_id = _random_id(self.rng)
+        representation_id = _random_id(self.rng)
+        read = self.create_node("Read")
+        read["file"].setValue(
+            "{}/publish/plate/v001/plate_v001.%04d.exr".format(
+                self.shot_path(idx)
+            )
+        )
+        for knob_name, value in (
+            ("avalon:schema", "ayon:container-3.0"),
+            ("avalon:id", "ayon.load.container"),
+            ("avalon:name", "plateMain"),
+            ("avalon:namespace", "sh{:04d}_plate_{}".format(idx * 10, idx)),
+            ("avalon:loader", "LoadClip"),
+            ("avalon:representation", representation_id),
+        ):
+            _add_string_knob(read, knob_name, value)
+        _add_string_knob(read, CONTAINER_ID_KNOB, container_id)
+
+        node = read
+        for row in range(member_count):
+            node = self.create_node("Reformat", row + 1, node)
+            _add_string_knob(node, CONTAINER_ID_KNOB, container_id)
+
+        self.scene["container_nodes"].append(read)
+        self.scene["container_ids"].append(container_id)
+        self.scene["representation_ids"].append(representation_id)
+        self.scene["read_nodes"].append(read)
+        self.column += 1
+
+    def add_chain(self, length):
+        read = self.create_node("Read")
+        read["file"].setValue(
+            "{}/plates/source_v001.%04d.exr".format(
+                self.shot_path(self.column)
+            )
+        )
+        self.scene["read_nodes"].append(read)
+        node = read
+        for row in range(1, length):
+            node_class = CHAIN_CLASSES[row % len(CHAIN_CLASSES)]
+            new_node = self.create_node(node_class, row, node)
+            if node_class == "Merge2":
+                new_node.setInput(1, read)
+            node = new_node
+        self.column += 1
+
+    def add_group_chain(self, length):
+        group = self.create_node("Group")
+        with group:
+            self.add_chain(length - 1)
+        self.scene["groups"].append(group)
+
+    def add_backdrops(self):
+        columns = max(1, NODES_PER_BACKDROP // CHAIN_LENGTH)
+        for column in range(0, self.column, columns):
+            backdrop = nuke.createNode(
+                "BackdropNode",
+                name="BackdropNode{}".format(len(self.scene["backdrops"])),
+            )
+            backdrop.setXYpos(
+                column * NODE_SPACING_X - 20, -40
+            )
+            backdrop["bdwidth"].setValue(columns * NODE_SPACING_X)
+            backdrop["bdheight"].setValue(
+                (CHAIN_LENGTH + 1) * NODE_SPACING_Y
+            )
+            self.scene["backdrops"].append(backdrop)
+            self.node_count += 1
+
+
+def build_scene(
+    node_count,
+    instance_count=50,
+    container_count=200,
+    members_per_container=3,
+    group_ratio=0.1,
+    seed=0,
+):
+    """Clear the script and fill it with synthetic nodes.
+
+    Args:
+        node_count (int): Approximate number of nodes including nodes
+            inside groups.
+        instance_count (int): Number of publish instances.
+        container_count (int): Number of loaded containers.
+        members_per_container (int): Number of member nodes of each
+            container.
+        group_ratio (float): Ratio of node chains wrapped in a group.
+        seed (int): Seed of random generator of ids.
+
+    Returns:
+        dict[str, Any]: Created nodes by purpose and ids of containers.
+    """
+    nuke.scriptClear()
+    nuke.root()["name"].setValue("/mnt/projects/project00/work/sh0010.nk")
+    builder = _SceneBuilder(seed)
+    for idx in range(instance_count):
+        builder.add_instance(idx)
+
+    for idx in range(container_count):
+        builder.add_container(idx, members_per_container)
+
+    # Reserve nodes for backdrops
+    filler_count = node_count - node_count // (NODES_PER_BACKDROP + 1)
+    while builder.node_count < filler_count:
+        length = min(CHAIN_LENGTH, filler_count - builder.node_count)
+        if length > 2 and builder.rng.random() < group_ratio:
+            builder.add_group_chain(length)
+        else:
+            builder.add_chain(length)
+
+    builder.add_backdrops()
+    scene = builder.scene
+    scene["node_count"] = builder.node_count
+    return scene
+
+
+def _format_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    value = str(value)
+    if value and not any(char in value for char in ' \t\n"\\{}[]$;'):
+        return value
+    escaped = value
+    for char in ("\\", '"', "{", "}", "[", "]", "$"):
+        escaped = escaped.replace(char, "\\" + char)
+    return '"{}"'.format(escaped.replace("\n", "\\n"))
+
+
+def _iter_node_lines(node, indent):
+    prefix = " " * indent
+    yield "{}{} {{\n".format(prefix, node.Class())
+    if node.inputs() != 1:
+        yield "{} inputs {}\n".format(prefix, node.inputs())
+    for knob_name, knob in node.knobs().items():
+        if knob_name in _DEFAULT_KNOB_NAMES:
+            continue
+        value = knob.value()
+        is_user_knob = (
+            knob_name.startswith(("avalon:", "ak:"))
+            or knob_name in (INSTANCE_DATA_KNOB, CONTAINER_ID_KNOB)
+        )
+        if is_user_knob:
+            yield "{} addUserKnob {{{} {}}}\n".format(
+                prefix, _USER_KNOB_TYPES.get(knob.Class(), 1), knob_name
+            )
+        if value in ("", False, 0, None):
+            continue
+        yield "{} {} {}\n".format(prefix, knob_name, _format_value(value))
+    yield "{} name {}\n".format(prefix, node.name())
+    yield "{} xpos {}\n".format(prefix, node.xpos())
+    yield "{} ypos {}\n".format(prefix, node.ypos())
+    yield "{}}}\n".format(prefix)
+
+
+def _iter_group_lines(group, indent, counter):
+    prefix = " " * indent
+    variables = {}
+    for node in group.nodes():
+        for idx in reversed(range(node.inputs())):
+            variable = variables.get(node.input(idx))
+            if variable is None:
+                yield "{}push 0\n".format(prefix)
+            else:
+                yield "{}push ${}\n".format(prefix, variable)
+
+        yield from _iter_node_lines(node, indent)
+        if node.Class() == "Group":
+            yield from _iter_group_lines(node, indent + 1, counter)
+            yield "{}end_group\n".format(prefix)
+        variable = "N{:x}".format(next(counter))
+        variables[node] = variable
+        yield "{}set {} [stack 0]\n".format(prefix, variable)
+
+
+def iter_script_lines():
+    """Lines of `.nk` script with all nodes of current script.
+
+    Inputs are written with `push` and `set` commands the way Nuke does,
+    each node is stored in a stack variable after it is written.
+
+    Yields:
+        str: Script lines.
+    """
+    yield "Root {\n"
+    yield " inputs 0\n"
+    yield " name {}\n".format(_format_value(nuke.root()["name"].value()))
+    yield "}\n"
+    yield from _iter_group_lines(nuke.root(), 0, itertools.count())
@@ -0,0 +1,71 @@
+"""Nuke startup script of the addon run in a new interpreter.
+
+`ayon_nuke/startup/init.py` is executed the way Nuke runs it on start,
+with stand-in modules of `nuke` and of packages which are not installed.
+Render-only mode is forced with `AYON_NUKE_RENDER_ONLY` environment
+variable.
+"""
+import os
+import sys
+import json
+import subprocess
+
+from . import REPO_ROOT, CLIENT_DIR
+
+STARTUP_SCRIPT = os.path.join(CLIENT_DIR, "ayon_nuke", "startup", "init.py")
+RENDER_ONLY_ENV_KEY = "AYON_NUKE_RENDER_ONLY"
+
+_CODE = """
+import sys
+import json
+import time
+import runpy
+
+sys.path.insert(0, {repo_root!r})
+import benchmarks
+
+benchmarks.install_nuke_stub()
+benchmarks.install_host_stubs()
+modules = set(sys.modules)
+start = time.perf_counter()
+runpy.run_path({script!r})
+duration = time.perf_counter() - start
+print(json.dumps({{
+    "duration": duration,
+    "modules": sorted(set(sys.modules) - modules),
+}}))
+"""
+
+
+def run_startup(render_only):
+    """Run startup script in new interpreter.
+
+    Args:
+        render_only (bool): Force render-only mode.
+
+    Returns:
+        dict[str, Any]: Duration of the startup script in seconds and
+            names of modules imported by it.
+
+    Raises:
+        RuntimeError: Startup script failed to install the integration.
+    """
+    env = dict(os.environ)
+    env[RENDER_ONLY_ENV_KEY] = "1" if render_only else "0"
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _CODE.format(repo_root=REPO_ROOT, script=STARTUP_SCRIPT),
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = process.stdout.strip().splitlines()
+    if len(lines) != 1:
+        raise RuntimeError(
+            "Startup script failed:\n{}".format(process.stdout)
+        )
+    return json.loads(lines[0])
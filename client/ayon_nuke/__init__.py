@@ -1,8 +1,32 @@
+"""Nuke addon package.
+
+Addon class is imported on first access so standalone modules, e.g.
+`ayon_nuke.nk_reader`, can be imported without ayon-core.
+"""
+import importlib
+
 from .version import __version__
-from .addon import (
-    NUKE_ROOT_DIR,
-    NukeAddon,
-)
+
+_ATTRIBUTE_MODULES = {
+    "NUKE_ROOT_DIR": "addon",
+    "NukeAddon": "addon",
+}
+
+
+def __getattr__(name):
+    module_name = _ATTRIBUTE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = (
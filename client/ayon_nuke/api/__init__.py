@@ -1,60 +1,72 @@
-from .workio import (
-    file_extensions,
-    has_unsaved_changes,
-    save_file,
-    open_file,
-    current_file,
-    work_root,
-)
-from .command import (
-    viewer_update_and_undo_stop
-)
-from .plugin import (
-    NukeCreator,
-    NukeWriteCreator,
-    NukeCreatorError,
-    get_instance_group_node_children,
-    get_colorspace_from_node,
-    get_publish_config,
-)
-from .pipeline import (
-    NukeHost,
+"""Public api of Nuke integration.
 
-    ls,
+Attributes are imported from submodules on first access so importing the
+package does not import Qt, ayon-api or the scene related modules until
+they are needed.
+"""
+import importlib
 
-    list_instances,
-    remove_instance,
-    select_instance,
+_ATTRIBUTE_MODULES = {
+    "file_extensions": "workio",
+    "has_unsaved_changes": "workio",
+    "save_file": "workio",
+    "open_file": "workio",
+    "current_file": "workio",
+    "work_root": "workio",
+    "viewer_update_and_undo_stop": "command",
+    "NukeCreator": "plugin",
+    "NukeWriteCreator": "plugin",
+    "NukeCreatorError": "plugin",
+    "get_instance_group_node_children": "plugin",
+    "get_colorspace_from_node": "plugin",
+    "get_publish_config": "plugin",
+    "NukeHost": "pipeline",
+    "ls": "pipeline",
+    "list_instances": "pipeline",
+    "remove_instance": "pipeline",
+    "select_instance": "pipeline",
+    "containerise": "pipeline",
+    "parse_container": "pipeline",
+    "update_container": "pipeline",
+    "INSTANCE_DATA_KNOB": "lib",
+    "ROOT_DATA_KNOB": "lib",
+    "maintained_selection": "lib",
+    "reset_selection": "lib",
+    "select_nodes": "lib",
+    "get_view_process_node": "lib",
+    "duplicate_node": "lib",
+    "convert_knob_value_to_correct_type": "lib",
+    "get_node_data": "node_data",
+    "get_node_data_view": "node_data",
+    "set_node_data": "node_data",
+    "update_node_data": "node_data",
+    "node_data_transaction": "node_data",
+    "create_write_node": "lib",
+    "link_knobs": "lib",
+    "colorspace_exists_on_node": "colorspace",
+    "get_colorspace_list": "colorspace",
+    "get_project_settings_view": "settings",
+    "invalidate_project_settings": "settings",
+    "SelectInvalidAction": "actions",
+    "SelectInstanceNodeAction": "actions",
+}
 
-    containerise,
-    parse_container,
-    update_container,
 
-)
-from .lib import (
-    INSTANCE_DATA_KNOB,
-    ROOT_DATA_KNOB,
-    maintained_selection,
-    reset_selection,
-    select_nodes,
-    get_view_process_node,
-    duplicate_node,
-    convert_knob_value_to_correct_type,
-    get_node_data,
-    set_node_data,
-    update_node_data,
-    create_write_node,
-    link_knobs
-)
-from .colorspace import (
-    colorspace_exists_on_node,
-    get_colorspace_list
-)
+def __getattr__(name):
+    module_name = _ATTRIBUTE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from .actions import (
-    SelectInvalidAction,
-    SelectInstanceNodeAction
-)
 
 __all__ = (
     "file_extensions",
@@ -93,14 +105,19 @@ __all__ = (
     "duplicate_node",
     "convert_knob_value_to_correct_type",
     "get_node_data",
+    "get_node_data_view",
     "set_node_data",
     "update_node_data",
+    "node_data_transaction",
     "create_write_node",
     "link_knobs",
 
     "colorspace_exists_on_node",
     "get_colorspace_list",
 
+    "get_project_settings_view",
+    "invalidate_project_settings",
+
     "SelectInvalidAction",
     "SelectInstanceNodeAction"
 )
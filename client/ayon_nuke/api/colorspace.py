@@ -2,13 +2,25 @@
 Nuke Colorspace related methods
 """
 
+import os
 import re
+import json
+import time
+import hashlib
+import tempfile
+from collections import OrderedDict
 
 from ayon_core.lib import (
     Logger,
     StringTemplate,
 )
 
+# Function 'get_launcher_local_dir' is not available in older ayon-core
+try:
+    from ayon_core.lib import get_launcher_local_dir
+except ImportError:
+    get_launcher_local_dir = None
+
 from .constants import COLOR_VALUE_SEPARATOR
 
 import nuke
@@ -16,14 +28,265 @@ import nuke
 log = Logger.get_logger(__name__)
 
 
-_DISPLAY_AND_VIEW_COLORSPACES_CACHE = {}
-_COLORSPACES_CACHE = {}
+class ColorspaceListCache:
+    """Colorspace lists by OCIO config.
+
+    Lists returned by `nuke.getColorspaceList` depend on the OCIO config
+    of the script, so they are cached by config path and hash of its
+    content. Lists are stored on disk to be reused by next sessions and
+    only `max_configs` configs are kept in memory.
+
+    Lists which depend on a node, e.g. Read node colorspaces containing
+    "default (...)" item based on the file, are kept only in memory of
+    the session.
+    """
+    max_configs = 8
+    max_session_lists = 1024
+    # config file is checked for changes at most once per interval
+    config_check_interval = 10.0
+    _lists_by_config = OrderedDict()
+    _session_lists = OrderedDict()
+    # root knob values -> (config key, time of check)
+    _config_keys = {}
+    # config path -> (mtime, size, content hash)
+    _hashes_by_path = {}
+    _cache_dir = None
+
+    @classmethod
+    def get_config_key(cls, root_node):
+        """Identifier of OCIO config used by the script.
+
+        Changes when the config is changed on root node or when content
+        of the config file changes.
+
+        Args:
+            root_node (nuke.Node): Root node.
+
+        Returns:
+            str: Config identifier.
+        """
+        knobs = root_node.knobs()
+        parts = [nuke.NUKE_VERSION_STRING]
+        for knob_name in ("colorManagement", "OCIO_config"):
+            knob = knobs.get(knob_name)
+            parts.append(knob.value() if knob is not None else "")
+
+        config_path = os.environ.get("OCIO") or ""
+        config_path_knob = knobs.get("customOCIOConfigPath")
+        if parts[-1] == "custom" and config_path_knob is not None:
+            config_path = config_path_knob.value()
+        if config_path:
+            parts.append(config_path.replace("\\", "/"))
+
+        knob_values = tuple(parts)
+        now = time.monotonic()
+        cached = cls._config_keys.get(knob_values)
+        if cached and now - cached[1] < cls.config_check_interval:
+            return cached[0]
+
+        if config_path:
+            parts.append(cls._get_file_hash(config_path))
+        config_key = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+        cls._config_keys[knob_values] = (config_key, now)
+        return config_key
+
+    @classmethod
+    def _get_file_hash(cls, filepath):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return ""
+        cached = cls._hashes_by_path.get(filepath)
+        if cached and cached[:2] == (stat.st_mtime, stat.st_size):
+            return cached[2]
+        with open(filepath, "rb") as stream:
+            file_hash = hashlib.sha1(stream.read()).hexdigest()
+        cls._hashes_by_path[filepath] = (
+            stat.st_mtime, stat.st_size, file_hash
+        )
+        return file_hash
+
+    @classmethod
+    def _get_cache_dir(cls):
+        if cls._cache_dir is None:
+            if get_launcher_local_dir is not None:
+                cls._cache_dir = get_launcher_local_dir("nuke_colorspaces")
+            else:
+                cls._cache_dir = os.path.join(
+                    tempfile.gettempdir(), "ayon_nuke_colorspaces"
+                )
+        return cls._cache_dir
+
+    @classmethod
+    def _get_cache_path(cls, config_key):
+        return os.path.join(cls._get_cache_dir(), f"{config_key}.json")
+
+    @classmethod
+    def _get_config_lists(cls, config_key):
+        lists = cls._lists_by_config.get(config_key)
+        if lists is not None:
+            cls._lists_by_config.move_to_end(config_key)
+            return lists
+
+        lists = {}
+        cache_path = cls._get_cache_path(config_key)
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r") as stream:
+                    lists = json.load(stream)
+            except (OSError, ValueError):
+                log.debug(
+                    f"Failed to read colorspaces cache '{cache_path}'",
+                    exc_info=True
+                )
+
+        cls._lists_by_config[config_key] = lists
+        while len(cls._lists_by_config) > cls.max_configs:
+            cls._lists_by_config.popitem(last=False)
+        return lists
+
+    @classmethod
+    def _save_config_lists(cls, config_key, lists):
+        cache_path = cls._get_cache_path(config_key)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                json.dump(lists, stream)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            log.debug(
+                f"Failed to write colorspaces cache '{cache_path}'",
+                exc_info=True
+            )
+
+    @classmethod
+    def get_list(cls, config_key, list_key, get_list_func):
+        """Get cached list or create it with the passed function.
+
+        Args:
+            config_key (str): Config identifier from `get_config_key`.
+            list_key (str): Identifier of list in the config.
+            get_list_func (Callable[[], list[str]]): Function creating
+                the list if it is not cached.
+
+        Returns:
+            list[str]: Cached list.
+        """
+        lists = cls._get_config_lists(config_key)
+        result = lists.get(list_key)
+        if result is None:
+            result = list(get_list_func())
+            lists[list_key] = result
+            cls._save_config_lists(config_key, lists)
+        return result
+
+    @classmethod
+    def get_session_list(cls, config_key, list_key, get_list_func):
+        """Get list cached only in memory of the session.
+
+        Args:
+            config_key (str): Config identifier from `get_config_key`.
+            list_key (str): Identifier of list in the config.
+            get_list_func (Callable[[], list[str]]): Function creating
+                the list if it is not cached.
+
+        Returns:
+            list[str]: Cached list.
+        """
+        key = (config_key, list_key)
+        result = cls._session_lists.get(key)
+        if result is not None:
+            cls._session_lists.move_to_end(key)
+            return result
+
+        result = list(get_list_func())
+        cls._session_lists[key] = result
+        while len(cls._session_lists) > cls.max_session_lists:
+            cls._session_lists.popitem(last=False)
+        return result
+
+    @classmethod
+    def clear(cls):
+        """Clear in-memory layer of the cache."""
+        cls._lists_by_config.clear()
+        cls._session_lists.clear()
+        cls._config_keys.clear()
+        cls._hashes_by_path.clear()
+
+
+_INPUT_COLORSPACE_RULES_CACHE = {}
+
+
+class InputColorspaceRules:
+    """Compiled `regex_inputs` rules from imageio settings.
+
+    Last rule matching file path wins, same as when all rules are tested
+    in order. Results are cached by file path.
+
+    Args:
+        rules (list[dict[str, str]]): Rules with "regex" and "colorspace".
+    """
+    max_cache_size = 4096
+
+    def __init__(self, rules):
+        # reversed so the first match is the last matching rule
+        self._rules = tuple(
+            (re.compile(rule["regex"]), str(rule["colorspace"]))
+            for rule in reversed(rules)
+        )
+        self._results_by_path = {}
+
+    def get_colorspace(self, filepath):
+        """Get colorspace of file.
+
+        Args:
+            filepath (str): File path.
+
+        Returns:
+            Union[str, None]: Colorspace of last matching rule.
+        """
+        if filepath in self._results_by_path:
+            return self._results_by_path[filepath]
+
+        colorspace = None
+        for regex, rule_colorspace in self._rules:
+            if regex.search(filepath):
+                colorspace = rule_colorspace
+                break
+
+        if len(self._results_by_path) >= self.max_cache_size:
+            self._results_by_path.clear()
+        self._results_by_path[filepath] = colorspace
+        return colorspace
+
+
+def get_input_colorspace_rules(rules):
+    """Get compiled rules for `regex_inputs` settings.
+
+    Compiled rules are reused for equal settings.
+
+    Args:
+        rules (list[dict[str, str]]): Rules with "regex" and "colorspace".
+
+    Returns:
+        InputColorspaceRules: Compiled rules.
+    """
+    key = tuple(
+        (rule["regex"], str(rule["colorspace"]))
+        for rule in rules
+    )
+    compiled_rules = _INPUT_COLORSPACE_RULES_CACHE.get(key)
+    if compiled_rules is None:
+        compiled_rules = InputColorspaceRules(rules)
+        _INPUT_COLORSPACE_RULES_CACHE[key] = compiled_rules
+    return compiled_rules
 
 
 def get_display_and_view_colorspaces(root_node):
     """Get all possible display and view colorspaces
 
-    This is stored in class variable to avoid multiple calls.
+    Lists are cached by OCIO config of the script.
 
     Args:
         root_node (nuke.Node): root node
@@ -31,16 +294,15 @@ def get_display_and_view_colorspaces(root_node):
     Returns:
         list: all possible display and view colorspaces
     """
-    script_name = nuke.root().name()
-    if _DISPLAY_AND_VIEW_COLORSPACES_CACHE.get(script_name) is None:
-        # getting it from `monitorOutLUT` because that is the only shared
-        # display and view knob for 13 > nuke version and returns
-        # correct list of display and view colorspace profiles.
-        colorspace_knob = root_node["monitorOutLUT"]
-        colorspaces = nuke.getColorspaceList(colorspace_knob)
-        _DISPLAY_AND_VIEW_COLORSPACES_CACHE[script_name] = colorspaces
-
-    return _DISPLAY_AND_VIEW_COLORSPACES_CACHE[script_name]
+    # getting it from `monitorOutLUT` because that is the only shared
+    # display and view knob for 13 > nuke version and returns
+    # correct list of display and view colorspace profiles.
+    colorspace_knob = root_node["monitorOutLUT"]
+    return ColorspaceListCache.get_list(
+        ColorspaceListCache.get_config_key(nuke.root()),
+        "display_and_view",
+        lambda: nuke.getColorspaceList(colorspace_knob)
+    )
 
 
 def get_colorspace_list(colorspace_knob, node=None, consider_aliases=True):
@@ -55,32 +317,40 @@ def get_colorspace_list(colorspace_knob, node=None, consider_aliases=True):
     Returns:
         list: list of strings names of profiles
     """
-    results = []
-
     # making sure any node is provided
     node = node or nuke.root()
-    # unique script based identifier
-    script_name = nuke.root().name()
-    node_name = node.fullName()
-    identifier_key = f"{script_name}_{node_name}"
-
-    if _COLORSPACES_CACHE.get(identifier_key) is None:
+    config_key = ColorspaceListCache.get_config_key(nuke.root())
+    # unique script and node based identifier, list of node may contain
+    #   items based on node's state (e.g. "default (...)" of Read node)
+    list_key = "{}_{}.{}".format(
+        nuke.root().name(), node.fullName(), colorspace_knob.name()
+    )
+    colorspaces = ColorspaceListCache.get_session_list(
+        config_key,
+        list_key,
+        lambda: nuke.getColorspaceList(colorspace_knob)
+    )
+
+    def _split_aliases():
         # This pattern is to match with roles which uses an indentation and
         # parentheses with original colorspace. The value returned from the
         # colorspace is the string before the indentation, so we'll need to
         # convert the values to match with value returned from the knob,
         # ei. knob.value().
         pattern = r"[\t,]+"
-        for colorspace in nuke.getColorspaceList(colorspace_knob):
+        results = []
+        for colorspace in colorspaces:
             colorspace_and_aliases = re.split(pattern, colorspace)
             if consider_aliases:
                 results.extend(colorspace_and_aliases)
             else:
                 results.append(colorspace_and_aliases[0])
+        return results
 
-        _COLORSPACES_CACHE[identifier_key] = results
-
-    return _COLORSPACES_CACHE[identifier_key]
+    suffix = "aliases" if consider_aliases else "names"
+    return ColorspaceListCache.get_session_list(
+        config_key, f"{list_key}:{suffix}", _split_aliases
+    )
 
 
 def colorspace_exists_on_node(node, colorspace_name):
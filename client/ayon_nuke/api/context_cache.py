@@ -0,0 +1,122 @@
+"""Entities and template data of contexts cached for the process."""
+import copy
+import time
+
+import ayon_api
+
+from ayon_core.pipeline import Anatomy
+from ayon_core.pipeline.template_data import get_template_data
+
+
+class ContextEntityCache:
+    """Entities and template data of a context cached for the process.
+
+    Values are cached by project name, folder path and task name so
+    multiple `WorkfileSettings` objects created for the same context do
+    not query the server again. Cached values expire after `timeout`
+    seconds and all of them are dropped on context change.
+
+    `Anatomy` objects are cached by project name until the cache is
+    cleared, so path building helpers called for each write node share
+    one `Anatomy`.
+    """
+    timeout = 60
+    _items = {}
+    _anatomies = {}
+
+    @classmethod
+    def clear(cls):
+        cls._items.clear()
+        cls._anatomies.clear()
+
+    @classmethod
+    def get_anatomy(cls, project_name, project_entity=None):
+        """Anatomy of project.
+
+        Args:
+            project_name (str): Project name.
+            project_entity (Optional[dict]): Project entity used when
+                anatomy is not cached yet.
+
+        Returns:
+            Anatomy: Project anatomy.
+        """
+        anatomy = cls._anatomies.get(project_name)
+        if anatomy is None:
+            anatomy = Anatomy(project_name, project_entity=project_entity)
+            cls._anatomies[project_name] = anatomy
+        return anatomy
+
+    @classmethod
+    def _get_item(cls, project_name, folder_path, task_name):
+        key = (project_name, folder_path, task_name)
+        item = cls._items.get(key)
+        now = time.time()
+        if item is None or now - item["timestamp"] > cls.timeout:
+            project_entity = ayon_api.get_project(project_name)
+            folder_entity = None
+            if folder_path:
+                folder_entity = ayon_api.get_folder_by_path(
+                    project_name, folder_path
+                )
+            task_entity = None
+            if folder_entity and task_name:
+                task_entity = ayon_api.get_task_by_name(
+                    project_name, folder_entity["id"], task_name
+                )
+            item = {
+                "timestamp": now,
+                "project_entity": project_entity,
+                "folder_entity": folder_entity,
+                "task_entity": task_entity,
+                "template_data": {},
+            }
+            cls._items[key] = item
+        return item
+
+    @classmethod
+    def get_entities(cls, project_name, folder_path, task_name):
+        """Project, folder and task entities of context.
+
+        Args:
+            project_name (str): Project name.
+            folder_path (Optional[str]): Folder path.
+            task_name (Optional[str]): Task name.
+
+        Returns:
+            tuple[dict, Optional[dict], Optional[dict]]: Project, folder
+                and task entity.
+        """
+        item = cls._get_item(project_name, folder_path, task_name)
+        return (
+            item["project_entity"],
+            item["folder_entity"],
+            item["task_entity"],
+        )
+
+    @classmethod
+    def get_template_data(
+        cls, project_name, folder_path, task_name, host_name
+    ):
+        """Template data of context.
+
+        Args:
+            project_name (str): Project name.
+            folder_path (Optional[str]): Folder path.
+            task_name (Optional[str]): Task name.
+            host_name (str): Host name.
+
+        Returns:
+            dict[str, Any]: Copy of template data.
+        """
+        item = cls._get_item(project_name, folder_path, task_name)
+        template_data = item["template_data"].get(host_name)
+        if template_data is None:
+            template_data = get_template_data(
+                item["project_entity"],
+                item["folder_entity"],
+                item["task_entity"],
+                host_name,
+            )
+            item["template_data"][host_name] = template_data
+        return copy.deepcopy(template_data)
@@ -0,0 +1,145 @@
+"""Directory listings shared by publish plugins.
+
+Collectors and extractors check the same output directories for rendered
+files. Each directory is scanned once with `os.scandir` and the entries
+are stored in the publish context. Size and modification time are read
+only when requested, so listing file names costs one scan of the
+directory.
+
+Snapshot of a directory has to be invalidated when files are written into
+it during publishing, e.g. after local render.
+"""
+import os
+
+CONTEXT_DATA_KEY = "nukeDirectorySnapshot"
+
+
+class FileEntry:
+    """File in directory snapshot.
+
+    Stat of the file is done on first access to `size` or `mtime`.
+
+    Args:
+        dir_entry (os.DirEntry): Entry from `os.scandir`.
+    """
+
+    def __init__(self, dir_entry):
+        self.name = dir_entry.name
+        self._dir_entry = dir_entry
+        self._stat = None
+
+    def _get_stat(self):
+        if self._stat is None:
+            self._stat = self._dir_entry.stat()
+        return self._stat
+
+    @property
+    def size(self):
+        return self._get_stat().st_size
+
+    @property
+    def mtime(self):
+        return self._get_stat().st_mtime
+
+
+class DirectorySnapshot:
+    """Files in directories scanned once and cached."""
+
+    def __init__(self):
+        self._entries_by_dir = {}
+
+    @staticmethod
+    def _normalize(dirpath):
+        return os.path.normcase(os.path.normpath(dirpath))
+
+    def get_entries(self, dirpath):
+        """Files in directory by file name.
+
+        Args:
+            dirpath (str): Directory path.
+
+        Returns:
+            dict[str, FileEntry]: File entries, empty if directory does
+                not exist.
+        """
+        key = self._normalize(dirpath)
+        entries = self._entries_by_dir.get(key)
+        if entries is None:
+            entries = {}
+            try:
+                with os.scandir(dirpath) as scan:
+                    for entry in scan:
+                        try:
+                            # file type is known from scan on most
+                            #   platforms, no stat is needed
+                            if not entry.is_file():
+                                continue
+                        except OSError:
+                            continue
+                        entries[entry.name] = FileEntry(entry)
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+            self._entries_by_dir[key] = entries
+        return entries
+
+    def list_files(self, dirpath):
+        """Names of files in directory.
+
+        Args:
+            dirpath (str): Directory path.
+
+        Returns:
+            list[str]: File names.
+        """
+        return list(self.get_entries(dirpath))
+
+    def get_entry(self, filepath):
+        """Entry of file.
+
+        Args:
+            filepath (str): File path.
+
+        Returns:
+            Optional[FileEntry]: Entry or None if file does not exist.
+        """
+        dirpath, filename = os.path.split(filepath)
+        return self.get_entries(dirpath).get(filename)
+
+    def exists(self, filepath):
+        """File exists.
+
+        Args:
+            filepath (str): File path.
+
+        Returns:
+            bool: File exists.
+        """
+        return self.get_entry(filepath) is not None
+
+    def invalidate(self, dirpath=None):
+        """Drop cached listing.
+
+        Args:
+            dirpath (Optional[str]): Directory to invalidate. All cached
+                directories are dropped if not passed.
+        """
+        if dirpath is None:
+            self._entries_by_dir.clear()
+        else:
+            self._entries_by_dir.pop(self._normalize(dirpath), None)
+
+
+def get_directory_snapshot(context):
+    """Directory snapshot of publish context.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        DirectorySnapshot: Snapshot shared by publish plugins.
+    """
+    snapshot = context.data.get(CONTEXT_DATA_KEY)
+    if snapshot is None:
+        snapshot = DirectorySnapshot()
+        context.data[CONTEXT_DATA_KEY] = snapshot
+    return snapshot
@@ -0,0 +1,103 @@
+"""Directory mapping of file paths read by Nuke.
+
+Module is imported by render-only install (see `render_only`), so it does
+not import `lib` or anything using Qt.
+"""
+import os
+import platform
+
+from ayon_core.host import HostDirmap
+
+from .dirmap_resolver import DirmapResolver
+from .settings import get_project_settings_copy
+
+
+class NukeDirmap(HostDirmap):
+    def __init__(self, file_name, *args, **kwargs):
+        """
+        Args:
+            file_name (str): full path of referenced file from workfiles
+            *args (tuple): Positional arguments for 'HostDirmap' class
+            **kwargs (dict): Keyword arguments for 'HostDirmap' class
+        """
+
+        self.file_name = file_name
+        super(NukeDirmap, self).__init__(*args, **kwargs)
+
+    def on_enable_dirmap(self):
+        pass
+
+    def dirmap_routine(self, source_path, destination_path):
+        source_path = source_path.lower().replace(os.sep, '/')
+        destination_path = destination_path.lower().replace(os.sep, '/')
+        if platform.system().lower() == "windows":
+            self.file_name = self.file_name.lower().replace(
+                source_path, destination_path)
+        else:
+            self.file_name = self.file_name.replace(
+                source_path, destination_path)
+
+
+class DirmapCache:
+    """Caching class to get settings and sitesync easily and only once."""
+    _project_name = None
+    _project_settings = None
+    _sitesync_addon_discovered = False
+    _sitesync_addon = None
+    _mapping = None
+    _resolver = None
+
+    @classmethod
+    def project_name(cls):
+        if cls._project_name is None:
+            cls._project_name = os.getenv("AYON_PROJECT_NAME")
+        return cls._project_name
+
+    @classmethod
+    def project_settings(cls):
+        if cls._project_settings is None:
+            cls._project_settings = get_project_settings_copy(
+                cls.project_name()
+            )
+        return cls._project_settings
+
+    @classmethod
+    def sitesync_addon(cls):
+        if not cls._sitesync_addon_discovered:
+            cls._sitesync_addon_discovered = True
+            from ayon_core.addon import AddonsManager
+
+            cls._sitesync_addon = AddonsManager().get("sitesync")
+        return cls._sitesync_addon
+
+    @classmethod
+    def mapping(cls):
+        return cls._mapping
+
+    @classmethod
+    def set_mapping(cls, mapping):
+        cls._mapping = mapping
+        cls._resolver = None
+
+    @classmethod
+    def resolver(cls):
+        if cls._resolver is None:
+            if not cls._mapping:
+                dirmap_processor = NukeDirmap(
+                    "",
+                    "nuke",
+                    cls.project_name(),
+                    cls.project_settings(),
+                    cls.sitesync_addon(),
+                )
+                cls._mapping = dirmap_processor.get_mappings()
+            cls._resolver = DirmapResolver(cls._mapping or {})
+        return cls._resolver
+
+
+def dirmap_file_name_filter(file_name):
+    """Nuke callback function with single full path argument.
+
+        Checks project settings for potential mapping from source to dest.
+    """
+    return DirmapCache.resolver().resolve(file_name)
@@ -0,0 +1,122 @@
+"""Resolve paths with dirmap mappings."""
+import os
+import time
+import logging
+import platform
+from collections import OrderedDict
+
+log = logging.getLogger(__name__)
+
+
+class DirmapResolver:
+    """Compiled dirmap mappings.
+
+    Source paths are stored in a trie of path segments so the longest
+    matching source path is found with a single walk over the path.
+    Matching is case insensitive on Windows.
+
+    Resolved paths are memoized in a bounded LRU cache. Existence of
+    mapped path is checked again after `exists_timeout` seconds, or never
+    when set to None.
+
+    Args:
+        mapping (dict[str, list[str]]): Mapping with "source_path" and
+            "destination_path" lists, as returned by `HostDirmap`.
+        case_sensitive (Optional[bool]): Compare paths case sensitive.
+            Default is based on current platform.
+    """
+    max_cache_size = 4096
+    exists_timeout = 10.0
+
+    def __init__(self, mapping, case_sensitive=None):
+        if case_sensitive is None:
+            case_sensitive = platform.system().lower() != "windows"
+        self._case_sensitive = case_sensitive
+        # Destination is stored under 'None' key of trie node
+        self._trie = {}
+        self._cache = OrderedDict()
+
+        source_paths = mapping.get("source_path") or []
+        destination_paths = mapping.get("destination_path") or []
+        if len(source_paths) != len(destination_paths):
+            log.error(
+                "Dirmap has different number of source and"
+                " destination paths."
+            )
+        for source_path, destination_path in zip(
+            source_paths, destination_paths
+        ):
+            self._add_mapping(source_path, destination_path)
+
+    def _split_path(self, path):
+        return path.replace("\\", "/").rstrip("/").split("/")
+
+    def _add_mapping(self, source_path, destination_path):
+        node = self._trie
+        for segment in self._split_path(source_path):
+            if not self._case_sensitive:
+                segment = segment.lower()
+            node = node.setdefault(segment, {})
+        node[None] = destination_path.replace("\\", "/").rstrip("/")
+
+    def map_path(self, path):
+        """Map path using longest matching source path.
+
+        Args:
+            path (str): Path to map.
+
+        Returns:
+            Union[str, None]: Mapped path or None if no source matches.
+        """
+        segments = path.replace("\\", "/").split("/")
+        node = self._trie
+        match = None
+        for idx, segment in enumerate(segments):
+            if not self._case_sensitive:
+                segment = segment.lower()
+            node = node.get(segment)
+            if node is None:
+                break
+            if None in node:
+                match = (idx, node[None])
+
+        if match is None:
+            return None
+        idx, destination_path = match
+        return "/".join([destination_path] + segments[idx + 1:])
+
+    def resolve(self, path):
+        """Mapped path if it exists, otherwise the original path.
+
+        Args:
+            path (str): Path to resolve.
+
+        Returns:
+            str: Resolved path.
+        """
+        now = time.monotonic()
+        cache = self._cache
+        item = cache.get(path)
+        if item is not None:
+            cache.move_to_end(path)
+            mapped_path, exists, checked = item
+            if mapped_path is None:
+                return path
+            if (
+                self.exists_timeout is None
+                or now - checked < self.exists_timeout
+            ):
+                return mapped_path if exists else path
+        else:
+            mapped_path = self.map_path(path)
+
+        exists = False
+        if mapped_path is not None:
+            exists = os.path.exists(mapped_path)
+        cache[path] = (mapped_path, exists, now)
+        if len(cache) > self.max_cache_size:
+            cache.popitem(last=False)
+        return mapped_path if exists else path
+
+    def clear_cache(self):
+        self._cache.clear()
@@ -0,0 +1,177 @@
+"""Expected output paths of nodes for frame ranges."""
+import os
+import re
+from collections import defaultdict
+
+import nuke
+
+# Frame number right before extension, used when output path is not known
+FRAME_FILENAME_REGEX = re.compile(
+    r"^(?P<head>.*?)(?P<frame>\d+)(?P<tail>\.[^.]+)$"
+)
+
+
+class FramePathTemplate:
+    """Output path of a node formatted for frames without TCL evaluation.
+
+    File knob is evaluated once with `nuke.filename`, which keeps the
+    padding token (`#`, `%0Nd` or `$F`) in the path. Paths for frames are
+    then created with string formatting instead of evaluating the knob
+    for each frame.
+
+    Template is not used when the knob value contains frame dependent TCL
+    expressions or when formatted paths of the first and last frame do
+    not match the knob evaluated for those frames. Paths are evaluated
+    for each frame in that case.
+    """
+    padding_regex = re.compile(r"%(\d*)d|#+|\$F(\d*)")
+    frame_expression_regex = re.compile(
+        r"\[\s*(?:frame|t)\b|\$(?:frame|t)\b"
+    )
+
+    def __init__(self, node, knob_name="file"):
+        self._knob = node[knob_name]
+        self._head = None
+        self._tail = None
+        self._width = 0
+        self._static_path = None
+        self._valid = False
+
+        if self.frame_expression_regex.search(self._knob.value()):
+            return
+
+        path = nuke.filename(node)
+        if not path:
+            return
+
+        match = None
+        for match in self.padding_regex.finditer(path):
+            pass
+
+        if match is None:
+            self._static_path = path
+        else:
+            token = match.group(0)
+            width = match.group(1) or match.group(2)
+            if token.startswith("#"):
+                width = len(token)
+            self._width = int(width) if width else 0
+            self._head = path[:match.start()]
+            self._tail = path[match.end():]
+        self._valid = True
+
+    def format(self, frame):
+        """Path of the frame.
+
+        Args:
+            frame (int): Frame number.
+
+        Returns:
+            str: Output path of the frame.
+        """
+        if not self._valid:
+            return self._knob.evaluate(frame)
+        if self._static_path is not None:
+            return self._static_path
+        return f"{self._head}{frame:0{self._width}d}{self._tail}"
+
+    def get_paths(self, first_frame, last_frame):
+        """Unique sorted paths of frame range.
+
+        Args:
+            first_frame (int): First frame.
+            last_frame (int): Last frame.
+
+        Returns:
+            list[str]: Output paths.
+        """
+        frames = range(first_frame, last_frame + 1)
+        if self._valid:
+            # Validate the template against Nuke on range boundaries
+            for frame in {first_frame, last_frame}:
+                if self.format(frame) != self._knob.evaluate(frame):
+                    self._valid = False
+                    break
+
+        return sorted({self.format(frame) for frame in frames})
+
+
+def get_frame_paths(node, first_frame, last_frame):
+    """Output paths of node for frame range.
+
+    Args:
+        node (nuke.Node): Node with file knob, e.g. Write node.
+        first_frame (int): First frame.
+        last_frame (int): Last frame.
+
+    Returns:
+        list[str]: Unique sorted output paths.
+    """
+    return FramePathTemplate(node).get_paths(first_frame, last_frame)
+
+
+def get_frame_filename_parts(path):
+    """Parts of frame file names around frame number of output path.
+
+    Args:
+        path (str): Output path with padding token, e.g. `nuke.filename`
+            of Write node.
+
+    Returns:
+        Optional[tuple[str, str]]: File name before and after the padding
+            token, None if the path does not contain padding token.
+    """
+    filename = os.path.basename(path)
+    match = None
+    for match in FramePathTemplate.padding_regex.finditer(filename):
+        pass
+    if match is None:
+        return None
+    return filename[:match.start()], filename[match.end():]
+
+
+def parse_frame_files(filenames, filename_parts=None):
+    """Group file names to frame sequences by head and tail.
+
+    With `filename_parts` (see `get_frame_filename_parts`) a file is
+    a frame when it starts with the head, ends with the tail and there
+    are only digits between them, so frame number can be anywhere in the
+    file name. Without them the frame number has to be right before the
+    extension, e.g. `name.1001.exr` or `name_1001.exr`.
+
+    Args:
+        filenames (Iterable[str]): File names.
+        filename_parts (Optional[tuple[str, str]]): Head and tail of frame
+            file names.
+
+    Returns:
+        tuple[dict[tuple[str, str], list[str]], list[str]]: Frame strings
+            by head and tail of sequence and file names which are not part
+            of any sequence.
+    """
+    frames_by_sequence = defaultdict(list)
+    remainder = []
+    if filename_parts is not None:
+        head, tail = filename_parts
+        for filename in filenames:
+            frame = filename[len(head):len(filename) - len(tail)]
+            if (
+                len(filename) > len(head) + len(tail)
+                and filename.startswith(head)
+                and filename.endswith(tail)
+                and frame.isdigit()
+                and frame.isascii()
+            ):
+                frames_by_sequence[filename_parts].append(frame)
+            else:
+                remainder.append(filename)
+        return frames_by_sequence, remainder
+
+    for filename in filenames:
+        match = FRAME_FILENAME_REGEX.match(filename)
+        if match is None:
+            remainder.append(filename)
+            continue
+        head, frame, tail = match.group("head", "frame", "tail")
+        frames_by_sequence[(head, tail)].append(frame)
+    return frames_by_sequence, remainder
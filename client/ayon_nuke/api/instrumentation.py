@@ -0,0 +1,187 @@
+"""Opt-in timing of Nuke callbacks and menu commands.
+
+Instrumentation is enabled with `AYON_NUKE_INSTRUMENTATION` environment
+variable set to "1". Callbacks registered by the integration and AYON menu
+commands are then wrapped with `instrument`, which records call count,
+cumulative time and 95th percentile of call duration.
+
+Summary is written as JSON lines into a rotating log file on script close
+and when "Performance report" menu item is used. Path of the log can be
+changed with `AYON_NUKE_INSTRUMENTATION_LOG`, default is
+`ayon_nuke_performance.jsonl` in temp directory.
+
+When instrumentation is disabled `instrument` returns the function
+unchanged, so there is no overhead.
+"""
+import os
+import json
+import time
+import logging
+import tempfile
+import functools
+from collections import deque
+from logging.handlers import RotatingFileHandler
+
+from ayon_core.lib import env_value_to_bool
+
+INSTRUMENTATION_ENV_KEY = "AYON_NUKE_INSTRUMENTATION"
+INSTRUMENTATION_LOG_ENV_KEY = "AYON_NUKE_INSTRUMENTATION_LOG"
+
+
+class CallStats:
+    """Timing statistics of one instrumented function.
+
+    Only last `max_samples` durations are used for percentile.
+    """
+    max_samples = 1000
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self._samples = deque(maxlen=self.max_samples)
+
+    def add(self, duration):
+        self.count += 1
+        self.total += duration
+        self._samples.append(duration)
+
+    def percentile(self, value):
+        if not self._samples:
+            return 0.0
+        samples = sorted(self._samples)
+        idx = min(len(samples) - 1, int(len(samples) * value / 100))
+        return samples[idx]
+
+    def to_data(self):
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p95": self.percentile(95),
+        }
+
+
+class Instrumentation:
+    """Timing statistics of instrumented callbacks."""
+    enabled = env_value_to_bool(INSTRUMENTATION_ENV_KEY, default=False)
+    _stats = {}
+    _logger = None
+
+    @classmethod
+    def record(cls, name, duration):
+        stats = cls._stats.get(name)
+        if stats is None:
+            stats = cls._stats[name] = CallStats()
+        stats.add(duration)
+
+    @classmethod
+    def get_report(cls):
+        """Statistics by instrumented name, slowest first.
+
+        Returns:
+            dict[str, dict[str, Any]]: Statistics by name.
+        """
+        return {
+            name: stats.to_data()
+            for name, stats in sorted(
+                cls._stats.items(),
+                key=lambda item: item[1].total,
+                reverse=True
+            )
+        }
+
+    @classmethod
+    def reset(cls):
+        cls._stats.clear()
+
+    @classmethod
+    def _get_logger(cls):
+        if cls._logger is None:
+            log_path = os.getenv(INSTRUMENTATION_LOG_ENV_KEY) or os.path.join(
+                tempfile.gettempdir(), "ayon_nuke_performance.jsonl"
+            )
+            handler = RotatingFileHandler(
+                log_path, maxBytes=5 * 1024 * 1024, backupCount=3
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger = logging.getLogger(f"{__name__}.report")
+            logger.propagate = False
+            logger.setLevel(logging.INFO)
+            logger.addHandler(handler)
+            cls._logger = logger
+        return cls._logger
+
+    @classmethod
+    def write_report(cls, event="report"):
+        """Write current statistics as one JSON line into the log.
+
+        Args:
+            event (str): Reason of the report, stored with the data.
+        """
+        if not cls._stats:
+            return
+        cls._get_logger().info(json.dumps({
+            "time": time.time(),
+            "event": event,
+            "pid": os.getpid(),
+            "stats": cls.get_report(),
+        }))
+
+
+def instrument(name, func):
+    """Wrap function to record its duration.
+
+    Args:
+        name (str): Name under which statistics are stored.
+        func (Callable): Function to wrap.
+
+    Returns:
+        Callable: Wrapped function, or the function itself when
+            instrumentation is disabled.
+    """
+    if not Instrumentation.enabled:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            Instrumentation.record(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def add_menu_command(menu, name, command, *args, **kwargs):
+    """Add command to Nuke menu with instrumented callable.
+
+    Args:
+        menu (nuke.Menu): Menu where command is added.
+        name (str): Command label.
+        command (Callable): Command callback.
+        *args (tuple): Other arguments of `nuke.Menu.addCommand`.
+        **kwargs (dict): Other keyword arguments of `addCommand`.
+
+    Returns:
+        nuke.MenuItem: Added menu item.
+    """
+    return menu.addCommand(
+        name, instrument(f"menu:{name}", command), *args, **kwargs
+    )
+
+
+def show_performance_report():
+    """Write report into log and print it to Script Editor."""
+    import nuke
+
+    Instrumentation.write_report()
+    lines = [
+        "{}: count {} | total {:.3f}s | p95 {:.4f}s".format(
+            name, data["count"], data["total"], data["p95"]
+        )
+        for name, data in Instrumentation.get_report().items()
+    ]
+    print("\n".join(["AYON performance report:"] + lines))
+    # show only slowest items in dialog
+    nuke.message("\n".join(["AYON performance report:"] + lines[:20]))
@@ -0,0 +1,266 @@
+"""Colorize loaded containers by state of their version."""
+import threading
+
+import nuke
+
+from ayon_core.lib import Logger
+from ayon_core.pipeline import (
+    registered_host,
+    get_current_project_name,
+)
+from ayon_core.pipeline.load import filter_containers
+
+from ayon_nuke.node_data_codec import AVALON_KNOB_PREFIXES
+
+from .constants import LOADER_CATEGORY_COLORS
+
+log = Logger.get_logger(__name__)
+
+
+class InventoryVersionState:
+    """Last known version state of loaded representations.
+
+    Loaded containers are colorized by their version category (latest,
+    outdated, ...). Categories are cached by representation id so only
+    containers with representation which was not checked yet are queried
+    on server. Cached category of representation is dropped when
+    a container's representation knob changes to it (see `invalidate`)
+    and the whole cache is dropped when a script is opened.
+
+    Server query runs in a worker thread in GUI mode and node colors are
+    applied with `nuke.executeInMainThread` so opening of the script is
+    not blocked by the server response.
+
+    Before save only cached colors are applied (see `apply_cached`), so
+    colors are saved with the script, the script is not modified after
+    the save and the save does not wait for the server. Unknown
+    representations are queried in background and their colors are
+    applied on next save or when the script is opened again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._project_name = None
+        self._generation = 0
+        # representation id -> category
+        self._categories_by_repre_id = {}
+        # representation ids which are being queried
+        self._queued_repre_ids = set()
+
+    def reset(self):
+        """Forget cached categories and ignore running queries."""
+        with self._lock:
+            self._generation += 1
+            self._categories_by_repre_id.clear()
+            self._queued_repre_ids.clear()
+
+    def invalidate(self, representation_id):
+        """Query category of representation again on next refresh.
+
+        Args:
+            representation_id (str): Representation id.
+        """
+        with self._lock:
+            self._categories_by_repre_id.pop(representation_id, None)
+
+    def refresh(self, asynchronous=True):
+        """Colorize loaded containers based on version state.
+
+        Args:
+            asynchronous (Optional[bool]): Query server in worker thread
+                in GUI mode.
+        """
+        generation, project_name, missing_containers = self._apply_cached()
+        if not missing_containers:
+            return
+
+        if not nuke.GUI or not asynchronous:
+            self._process(
+                generation, project_name, missing_containers,
+                asynchronous=False
+            )
+            return
+
+        self._start_worker(generation, project_name, missing_containers)
+
+    def apply_cached(self):
+        """Colorize containers with cached categories only.
+
+        Categories of other containers are queried in background and are
+        not applied until next `refresh` or `apply_cached` call.
+        """
+        generation, project_name, missing_containers = self._apply_cached()
+        if missing_containers:
+            self._start_worker(
+                generation, project_name, missing_containers,
+                apply_colors=False
+            )
+
+    def _apply_cached(self):
+        """Apply cached colors and collect containers without category.
+
+        Containers with representation which is already being queried are
+        skipped.
+
+        Returns:
+            tuple[int, str, list[dict]]: Generation of cache, project name
+                and containers which should be queried.
+        """
+        host = registered_host()
+        containers = host.get_containers()
+        project_name = get_current_project_name()
+        if project_name != self._project_name:
+            self.reset()
+            self._project_name = project_name
+
+        updates = []
+        missing_containers = []
+        with self._lock:
+            generation = self._generation
+            for container in containers:
+                repre_id = container["representation"]
+                category = self._categories_by_repre_id.get(repre_id)
+                if category is None:
+                    if repre_id not in self._queued_repre_ids:
+                        missing_containers.append(container)
+                    continue
+                color = _get_loader_category_color(category)
+                if color is not None:
+                    updates.append((container["node"], color))
+
+            self._queued_repre_ids.update(
+                container["representation"]
+                for container in missing_containers
+            )
+
+        self._apply_colors(generation, updates)
+        return generation, project_name, missing_containers
+
+    def _start_worker(
+        self, generation, project_name, containers, apply_colors=True
+    ):
+        thread = threading.Thread(
+            target=self._process,
+            args=(generation, project_name, containers),
+            kwargs={"apply_colors": apply_colors},
+            daemon=True,
+        )
+        thread.start()
+
+    def _process(
+        self,
+        generation,
+        project_name,
+        containers,
+        asynchronous=True,
+        apply_colors=True,
+    ):
+        """Query version categories of containers in one batch."""
+        repre_ids = {container["representation"] for container in containers}
+        try:
+            filtered_containers = filter_containers(containers, project_name)
+        except Exception as error:
+            log.warning(error)
+            with self._lock:
+                if generation == self._generation:
+                    self._queued_repre_ids.difference_update(repre_ids)
+            return
+
+        updates = []
+        categories_by_repre_id = {}
+        for category, category_containers in (
+            filtered_containers._asdict().items()
+        ):
+            color = _get_loader_category_color(category)
+            for container in category_containers:
+                categories_by_repre_id[container["representation"]] = (
+                    category
+                )
+                if color is not None:
+                    updates.append((container["node"], color))
+
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._queued_repre_ids.difference_update(repre_ids)
+            self._categories_by_repre_id.update(categories_by_repre_id)
+
+        if not apply_colors:
+            return
+        if asynchronous:
+            nuke.executeInMainThread(
+                self._apply_colors, args=(generation, updates)
+            )
+        else:
+            self._apply_colors(generation, updates)
+
+    def _apply_colors(self, generation, updates):
+        if generation != self._generation:
+            return
+        for node, color in updates:
+            try:
+                knob = node["tile_color"]
+                # avoid marking the script as modified
+                if knob.value() != color:
+                    knob.setValue(color)
+            except ValueError:
+                # node was removed in the meantime
+                continue
+
+
+def _get_loader_category_color(category):
+    color = LOADER_CATEGORY_COLORS.get(category)
+    if color is None:
+        return None
+    # convert hex to nuke tile color int
+    return int(color, 16)
+
+
+_inventory_version_state = InventoryVersionState()
+
+
+def check_inventory_versions():
+    """Update loaded container nodes' colors based on version state.
+
+    This will group containers by their version to outdated, not found,
+    invalid or latest and colorize the nodes based on the category.
+    Categories of already checked representations are reused.
+    """
+    try:
+        _inventory_version_state.refresh()
+    except Exception as error:
+        log.warning(error)
+
+
+def apply_cached_inventory_versions():
+    """Colorize containers with already known version state.
+
+    Used before script save, server is queried for unknown representations
+    in background and their colors are applied on next save.
+    """
+    try:
+        _inventory_version_state.apply_cached()
+    except Exception as error:
+        log.warning(error)
+
+
+def refresh_inventory_versions():
+    """Same as `check_inventory_versions` but ignores cached categories.
+
+    Used when a workfile is opened.
+    """
+    _inventory_version_state.reset()
+    check_inventory_versions()
+
+
+def on_knob_changed():
+    """Invalidate cached category when container representation changes."""
+    knob = nuke.thisKnob()
+    if knob is None:
+        return
+    knob_name = knob.name()
+    if any(
+        knob_name == prefix + "representation"
+        for prefix in AVALON_KNOB_PREFIXES
+    ):
+        _inventory_version_state.invalidate(knob.value())
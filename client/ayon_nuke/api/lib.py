@@ -1,7 +1,6 @@
 from __future__ import annotations
 import os
 import re
-import json
 import functools
 import warnings
 import pathlib
@@ -12,9 +11,7 @@ from collections import OrderedDict
 
 import nuke
 from qtpy import QtCore, QtWidgets
-import ayon_api
 
-from ayon_core.host import HostDirmap
 from ayon_core.pipeline.workfile.workfile_template_builder import (
     TemplateProfileNotFound
 )
@@ -30,17 +27,7 @@ from ayon_core.tools.attribute_defs.dialog import (
     AttributeDefinitionsDialog
 )
 
-from ayon_core.settings import (
-    get_project_settings,
-    get_current_project_settings,
-)
-from ayon_core.addon import AddonsManager
-from ayon_core.pipeline.template_data import (
-    get_template_data_with_names,
-    get_template_data,
-)
 from ayon_core.pipeline import (
-    Anatomy,
     registered_host,
     get_current_host_name,
     get_current_project_name,
@@ -51,35 +38,62 @@ from ayon_core.pipeline import (
     get_current_context,
 )
 from ayon_core.pipeline.create import CreateContext
-from ayon_core.pipeline.load import filter_containers
 from ayon_core.pipeline.colorspace import (
     get_current_context_imageio_config_preset
 )
 from ayon_core.resources import get_ayon_icon_filepath
 
 from .gizmo_menu import GizmoMenu
-from .constants import (
-    ASSIST,
-    LOADER_CATEGORY_COLORS,
-)
+from .constants import ASSIST
 
 from .utils import get_node_outputs
+from .settings import (
+    get_project_settings_view,
+    get_project_settings_copy,
+)
+from ayon_nuke.node_data_codec import (
+    ROOT_DATA_KNOB,  # noqa: F401
+    INSTANCE_DATA_KNOB,
+    JsonNodeDataCodec,
+    freeze_node_data,
+    thaw_node_data,
+)
+from .node_data import (
+    EXCLUDED_KNOB_CLASS_ON_READ,  # noqa: F401
+    NodeDataTransaction,  # noqa: F401
+    node_data_transaction,  # noqa: F401
+    set_node_data,
+    get_node_data,  # noqa: F401
+    get_node_data_view,
+    update_node_data,  # noqa: F401
+    read_avalon_data,
+)
+from .frame_paths import (
+    FramePathTemplate,  # noqa: F401
+    get_frame_paths,  # noqa: F401
+)
+from .dirmap import (
+    NukeDirmap,  # noqa: F401
+    DirmapCache,  # noqa: F401
+    dirmap_file_name_filter,  # noqa: F401
+)
+from .context_cache import ContextEntityCache
+from .inventory_versions import (
+    check_inventory_versions,  # noqa: F401
+    refresh_inventory_versions,  # noqa: F401
+)
 
-from .colorspace import get_formatted_display_and_view
+from .colorspace import (
+    get_formatted_display_and_view,
+    get_input_colorspace_rules,
+)
 
 log = Logger.get_logger(__name__)
 
 MENU_LABEL = os.getenv("AYON_MENU_LABEL") or "AYON"
 NODE_TAB_NAME = MENU_LABEL
 DATA_GROUP_KEY = "{}DataGroup".format(MENU_LABEL.capitalize())
-EXCLUDED_KNOB_TYPE_ON_READ = (
-    20,  # Tab Knob
-    26,  # Text Knob (But for backward compatibility, still be read
-         #  if value is not an empty string.)
-)
-JSON_PREFIX = "JSON:::"
-ROOT_DATA_KNOB = "publish_context"
-INSTANCE_DATA_KNOB = "publish_instance"
+JSON_PREFIX = JsonNodeDataCodec.prefix
 
 
 class DeprecatedWarning(DeprecationWarning):
@@ -155,70 +169,6 @@ def get_main_window():
     return Context.main_window
 
 
-def set_node_data(node, knob_name, data):
-    """Write data to an invisible node knob.
-
-    Will create a new one if it doesn't exist,
-    or update the one already created.
-
-    Args:
-        node (nuke.Node): node object
-        knob_name (str): knob name
-        data (dict): data to be stored in knob
-    """
-    # if exists then update data
-    if knob_name in node.knobs():
-        update_node_data(node, knob_name, data)
-        return
-
-    # else create new
-    knob_value = JSON_PREFIX + json.dumps(data)
-    knob = nuke.String_Knob(knob_name)
-    knob.setValue(knob_value)
-    knob.setFlag(nuke.INVISIBLE)
-    node.addKnob(knob)
-
-
-def get_node_data(node, knob_name):
-    """Read data from node.
-
-    Args:
-        node (nuke.Node): node object
-        knob_name (str): knob name
-
-    Returns:
-        dict: data stored in knob
-    """
-    if knob_name not in node.knobs():
-        return {}
-
-    rawdata = node[knob_name].getValue()
-    if (
-        isinstance(rawdata, str)
-        and rawdata.startswith(JSON_PREFIX)
-    ):
-        try:
-            return json.loads(rawdata[len(JSON_PREFIX):])
-        except json.JSONDecodeError:
-            pass
-    return {}
-
-
-def update_node_data(node, knob_name, data):
-    """Update already present data.
-
-    Args:
-        node (nuke.Node): node object
-        knob_name (str): knob name
-        data (dict): data to update knob value
-    """
-    knob = node[knob_name]
-    node_data = get_node_data(node, knob_name)
-    node_data.update(data)
-    knob_value = JSON_PREFIX + json.dumps(node_data)
-    knob.setValue(knob_value)
-
-
 class Knobby(object):
     """[DEPRECATED] For creating knob which it's type isn't
                     mapped in `create_knobs`
@@ -432,6 +382,8 @@ def set_avalon_knob_data(node, data=None, prefix="avalon:"):
             'productName': 'productMain'
         }
     """
+    from .scene_registry import mark_node_dirty
+
     data = data or dict()
     create = OrderedDict()
 
@@ -481,6 +433,7 @@ def set_avalon_knob_data(node, data=None, prefix="avalon:"):
         create = tab
 
     imprint(node, create, tab=tab_name)
+    mark_node_dirty(node)
     return node
 
 
@@ -562,61 +515,6 @@ def add_write_node(name, file_path, knobs, **kwarg):
     return w
 
 
-def read_avalon_data(node):
-    """Return user-defined knobs from given `node`
-
-    Args:
-        node (nuke.Node): Nuke node object
-
-    Returns:
-        list: A list of nuke.Knob object
-
-    """
-    def compat_prefixed(knob_name):
-        if knob_name.startswith("avalon:"):
-            return knob_name[len("avalon:"):]
-        elif knob_name.startswith("ak:"):
-            return knob_name[len("ak:"):]
-
-    data = dict()
-
-    pattern = ("(?<=addUserKnob {)"
-               "([0-9]*) (\\S*)"  # Matching knob type and knob name
-               "(?=[ |}])")
-    tcl_script = node.writeKnobs(nuke.WRITE_USER_KNOB_DEFS)
-    result = re.search(pattern, tcl_script)
-
-    if result:
-        first_user_knob = result.group(2)
-        # Collect user knobs from the end of the knob list
-        for knob in reversed(node.allKnobs()):
-            knob_name = knob.name()
-            if not knob_name:
-                # Ignore unnamed knob
-                continue
-            try:
-                knob_type = nuke.knob(knob.fullyQualifiedName(), type=True)
-                value = knob.value()
-            except Exception:
-                log.debug(
-                    f"Error in knob {knob_name}, node {node['name'].value()}")
-                continue
-            if (
-                knob_type not in EXCLUDED_KNOB_TYPE_ON_READ or
-                # For compating read-only string data that imprinted
-                # by `nuke.Text_Knob`.
-                (knob_type == 26 and value)
-            ):
-                key = compat_prefixed(knob_name)
-                if key is not None:
-                    data[key] = value
-
-            if knob_name == first_user_knob:
-                break
-
-    return data
-
-
 def get_node_path(path, padding=4):
     """Get filename for the Nuke write with padded number as '#'
 
@@ -661,129 +559,221 @@ def get_node_path(path, padding=4):
     return filename, padding, ext
 
 
+def _get_nuke_imageio_settings_view():
+    return get_project_settings_view(Context.project_name)["nuke"]["imageio"]
+
+
 def get_nuke_imageio_settings():
-    return get_project_settings(Context.project_name)["nuke"]["imageio"]
+    """Imageio settings of current project.
+
+    Returns:
+        dict[str, Any]: Mutable copy of settings.
+    """
+    return thaw_node_data(_get_nuke_imageio_settings_view())
 
 
-def get_matching_override_node(node_class, plugin_name, product_name):
-    """Find matching override node for the given configuration.
+class ImageioNodeSettingsResolver:
+    """Lookup of imageio node settings.
 
-    Args:
-        node_class (str): Nuke node class name
-        plugin_name (str): Plugin name
-        product_name (str): Product name
+    Required and override nodes matching node class and plugin name are
+    found once per combination and product name regexes are compiled
+    once. Resolved node settings are read-only and settings used to create
+    the resolver are never modified.
 
-    Returns:
-        dict or None: Matching override node or None if not found
+    Args:
+        nodes_settings (dict): Imageio "nodes" settings.
     """
-    imageio_nodes = get_nuke_imageio_settings()["nodes"]
-    override_nodes = imageio_nodes["override_nodes"]
 
-    for override_node in override_nodes:
-        node_class_preset = override_node["nuke_node_class"]
+    def __init__(self, nodes_settings):
+        self._required_nodes = nodes_settings["required_nodes"]
+        self._override_nodes = [
+            (
+                override_node,
+                [
+                    re.compile(product_name.lower())
+                    for product_name in override_node["product_names"]
+                ]
+            )
+            for override_node in nodes_settings["override_nodes"]
+        ]
+        self._required_node_by_key = {}
+        self._override_nodes_by_key = {}
+        self._node_settings = {}
 
-        if override_node.get("custom_class"):
-            node_class_preset = override_node["custom_class"]
+    @staticmethod
+    def _match_node(node_settings, node_class, plugin_name):
+        node_class_preset = node_settings["nuke_node_class"]
+        if node_settings.get("custom_class"):
+            node_class_preset = node_settings["custom_class"]
+        return (
+            node_class in node_class_preset
+            and plugin_name in node_settings["plugins"]
+        )
 
-        if node_class not in node_class_preset:
-            continue
+    def get_required_node(self, node_class, plugin_name):
+        """First required node matching node class and plugin name.
 
-        if plugin_name not in override_node["plugins"]:
-            continue
+        Returns:
+            Union[dict, None]: Required node settings.
+        """
+        key = (node_class, plugin_name)
+        if key not in self._required_node_by_key:
+            self._required_node_by_key[key] = next(
+                (
+                    node
+                    for node in self._required_nodes
+                    if self._match_node(node, node_class, plugin_name)
+                ),
+                None
+            )
+        return self._required_node_by_key[key]
 
-        product_names = override_node["product_names"]
+    def get_override_node(self, node_class, plugin_name, product_name):
+        """First override node matching the configuration.
 
-        if (
-            product_names
-            and not any(
-                re.search(s.lower(), product_name.lower())
-                for s in product_names
+        Returns:
+            Union[dict, None]: Override node settings.
+        """
+        key = (node_class, plugin_name)
+        override_nodes = self._override_nodes_by_key.get(key)
+        if override_nodes is None:
+            override_nodes = [
+                item
+                for item in self._override_nodes
+                if self._match_node(item[0], node_class, plugin_name)
+            ]
+            self._override_nodes_by_key[key] = override_nodes
+
+        product_name = product_name.lower()
+        for override_node, product_regexes in override_nodes:
+            if (
+                product_regexes
+                and not any(
+                    regex.search(product_name)
+                    for regex in product_regexes
+                )
+            ):
+                continue
+            return override_node
+        return None
+
+    def get_node_setting(self, node_class, plugin_name, product_name):
+        """Required node settings with knobs of matching override node.
+
+        Returns:
+            Union[MappingProxyType, None]: Read-only node settings.
+        """
+        key = (node_class, plugin_name, product_name)
+        if key in self._node_settings:
+            return self._node_settings[key]
+
+        node_setting = None
+        imageio_node = self.get_required_node(node_class, plugin_name)
+        if imageio_node:
+            override_node = self.get_override_node(
+                node_class, plugin_name, product_name
             )
-        ):
-            continue
+            # If node override exists, use only override knobs
+            # (don't merge with original master knobs)
+            if override_node:
+                knobs = override_node.get("knobs", [])
+            else:
+                knobs = imageio_node["knobs"]
+            node_setting = freeze_node_data(dict(imageio_node, knobs=knobs))
 
-        return override_node
+        self._node_settings[key] = node_setting
+        return node_setting
 
-    return None
 
+_IMAGEIO_NODE_SETTINGS_RESOLVER_CACHE = {
+    "nodes_settings": None,
+    "resolver": None,
+}
 
-def get_imageio_node_setting(node_class, plugin_name, product_name):
-    """Get preset data for dataflow (fileType, compression, bitDepth)"""
-    imageio_nodes = get_nuke_imageio_settings()["nodes"]
-    required_nodes = imageio_nodes["required_nodes"]
-
-    imageio_node = None
-    for node in required_nodes:
-        node_class_preset = node["nuke_node_class"]
-        if node.get("custom_class"):
-            node_class_preset = node["custom_class"]
-        if (
-            node_class in node_class_preset
-            and plugin_name in node["plugins"]
-        ):
-            imageio_node = node
-            break
 
-    if not imageio_node:
-        return
+def get_imageio_node_settings_resolver():
+    """Resolver for imageio nodes settings of current project.
 
-    # Check if a node override exists for this configuration
-    override_imageio_node = get_matching_override_node(
-        node_class, plugin_name, product_name
+    Returns:
+        ImageioNodeSettingsResolver: Resolver for current settings.
+    """
+    cache = _IMAGEIO_NODE_SETTINGS_RESOLVER_CACHE
+    nodes_settings = _get_nuke_imageio_settings_view()["nodes"]
+    # settings view is the same object until settings are invalidated
+    if cache["nodes_settings"] is not nodes_settings:
+        cache["nodes_settings"] = nodes_settings
+        cache["resolver"] = ImageioNodeSettingsResolver(nodes_settings)
+    return cache["resolver"]
+
+
+def get_matching_override_node(node_class, plugin_name, product_name):
+    """Find matching override node for the given configuration.
+
+    Args:
+        node_class (str): Nuke node class name
+        plugin_name (str): Plugin name
+        product_name (str): Product name
+
+    Returns:
+        dict or None: Matching override node or None if not found
+    """
+    return thaw_node_data(
+        get_imageio_node_settings_resolver().get_override_node(
+            node_class, plugin_name, product_name
+        )
     )
 
-    # If node override exists,
-    # use only override knobs
-    # (don't merge with original master knobs)
-    if override_imageio_node:
-        imageio_node["knobs"] = override_imageio_node.get("knobs", [])
-    else:
-        # Otherwise apply partial overrides to original master knobs
-        imageio_node["knobs"] = get_imageio_node_override_setting(
-            node_class,
-            plugin_name,
-            product_name,
-            imageio_node["knobs"]
+
+def get_imageio_node_setting(node_class, plugin_name, product_name):
+    """Get preset data for dataflow (fileType, compression, bitDepth)
+
+    Returns:
+        Union[dict, None]: Node settings.
+    """
+    return thaw_node_data(
+        get_imageio_node_settings_resolver().get_node_setting(
+            node_class, plugin_name, product_name
         )
-    return imageio_node
+    )
 
 
 def get_imageio_node_override_setting(
     node_class, plugin_name, product_name, knobs_settings
 ):
-    """Get imageio node overrides from settings"""
-    # find matching override node
-    override_imageio_node = get_matching_override_node(
-        node_class, plugin_name, product_name
-    )
+    """Get imageio node overrides from settings
 
-    # add overrides to imageio_node
-    if override_imageio_node:
-        # get all knob names in imageio_node
-        knob_names = [k["name"] for k in knobs_settings]
-
-        for oknob in override_imageio_node["knobs"]:
-            oknob_name = oknob["name"]
-            oknob_type = oknob["type"]
-            oknob_value = oknob[oknob_type]
-            for knob in knobs_settings:
-                # add missing knobs into imageio_node
-                if oknob_name not in knob_names:
-                    knobs_settings.append(oknob)
-                    knob_names.append(oknob_name)
-                    continue
+    Passed knobs settings are not modified.
 
-                if oknob_name != knob["name"]:
-                    continue
-
-                knob_type = knob["type"]
-                # override matching knob name
-                if not oknob_value:
-                    # remove original knob if no value found in oknob
-                    knobs_settings.remove(knob)
-                else:
-                    # override knob value with oknob's
-                    knob[knob_type] = oknob_value
+    Returns:
+        list[dict]: Knobs settings with applied overrides.
+    """
+    knobs_settings = [dict(knob) for knob in knobs_settings]
+    # find matching override node
+    override_imageio_node = (
+        get_imageio_node_settings_resolver().get_override_node(
+            node_class, plugin_name, product_name
+        )
+    )
+    if not override_imageio_node:
+        return knobs_settings
+
+    knobs_by_name = {knob["name"]: knob for knob in knobs_settings}
+    for oknob in override_imageio_node["knobs"]:
+        oknob_name = oknob["name"]
+        oknob_value = oknob[oknob["type"]]
+        knob = knobs_by_name.get(oknob_name)
+        if knob is None:
+            # add missing knobs
+            knob = thaw_node_data(oknob)
+            knobs_settings.append(knob)
+            knobs_by_name[oknob_name] = knob
+        elif not oknob_value:
+            # remove original knob if no value found in oknob
+            if knob in knobs_settings:
+                knobs_settings.remove(knob)
+        else:
+            # override knob value with oknob's
+            knob[knob["type"]] = thaw_node_data(oknob_value)
 
     return knobs_settings
 
@@ -792,14 +782,10 @@ def get_imageio_node_override_setting(
 def get_imageio_input_colorspace(filename):
     """Get input file colorspace based on regex in settings."""
     imageio_regex_inputs = (
-        get_nuke_imageio_settings()["regex_inputs"]["inputs"])
+        _get_nuke_imageio_settings_view()["regex_inputs"]["inputs"])
 
-    preset_clrsp = None
-    for regexInput in imageio_regex_inputs:
-        if bool(re.search(regexInput["regex"], filename)):
-            preset_clrsp = str(regexInput["colorspace"])
-
-    return preset_clrsp
+    return get_input_colorspace_rules(
+        imageio_regex_inputs).get_colorspace(filename)
 
 
 def get_view_process_node():
@@ -834,29 +820,6 @@ def get_view_process_node():
         return duplicate_node(ipn_node)
 
 
-def check_inventory_versions():
-    """Update loaded container nodes' colors based on version state.
-
-    This will group containers by their version to outdated, not found,
-    invalid or latest and colorize the nodes based on the category.
-    """
-    try:
-        host = registered_host()
-        containers = host.get_containers()
-        project_name = get_current_project_name()
-
-        filtered_containers = filter_containers(containers, project_name)
-        for category, containers in filtered_containers._asdict().items():
-            if category not in LOADER_CATEGORY_COLORS:
-                continue
-            color = LOADER_CATEGORY_COLORS[category]
-            color = int(color, 16)  # convert hex to nuke tile color int
-            for container in containers:
-                container["node"]["tile_color"].setValue(color)
-    except Exception as error:
-        log.warning(error)
-
-
 def writes_version_sync(write_node, log):
     """Callback synchronizing version of publishable write nodes
 
@@ -951,7 +914,7 @@ def get_work_default_directory(data):
     """
 
     project_name = get_current_project_name()
-    anatomy = Anatomy(project_name)
+    anatomy = ContextEntityCache.get_anatomy(project_name)
 
     frame_padding = anatomy.templates_obj.frame_padding
 
@@ -964,7 +927,7 @@ def get_work_default_directory(data):
     task_name = data["task"]
     host_name = get_current_host_name()
 
-    context_data = get_template_data_with_names(
+    context_data = ContextEntityCache.get_template_data(
         project_name, folder_path, task_name, host_name
     )
     data.update(context_data)
@@ -1063,7 +1026,7 @@ def create_prenodes(
 
         if all([plugin_name, product_name]):
             # find imageio overrides
-            get_imageio_node_override_setting(
+            knobs = get_imageio_node_override_setting(
                 now_node.Class(),
                 plugin_name,
                 product_name,
@@ -1532,28 +1495,29 @@ class WorkfileSettings(object):
         project_entity = kwargs.get("project")
         if project_entity is None:
             project_name = get_current_project_name()
-            project_entity = ayon_api.get_project(project_name)
         else:
             project_name = project_entity["name"]
 
-        Context._project_entity = project_entity
         self._project_name = project_name
         self._folder_path = get_current_folder_path()
-        self._folder_entity = ayon_api.get_folder_by_path(
-            project_name, self._folder_path
-        )
         self._task_name = get_current_task_name()
         self._context_label = "{} > {}".format(self._folder_path,
                                                self._task_name)
-        self._task_entity = ayon_api.get_task_by_name(
-            project_name,
-            self._folder_entity["id"],
-            self._task_name
+        (
+            cached_project_entity,
+            self._folder_entity,
+            self._task_entity,
+        ) = ContextEntityCache.get_entities(
+            project_name, self._folder_path, self._task_name
         )
+        if project_entity is None:
+            project_entity = cached_project_entity
+
+        Context._project_entity = project_entity
         self._root_node = root_node or nuke.root()
         self._nodes = self.get_nodes(nodes=nodes)
 
-        context_data = get_template_data_with_names(
+        context_data = ContextEntityCache.get_template_data(
             project_name, self._folder_path, self._task_name, "nuke"
         )
         self.formatting_data = context_data
@@ -1567,7 +1531,9 @@ class WorkfileSettings(object):
             dict: project settings for the current project
         """
         if not self._project_setting:
-            self._project_setting = get_project_settings(self._project_name)
+            self._project_setting = get_project_settings_copy(
+                self._project_name
+            )
         return self._project_setting
 
     def get_nodes(self, nodes=None, nodes_filter=None):
@@ -1911,12 +1877,26 @@ Reopening Nuke should synchronize these paths and resolve any discrepancies.
         """Adds correct colorspace to write node dict
 
         """
-        for node in nuke.allNodes(filter="Group", group=self._root_node):
+        from .scene_registry import get_scene_registry
+
+        # only nodes with imprinted data can be write instances
+        scene_registry = get_scene_registry()
+        instance_nodes = dict.fromkeys(
+            scene_registry.get_instance_nodes()
+            + scene_registry.get_avalon_nodes()
+        )
+        for node in instance_nodes:
+            if (
+                node.Class() != "Group"
+                or node.parent() != self._root_node
+            ):
+                continue
+
             log.info("Setting colorspace to `{}`".format(node.name()))
 
             # get data from avalon knob
             avalon_knob_data = read_avalon_data(node)
-            node_data = get_node_data(node, INSTANCE_DATA_KNOB)
+            node_data = get_node_data_view(node, INSTANCE_DATA_KNOB)
 
             if (
                 # backward compatibility
@@ -1997,7 +1977,7 @@ Reopening Nuke should synchronize these paths and resolve any discrepancies.
                 "create_write_prerender": "CreateWritePrerender",
                 "create_write_render": "CreateWriteRender"
             }
-            node_data = get_node_data(node, INSTANCE_DATA_KNOB)
+            node_data = get_node_data_view(node, INSTANCE_DATA_KNOB)
             identifier = node_data["creator_identifier"]
             creator_settings = all_create_settings[
                 plugin_names_mapping[identifier]
@@ -2019,6 +1999,7 @@ Reopening Nuke should synchronize these paths and resolve any discrepancies.
         on regex rules in presets
         """
         changes = {}
+        input_rules = get_input_colorspace_rules(read_clrs_inputs)
         for node in nuke.allNodes("Read"):
             file = nuke.filename(node)
             # Read node may return `None` if never set to any value
@@ -2026,16 +2007,11 @@ Reopening Nuke should synchronize these paths and resolve any discrepancies.
                 continue
 
             # check if any colorspace presets for read is matching
-            preset_colorspace = None
-
-            for input_ in read_clrs_inputs:
-                if not bool(re.search(input_["regex"], file)):
-                    continue
-                preset_colorspace = input_["colorspace"]
+            preset_colorspace = input_rules.get_colorspace(file)
 
             if preset_colorspace is not None:
                 current = node["colorspace"].value()
-                future = str(preset_colorspace)
+                future = preset_colorspace
                 if current != future:
                     changes[node.name()] = {
                         "from": current,
@@ -2320,7 +2296,7 @@ def get_write_node_template_attr(node):
         "create_write_render": "CreateWriteRender"
     }
     # get AYON data from node
-    node_data = get_node_data(node, INSTANCE_DATA_KNOB)
+    node_data = get_node_data_view(node, INSTANCE_DATA_KNOB)
     identifier = node_data["creator_identifier"]
 
     # return template data
@@ -2393,7 +2369,7 @@ def update_node_graph():
 
 def find_free_space_to_paste_nodes(
     nodes,
-    group=nuke.root(),
+    group=None,
     direction="right",
     offset=300
 ):
@@ -2402,7 +2378,8 @@ def find_free_space_to_paste_nodes(
 
     Arguments:
         nodes (list): list of nuke.Node objects
-        group (nuke.Node) [optional]: object in which context it is
+        group (nuke.Node) [optional]: object in which context it is,
+                                      root node is used if not passed
         direction (str) [optional]: where we want it to be placed
                                     [left, right, top, bottom]
         offset (int) [optional]: what offset it is from rest of nodes
@@ -2414,6 +2391,9 @@ def find_free_space_to_paste_nodes(
     if len(nodes) == 0:
         return 0, 0
 
+    if group is None:
+        group = nuke.root()
+
     group_xpos = list()
     group_ypos = list()
 
@@ -2763,7 +2743,7 @@ def add_scripts_menu():
 
     # load configuration of custom menu
     project_name = get_current_project_name()
-    project_settings = get_project_settings(project_name)
+    project_settings = get_project_settings_copy(project_name)
     config = project_settings["nuke"]["scriptsmenu"]["definition"]
     _menu = project_settings["nuke"]["scriptsmenu"]["name"]
 
@@ -2781,7 +2761,7 @@ def add_scripts_menu():
 def add_scripts_gizmo():
 
     # load configuration of custom menu
-    project_settings = get_current_project_settings()
+    project_settings = get_project_settings_copy()
     platform_name = platform.system().lower()
 
     template_data = get_current_context_template_data_and_environ()
@@ -2844,15 +2824,12 @@ def get_current_context_template_data_and_environ():
     task_name = context["task_name"]
     host_name = get_current_host_name()
 
-    project_entity = ayon_api.get_project(project_name)
-    anatomy = Anatomy(project_name, project_entity=project_entity)
-    folder_entity = ayon_api.get_folder_by_path(project_name, folder_path)
-    task_entity = ayon_api.get_task_by_name(
-        project_name, folder_entity["id"], task_name
+    project_entity, _, _ = ContextEntityCache.get_entities(
+        project_name, folder_path, task_name
     )
-
-    template_data = get_template_data(
-        project_entity, folder_entity, task_entity, host_name
+    anatomy = ContextEntityCache.get_anatomy(project_name, project_entity)
+    template_data = ContextEntityCache.get_template_data(
+        project_name, folder_path, task_name, host_name
     )
     template_data["root"] = anatomy.roots
 
@@ -2861,90 +2838,6 @@ def get_current_context_template_data_and_environ():
     return template_data
 
 
-class NukeDirmap(HostDirmap):
-    def __init__(self, file_name, *args, **kwargs):
-        """
-        Args:
-            file_name (str): full path of referenced file from workfiles
-            *args (tuple): Positional arguments for 'HostDirmap' class
-            **kwargs (dict): Keyword arguments for 'HostDirmap' class
-        """
-
-        self.file_name = file_name
-        super(NukeDirmap, self).__init__(*args, **kwargs)
-
-    def on_enable_dirmap(self):
-        pass
-
-    def dirmap_routine(self, source_path, destination_path):
-        source_path = source_path.lower().replace(os.sep, '/')
-        destination_path = destination_path.lower().replace(os.sep, '/')
-        if platform.system().lower() == "windows":
-            self.file_name = self.file_name.lower().replace(
-                source_path, destination_path)
-        else:
-            self.file_name = self.file_name.replace(
-                source_path, destination_path)
-
-
-class DirmapCache:
-    """Caching class to get settings and sitesync easily and only once."""
-    _project_name = None
-    _project_settings = None
-    _sitesync_addon_discovered = False
-    _sitesync_addon = None
-    _mapping = None
-
-    @classmethod
-    def project_name(cls):
-        if cls._project_name is None:
-            cls._project_name = os.getenv("AYON_PROJECT_NAME")
-        return cls._project_name
-
-    @classmethod
-    def project_settings(cls):
-        if cls._project_settings is None:
-            cls._project_settings = get_project_settings(cls.project_name())
-        return cls._project_settings
-
-    @classmethod
-    def sitesync_addon(cls):
-        if not cls._sitesync_addon_discovered:
-            cls._sitesync_addon_discovered = True
-            cls._sitesync_addon = AddonsManager().get("sitesync")
-        return cls._sitesync_addon
-
-    @classmethod
-    def mapping(cls):
-        return cls._mapping
-
-    @classmethod
-    def set_mapping(cls, mapping):
-        cls._mapping = mapping
-
-
-def dirmap_file_name_filter(file_name):
-    """Nuke callback function with single full path argument.
-
-        Checks project settings for potential mapping from source to dest.
-    """
-
-    dirmap_processor = NukeDirmap(
-        file_name,
-        "nuke",
-        DirmapCache.project_name(),
-        DirmapCache.project_settings(),
-        DirmapCache.sitesync_addon(),
-    )
-    if not DirmapCache.mapping():
-        DirmapCache.set_mapping(dirmap_processor.get_mappings())
-
-    dirmap_processor.process_dirmap(DirmapCache.mapping())
-    if os.path.exists(dirmap_processor.file_name):
-        return dirmap_processor.file_name
-    return file_name
-
-
 @contextlib.contextmanager
 def node_tempfile():
     """Create a temp file where node is pasted during duplication.
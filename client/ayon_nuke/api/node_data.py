@@ -0,0 +1,251 @@
+"""Read and write node data stored in hidden knobs.
+
+Data are encoded with node data codecs (see `ayon_nuke.node_data_codec`)
+and decoded values are cached by raw knob value. Module imports only
+`nuke`, so it can be used by light weight modules like `scene_registry`.
+"""
+import logging
+import contextlib
+from collections import OrderedDict
+from types import MappingProxyType
+
+import nuke
+
+from ayon_nuke.node_data_codec import (
+    AVALON_KNOB_PREFIXES,
+    encode_node_data,
+    freeze_node_data,
+    get_node_data_cache,
+    thaw_node_data,
+)
+
+log = logging.getLogger(__name__)
+
+EXCLUDED_KNOB_CLASS_ON_READ = (
+    "Tab_Knob",
+    "Text_Knob",  # But for backward compatibility, still be read
+                  #  if value is not an empty string.
+)
+
+
+class NodeDataTransaction:
+    """Node data writes collected in memory.
+
+    Writes done by `set_node_data` and `update_node_data` while
+    a transaction is active are merged per node and knob, and each knob is
+    written only once when the transaction ends.
+    Use `node_data_transaction` context manager to open a transaction.
+    """
+    active = None
+
+    def __init__(self):
+        self._pending = OrderedDict()
+
+    def update(self, node, knob_name, data):
+        key = (node, knob_name)
+        node_data = self._pending.get(key)
+        if node_data is None:
+            node_data = get_node_data(node, knob_name)
+            self._pending[key] = node_data
+        node_data.update(data)
+
+    def get(self, node, knob_name):
+        return self._pending.get((node, knob_name))
+
+    def flush(self):
+        pending = self._pending
+        self._pending = OrderedDict()
+        for (node, knob_name), node_data in pending.items():
+            # in case node is not existing anymore
+            try:
+                node.fullName()
+            except ValueError:
+                continue
+            _write_node_data(node, knob_name, node_data)
+
+    def discard(self):
+        self._pending = OrderedDict()
+
+
+@contextlib.contextmanager
+def node_data_transaction(undo_name="Update node data"):
+    """Merge node data writes and flush them once at the end.
+
+    Nested transactions are joined into the outermost one. Pending data are
+    written inside single undo chunk when the outermost transaction
+    finishes without error, on exception they are discarded so nodes are
+    not left with part of the changes.
+
+    Args:
+        undo_name (Optional[str]): Name of the undo chunk.
+
+    Examples:
+        >>> with node_data_transaction():
+        ...     for node in nodes:
+        ...         set_node_data(node, INSTANCE_DATA_KNOB, {"active": True})
+    """
+    from .command import undo_chunk
+
+    if NodeDataTransaction.active is not None:
+        yield NodeDataTransaction.active
+        return
+
+    transaction = NodeDataTransaction()
+    NodeDataTransaction.active = transaction
+    try:
+        yield transaction
+    except BaseException:
+        transaction.discard()
+        raise
+    finally:
+        NodeDataTransaction.active = None
+    with undo_chunk(undo_name):
+        transaction.flush()
+
+
+def set_node_data(node, knob_name, data):
+    """Write data to an invisible node knob.
+
+    Will create a new one if it doesn't exist,
+    or update the one already created. Data are encoded with default
+    node data codec (see `node_data_codec`).
+
+    Args:
+        node (nuke.Node): node object
+        knob_name (str): knob name
+        data (dict): data to be stored in knob
+    """
+    if NodeDataTransaction.active is not None:
+        NodeDataTransaction.active.update(node, knob_name, data)
+        return
+
+    # if exists then update data
+    if knob_name in node.knobs():
+        update_node_data(node, knob_name, data)
+        return
+
+    # else create new
+    _write_node_data(node, knob_name, data)
+
+
+def _write_node_data(node, knob_name, data):
+    from .scene_registry import mark_node_dirty
+
+    knob_value = encode_node_data(data)
+    knob = node.knobs().get(knob_name)
+    if knob is None:
+        knob = nuke.String_Knob(knob_name)
+        knob.setValue(knob_value)
+        knob.setFlag(nuke.INVISIBLE)
+        node.addKnob(knob)
+    else:
+        knob.setValue(knob_value)
+    mark_node_dirty(node)
+
+
+def get_node_data(node, knob_name):
+    """Read data from node.
+
+    Decoded data are cached by raw knob value, returned dictionary is
+    a copy which can be freely modified.
+
+    Args:
+        node (nuke.Node): node object
+        knob_name (str): knob name
+
+    Returns:
+        dict: data stored in knob
+    """
+    data = get_node_data_view(node, knob_name)
+    if not data:
+        return {}
+    return thaw_node_data(data)
+
+
+def get_node_data_view(node, knob_name):
+    """Read data from node as read-only mapping.
+
+    Faster alternative of `get_node_data` for callers which only read
+    the data. Nested dictionaries are read-only mappings and lists are
+    converted to tuples. Data pending in active `node_data_transaction`
+    are returned if there are any.
+
+    Args:
+        node (nuke.Node): node object
+        knob_name (str): knob name
+
+    Returns:
+        Mapping: read-only data stored in knob
+    """
+    if NodeDataTransaction.active is not None:
+        pending_data = NodeDataTransaction.active.get(node, knob_name)
+        if pending_data is not None:
+            return freeze_node_data(pending_data)
+
+    knob = node.knobs().get(knob_name)
+    if knob is None:
+        return MappingProxyType({})
+
+    data = get_node_data_cache().get(knob.getValue())
+    if data is None:
+        return MappingProxyType({})
+    return data
+
+
+def update_node_data(node, knob_name, data):
+    """Update already present data.
+
+    Args:
+        node (nuke.Node): node object
+        knob_name (str): knob name
+        data (dict): data to update knob value
+    """
+    if NodeDataTransaction.active is not None:
+        NodeDataTransaction.active.update(node, knob_name, data)
+        return
+
+    node_data = get_node_data(node, knob_name)
+    node_data.update(data)
+    _write_node_data(node, knob_name, node_data)
+
+
+def read_avalon_data(node):
+    """Return user-defined knobs from given `node`
+
+    Only knobs with `avalon:` or `ak:` prefix are read, so nodes without
+    any such knob are skipped without touching the rest of their knobs.
+
+    Args:
+        node (nuke.Node): Nuke node object
+
+    Returns:
+        dict: Values of prefixed knobs by name without prefix.
+
+    """
+    data = dict()
+    prefixed_knobs = [
+        (knob_name, knob)
+        for knob_name, knob in node.knobs().items()
+        if knob_name.startswith(AVALON_KNOB_PREFIXES)
+    ]
+    if not prefixed_knobs:
+        return data
+
+    for knob_name, knob in prefixed_knobs:
+        try:
+            knob_class = knob.Class()
+            value = knob.value()
+        except Exception:
+            log.debug(
+                f"Error in knob {knob_name}, node {node['name'].value()}")
+            continue
+        if (
+            knob_class not in EXCLUDED_KNOB_CLASS_ON_READ or
+            # For compating read-only string data that imprinted
+            # by `nuke.Text_Knob`.
+            (knob_class == "Text_Knob" and value)
+        ):
+            key = knob_name.split(":", 1)[1]
+            data[key] = value
+
+    return data
@@ -1,6 +1,7 @@
 import nuke
 
 import os
+import time
 import importlib
 from collections import OrderedDict, defaultdict
 
@@ -33,12 +34,6 @@ from ayon_core.pipeline import (
 from ayon_core.pipeline.workfile import BuildWorkfile
 from ayon_nuke import NUKE_ROOT_DIR
 
-# Function 'get_current_project_settings' was moved in ayon-core 1.5.1
-try:
-    from ayon_core.pipeline.context_tools import get_current_project_settings
-except ImportError:
-    from ayon_core.settings import get_current_project_settings
-
 # Function 'save_next_version' was introduced in ayon-core 1.5.0
 try:
     from ayon_core.pipeline.workfile import save_next_version
@@ -49,17 +44,16 @@ except ImportError:
 
 from .lib import (
     Context,
+    ContextEntityCache,
     ROOT_DATA_KNOB,
     INSTANCE_DATA_KNOB,
     get_main_window,
     WorkfileSettings,
     start_workfile_template_builder,
     launch_workfiles_app,
-    check_inventory_versions,
     set_avalon_knob_data,
     read_avalon_data,
     prompt_reset_context,
-    dirmap_file_name_filter,
     add_scripts_menu,
     add_scripts_gizmo,
     get_node_data,
@@ -81,7 +75,24 @@ from .workio import (
     current_file
 )
 from .constants import ASSIST
+from .dirmap import dirmap_file_name_filter
+from . import inventory_versions
+from .inventory_versions import (
+    apply_cached_inventory_versions,
+    refresh_inventory_versions,
+)
 from . import push_to_project
+from . import scene_registry
+from .instrumentation import (
+    Instrumentation,
+    instrument,
+    add_menu_command,
+    show_performance_report,
+)
+from .settings import (
+    get_project_settings_view,
+    invalidate_project_settings,
+)
 
 log = Logger.get_logger(__name__)
 
@@ -102,6 +113,7 @@ class NukeHost(
 ):
     name = "nuke"
     about_to_save = False
+    _save_start = None
 
     def get_app_information(self):
         return ApplicationInformation(
@@ -143,14 +155,16 @@ class NukeHost(
         register_workfile_build_plugin_path(WORKFILE_BUILD_PATH)
 
         # Register AYON event for workfiles loading.
-        register_event_callback("workio.open_file", check_inventory_versions)
+        register_event_callback(
+            "workio.open_file", refresh_inventory_versions
+        )
 
     def setup_ui_callbacks_and_menu(self):
         """Setup AYON menus."""
         if not nuke.GUI:
             raise RuntimeError("Cannot set up in non-GUI mode.")
 
-        project_settings = get_current_project_settings()
+        project_settings = get_project_settings_view()
         add_nuke_callbacks(project_settings)
         _install_menu(project_settings)
 
@@ -181,6 +195,7 @@ class NukeHost(
         """
         super()._before_workfile_save(save_workfile_context)
         self.about_to_save = True
+        self._save_start = time.perf_counter()
 
     def _after_workfile_save(
         self, save_workfile_context: SaveWorkfileContext
@@ -196,6 +211,11 @@ class NukeHost(
         """
         super()._after_workfile_save(save_workfile_context)
         self.about_to_save = False
+        if Instrumentation.enabled and self._save_start is not None:
+            Instrumentation.record(
+                "workfile_save", time.perf_counter() - self._save_start
+            )
+        self._save_start = None
 
     def _after_context_change(self, context_change_data: ContextChangeData):
         """After context is changed.
@@ -208,6 +228,8 @@ class NukeHost(
 
         """
         super()._after_context_change(context_change_data)
+        ContextEntityCache.clear()
+        invalidate_project_settings()
 
         if not nuke.GUI:
             return
@@ -222,24 +244,52 @@ class NukeHost(
 def add_nuke_callbacks(project_settings: dict = None):
     """Adding all available nuke callbacks"""
     if project_settings is None:
-        project_settings = get_current_project_settings()
+        project_settings = get_project_settings_view()
 
     nuke_settings = project_settings["nuke"]
 
     # Set all workfile settings.'
-    nuke.addOnCreate(on_root_create, nodeClass="Root")
+    nuke.addOnCreate(
+        instrument("on_root_create", on_root_create), nodeClass="Root"
+    )
     # set checker for last versions on loaded containers
-    nuke.addOnScriptLoad(check_inventory_versions)
+    nuke.addOnScriptLoad(
+        instrument("refresh_inventory_versions", refresh_inventory_versions)
+    )
     # fix ffmpeg settings on script
-    nuke.addOnScriptLoad(on_script_load)
+    nuke.addOnScriptLoad(instrument("on_script_load", on_script_load))
 
     # set checker for last versions on loaded containers
-    nuke.addOnScriptSave(check_inventory_versions)
+    # - only known colors are applied so they are part of the saved
+    #   script and the save does not wait for the server
+    nuke.addOnScriptSave(
+        instrument(
+            "apply_cached_inventory_versions",
+            apply_cached_inventory_versions
+        )
+    )
+    # query version state again when container representation changes
+    nuke.addKnobChanged(
+        instrument(
+            "inventory_versions.on_knob_changed",
+            inventory_versions.on_knob_changed
+        )
+    )
+
+    # keep index of instances and containers up to date
+    scene_registry.install_callbacks()
 
     if nuke_settings["dirmap"]["enabled"]:
         log.info("Added Nuke's dir-mapping callback ...")
         # Add dirmap for file paths.
-        nuke.addFilenameFilter(dirmap_file_name_filter)
+        nuke.addFilenameFilter(
+            instrument("dirmap_file_name_filter", dirmap_file_name_filter)
+        )
+
+    if Instrumentation.enabled:
+        nuke.addOnScriptClose(
+            lambda: Instrumentation.write_report("script_close")
+        )
 
     log.info("Added Nuke callbacks ...")
 
@@ -305,6 +355,8 @@ def reload_config():
     CAUTION: This is primarily for development and debugging purposes.
 
     """
+    invalidate_project_settings()
+    ContextEntityCache.clear()
 
     for module in (
         "ayon_nuke.api.actions",
@@ -363,7 +415,8 @@ def _install_menu(project_settings: dict):
         shortcut_str: str = project_settings["nuke"]["general"].get(
             "menu", {}
         ).get("version_up_workfile", "")
-        menu.addCommand(
+        add_menu_command(
+            menu,
             "Version Up Workfile",
             lambda: save_next_version(),
             shortcut_str
@@ -376,7 +429,8 @@ def _install_menu(project_settings: dict):
         # - it is possible to explicitly change on top flag of the tool
         host_tools.show_workfiles(parent=None, on_top=False)
 
-    menu.addCommand(
+    add_menu_command(
+        menu,
         "Work Files...",
         _show_workfiles
     )
@@ -385,7 +439,8 @@ def _install_menu(project_settings: dict):
     if not ASSIST:
         # only add parent if nuke version is 14 or higher
         # known issue with no solution yet
-        menu.addCommand(
+        add_menu_command(
+            menu,
             "Create...",
             lambda: host_tools.show_publisher(
                 parent=main_window,
@@ -394,7 +449,8 @@ def _install_menu(project_settings: dict):
         )
         # only add parent if nuke version is 14 or higher
         # known issue with no solution yet
-        menu.addCommand(
+        add_menu_command(
+            menu,
             "Publish...",
             lambda: host_tools.show_publisher(
                 parent=main_window,
@@ -402,75 +458,90 @@ def _install_menu(project_settings: dict):
             )
         )
 
-    menu.addCommand(
+    add_menu_command(
+        menu,
         "Load...",
         lambda: host_tools.show_loader(
             parent=main_window,
             use_context=True
         )
     )
-    menu.addCommand(
+    add_menu_command(
+        menu,
         "Manage...",
         lambda: host_tools.show_scene_inventory(parent=main_window)
     )
     menu.addSeparator()
-    menu.addCommand(
+    add_menu_command(
+        menu,
         "Set Resolution",
         lambda: WorkfileSettings().reset_resolution()
     )
-    menu.addCommand(
+    add_menu_command(
+        menu,
         "Set Frame Range",
         lambda: WorkfileSettings().reset_frame_range_handles()
     )
-    menu.addCommand(
+    add_menu_command(
+        menu,
         "Set Colorspace",
         lambda: WorkfileSettings().set_colorspace()
     )
-    menu.addCommand(
+    add_menu_command(
+        menu,
         "Apply All Settings",
         lambda: WorkfileSettings().set_context_settings()
     )
 
     menu.addSeparator()
-    menu.addCommand(
+    add_menu_command(
+        menu,
         "Build Workfile",
         lambda: BuildWorkfile().process()
     )
 
     menu_template = menu.addMenu("Template Builder")
-    menu_template.addCommand(
+    add_menu_command(
+        menu_template,
         "Build Workfile from template",
         lambda: build_workfile_template()
     )
 
     if not ASSIST:
         menu_template.addSeparator()
-        menu_template.addCommand(
+        add_menu_command(
+            menu_template,
             "Open template",
             lambda: open_template_ui(
                 NukeTemplateBuilder(registered_host()), get_main_window()
             )
         )
-        menu_template.addCommand(
+        add_menu_command(
+            menu_template,
             "Create Place Holder",
             lambda: create_placeholder()
         )
-        menu_template.addCommand(
+        add_menu_command(
+            menu_template,
             "Update Place Holder",
             lambda: update_placeholder()
         )
 
-    menu.addCommand(
+    add_menu_command(
+        menu,
         "Push to Project",
         lambda: push_to_project.main()
     )
 
     menu.addSeparator()
-    menu.addCommand(
+    add_menu_command(
+        menu,
         "Experimental tools...",
         lambda: host_tools.show_experimental_tools_dialog(parent=main_window)
     )
     menu.addSeparator()
+    if Instrumentation.enabled:
+        menu.addCommand("Performance report", show_performance_report)
     # add reload pipeline only in debug mode
     if bool(os.getenv("NUKE_DEBUG")):
         menu.addSeparator()
@@ -642,9 +713,7 @@ def ls():
     need to implement a for-loop that then *yields* one Container at
     a time.
     """
-    all_nodes = nuke.allNodes(recurseGroups=True)
-
-    nodes = [n for n in all_nodes]
+    nodes = scene_registry.get_scene_registry().get_avalon_nodes()
 
     for n in nodes:
         container = parse_container(n)
@@ -667,7 +736,10 @@ def list_instances(creator_id=None):
     product_instances = []
     instance_ids = set()
 
-    for node in nuke.allNodes(recurseGroups=True):
+    instance_nodes = scene_registry.get_scene_registry().get_instance_nodes(
+        creator_id
+    )
+    for node in instance_nodes:
 
         if node.Class() in ["Viewer", "Dot"]:
             continue
@@ -6,10 +6,10 @@ import copy
 import pathlib
 import random
 import string
+import weakref
 from collections import defaultdict
 
 import ayon_api
-from ayon_core.settings import get_current_project_settings
 from ayon_core.lib import (
     BoolDef,
     EnumDef
@@ -40,7 +40,8 @@ from .lib import (
     get_avalon_knob_data,
     set_node_knobs_from_settings,
     set_node_data,
-    get_node_data,
+    get_node_data_view,
+    node_data_transaction,
     get_view_process_node,
     get_filenames_without_hash,
     get_work_default_directory,
@@ -54,6 +55,15 @@ from .pipeline import (
     containerise,
     update_container,
 )
+from .scene_registry import (
+    CONTAINER_ID_KNOB,
+    get_scene_registry,
+    mark_node_dirty,
+)
+from .settings import (
+    get_project_settings_view,
+    get_project_settings_copy,
+)
 from .command import undo_chunk
 from .colorspace import (
     get_formatted_display_and_view_as_dict,
@@ -70,9 +80,82 @@ def _collect_and_cache_nodes(creator):
             identifier = instance_data["creator_identifier"]
             instances_by_identifier[identifier].append(item)
         creator.collection_shared_data[key] = instances_by_identifier
+
+        # Shared data are available only during collection, index is
+        #   stored by create context to be used on instance creation
+        _product_type_indexes[creator.create_context] = (
+            ProductTypeIndex.from_scene()
+        )
     return creator.collection_shared_data[key]
 
 
+def _get_product_base_type(data):
+    return data.get("productBaseType") or data.get("productType")
+
+
+class ProductTypeIndex:
+    """Instance nodes by product (base) type.
+
+    Used to check uniqueness of new instances without reading data of all
+    instance nodes in the script. Index is built once during collection
+    and updated when instances are added to or removed from create context.
+    """
+
+    def __init__(self):
+        self._nodes_by_product_type = defaultdict(dict)
+        self._product_type_by_node = {}
+
+    @classmethod
+    def from_scene(cls):
+        index = cls()
+        for node in get_scene_registry().get_instance_nodes():
+            node_data = get_node_data_view(node, INSTANCE_DATA_KNOB)
+            if node_data:
+                index.add(node, _get_product_base_type(node_data))
+        return index
+
+    def add(self, node, product_type):
+        self.remove(node)
+        if not product_type:
+            return
+        self._nodes_by_product_type[product_type][node] = None
+        self._product_type_by_node[node] = product_type
+
+    def remove(self, node):
+        product_type = self._product_type_by_node.pop(node, None)
+        if product_type is None:
+            return
+        nodes = self._nodes_by_product_type[product_type]
+        nodes.pop(node, None)
+        if not nodes:
+            self._nodes_by_product_type.pop(product_type)
+
+    def has_product_type(self, product_type):
+        """Product type is used by an existing instance node."""
+        for node in list(self._nodes_by_product_type.get(product_type, ())):
+            try:
+                node.fullName()
+            except ValueError:
+                # node was erased
+                self.remove(node)
+                continue
+            return True
+        return False
+
+
+# Product type index of create context
+_product_type_indexes = weakref.WeakKeyDictionary()
+
+
+def _get_product_type_index(creator):
+    create_context = creator.create_context
+    index = _product_type_indexes.get(create_context)
+    if index is None:
+        index = ProductTypeIndex.from_scene()
+        _product_type_indexes[create_context] = index
+    return index
+
+
 class NukeCreatorError(CreatorError):
     pass
 
@@ -99,36 +182,37 @@ class NukeCreator(Creator):
     def check_existing_product(self, product_name):
         """Make sure product name is unique.
 
-        It search within all nodes recursively
-        and checks if product name is found in
-        any node having instance data knob.
+        It search within all nodes having instance data knob
+        and checks if product name is found in any of them. Nodes are
+        looked up in index shared by create context.
 
         Arguments:
             product_name (str): Product name
         """
 
-        for node in nuke.allNodes(recurseGroups=True):
-            # make sure testing node is having instance knob
-            if INSTANCE_DATA_KNOB not in node.knobs().keys():
-                continue
-            node_data = get_node_data(node, INSTANCE_DATA_KNOB)
+        # QUESTION what is this logic? Why product name is compared
+        #   against product type?
+        # test if product name is matching
+        if _get_product_type_index(self).has_product_type(product_name):
+            raise NukeCreatorError(
+                f"A publish instance for '{product_name}' already exists"
+                " in nodes! Please change the variant name to ensure"
+                " unique output."
+            )
 
-            if not node_data:
-                # a node has no instance data
-                continue
+    def _add_instance_to_context(self, instance):
+        super()._add_instance_to_context(instance)
+        node = instance.transient_data.get("node")
+        if node is not None:
+            _get_product_type_index(self).add(
+                node, _get_product_base_type(instance)
+            )
 
-            # QUESTION what is this logic? Why product name is compared
-            #   against product type?
-            # test if product name is matching
-            product_base_type = node_data.get("productBaseType")
-            if not product_base_type:
-                product_base_type = node_data.get("productType")
-            if product_base_type == product_name:
-                raise NukeCreatorError(
-                    f"A publish instance for '{product_name}' already exists"
-                    " in nodes! Please change the variant name to ensure"
-                    " unique output."
-                )
+    def _remove_instance_from_context(self, instance):
+        super()._remove_instance_from_context(instance)
+        node = instance.transient_data.get("node")
+        if node is not None:
+            _get_product_type_index(self).remove(node)
 
     def create_instance_node(
         self,
@@ -280,6 +364,11 @@ class NukeCreator(Creator):
                 created_instance["creator_attributes"].pop(key)
 
     def update_instances(self, update_list):
+        # write instance data of all nodes at once
+        with node_data_transaction("Update instances"):
+            self._update_instance_nodes(update_list)
+
+    def _update_instance_nodes(self, update_list):
         for created_inst, changes in update_list:
             instance_node = created_inst.transient_data["node"]
 
@@ -403,11 +492,12 @@ class NukeWriteCreator(NukeCreator):
         return selected_nodes
 
     def update_instances(self, update_list):
-        super().update_instances(update_list)
-        for created_inst, changes in update_list:
-            # ensure was not deleted by super()
-            if self.create_context.get_instance_by_id(created_inst.id):
-                self._update_write_node_filepath(created_inst, changes)
+        with node_data_transaction("Update write instances"):
+            super().update_instances(update_list)
+            for created_inst, changes in update_list:
+                # ensure was not deleted by super()
+                if self.create_context.get_instance_by_id(created_inst.id):
+                    self._update_write_node_filepath(created_inst, changes)
 
     def _update_write_node_filepath(self, created_inst, changes):
         """Update instance node on context changes.
@@ -607,7 +697,7 @@ def get_colorspace_from_node(node):
 
 
 def get_review_presets_config():
-    settings = get_current_project_settings()
+    settings = get_project_settings_view()
     review_profiles = (
         settings["core"]
         ["publish"]
@@ -623,12 +713,12 @@ def get_review_presets_config():
 
 
 def get_publish_config():
-    settings = get_current_project_settings()
+    settings = get_project_settings_copy()
     return settings["nuke"].get("publish", {})
 
 
 class NukeLoader(LoaderPlugin):
-    container_id_knob = "containerId"
+    container_id_knob = CONTAINER_ID_KNOB
     container_id = None
 
     def reset_container_id(self):
@@ -642,9 +732,13 @@ class NukeLoader(LoaderPlugin):
     def get_members(self, source):
         """Return nodes that has same "containerId" as `source`"""
         source_id = self.get_container_id(source)
-        return [node for node in nuke.allNodes(recurseGroups=True)
-                if self.get_container_id(node) == source_id
-                and node is not source] if source_id else []
+        if not source_id:
+            return []
+        return [
+            node
+            for node in get_scene_registry().get_member_nodes(source_id)
+            if node != source
+        ]
 
     def set_as_member(self, node):
         source_id = self.get_container_id(node)
@@ -662,14 +756,18 @@ class NukeLoader(LoaderPlugin):
                 ])
             knob = _knob.create(self.container_id_knob)
             node.addKnob(knob)
+        mark_node_dirty(node)
 
     def clear_members(self, parent_node):
         parent_class = parent_node.Class()
         members = self.get_members(parent_node)
 
         dependent_nodes = None
+        members_set = set(members)
         for node in members:
-            _depndc = [n for n in node.dependent() if n not in members]
+            _depndc = [
+                n for n in node.dependent() if n not in members_set
+            ]
             if not _depndc:
                 continue
 
@@ -1568,7 +1666,7 @@ def convert_to_valid_instaces():
         if node.Class() in ["Viewer", "Dot"]:
             continue
 
-        if get_node_data(node, INSTANCE_DATA_KNOB):
+        if get_node_data_view(node, INSTANCE_DATA_KNOB):
             continue
 
         # get data from avalon knob
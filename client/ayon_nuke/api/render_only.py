@@ -0,0 +1,56 @@
+"""Render-only install of the Nuke integration.
+
+Nuke started only to render frames, e.g. a farm render task, does not need
+publish, load and create plugins, menus, scene callbacks or inventory
+checks. In render-only mode the host is not installed and only the dirmap
+filename filter is registered (when enabled in settings). OCIO config of
+the script is stored on its root node and resolved with the environment of
+the render job, so it is used as is.
+
+Render-only mode is controlled by `AYON_NUKE_RENDER_ONLY` environment
+variable ("1" to enable, "0" to disable). When the variable is not set,
+the mode is enabled for Nuke without GUI started with `-x` or `-X`
+argument. Terminal mode (`-t`) alone keeps the full install because
+terminal scripts may publish.
+"""
+import os
+import sys
+
+import nuke
+
+from ayon_core.lib import Logger, env_value_to_bool
+
+log = Logger.get_logger(__name__)
+
+RENDER_ONLY_ENV_KEY = "AYON_NUKE_RENDER_ONLY"
+RENDER_ARGS = {"-x", "-X"}
+
+
+def is_render_only_mode():
+    """Nuke was started only to render frames.
+
+    Returns:
+        bool: Render-only install should be used.
+    """
+    if os.getenv(RENDER_ONLY_ENV_KEY):
+        return env_value_to_bool(RENDER_ONLY_ENV_KEY, default=False)
+
+    if nuke.GUI:
+        return False
+
+    args = getattr(nuke, "rawArgs", None) or sys.argv
+    return any(arg in RENDER_ARGS for arg in args)
+
+
+def install_render_only():
+    """Register only what is needed to render frames."""
+    from .settings import get_project_settings_view
+
+    project_settings = get_project_settings_view()
+    if project_settings["nuke"]["dirmap"]["enabled"]:
+        from .dirmap import dirmap_file_name_filter
+
+        log.info("Added Nuke's dir-mapping callback ...")
+        nuke.addFilenameFilter(dirmap_file_name_filter)
+
+    log.info("AYON Nuke installed in render-only mode.")
@@ -0,0 +1,319 @@
+"""Incremental index of publish instances and containers in current script.
+
+Walking `nuke.allNodes(recurseGroups=True)` and reading knobs of every node
+is expensive on big scripts. The registry does that walk once and then keeps
+itself up to date through Nuke's `onCreate`, `onDestroy` and `knobChanged`
+callbacks (see `install_callbacks`), so repeated queries only touch nodes
+which are part of the result.
+
+When the callbacks are not installed (e.g. in terminal mode) the registry
+is rebuilt on every query, which matches the cost of a plain scene walk,
+unless the queries are wrapped in `SceneRegistry.batch`.
+"""
+import contextlib
+from collections import defaultdict
+
+import nuke
+
+from ayon_nuke.node_data_codec import (
+    AVALON_KNOB_PREFIXES,
+    INSTANCE_DATA_KNOB,
+)
+
+from .node_data import get_node_data_view
+
+CONTAINER_ID_KNOB = "containerId"
+
+
+def _is_node_alive(node):
+    """Return False if the python object points to an erased node."""
+    try:
+        node.fullName()
+    except ValueError:
+        return False
+    return True
+
+
+class SceneRegistry:
+    """Index of instance nodes, container nodes and container members.
+
+    Nodes are stored in insertion ordered dictionaries so the order of
+    returned nodes matches the order of `nuke.allNodes` for nodes which
+    existed at the time of the build.
+    """
+
+    def __init__(self):
+        self.tracking = False
+        self._batch_depth = 0
+        self._built = False
+        self._pending = {}
+        self._instance_nodes = {}
+        self._instance_nodes_by_creator = defaultdict(dict)
+        self._avalon_nodes = {}
+        self._avalon_nodes_by_representation = defaultdict(dict)
+        self._members_by_container_id = defaultdict(dict)
+        # node -> (creator identifier, representation id, container id)
+        self._node_keys = {}
+
+    def reset(self):
+        """Drop the index, it is rebuilt on next query."""
+        self._built = False
+        self._pending.clear()
+        self._instance_nodes.clear()
+        self._instance_nodes_by_creator.clear()
+        self._avalon_nodes.clear()
+        self._avalon_nodes_by_representation.clear()
+        self._members_by_container_id.clear()
+        self._node_keys.clear()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Reuse the index for all queries inside the context.
+
+        Without callbacks the index is otherwise rebuilt on every query.
+        Changes made inside the batch have to be reported with
+        `mark_dirty`, erased nodes are skipped automatically.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and not self.tracking:
+                self.reset()
+
+    def mark_dirty(self, node):
+        """Re-index node on next query.
+
+        Args:
+            node (nuke.Node): Node which was created or its data changed.
+        """
+        if self._built and node is not None:
+            self._pending[node] = None
+
+    def discard(self, node):
+        """Remove node from the index.
+
+        Args:
+            node (nuke.Node): Node which is about to be erased.
+        """
+        if not self._built or node is None:
+            return
+        self._pending.pop(node, None)
+        self._remove_node(node)
+
+    def get_instance_nodes(self, creator_id=None):
+        """Nodes with instance data knob.
+
+        Args:
+            creator_id (Optional[str]): Return only nodes created by
+                creator with this identifier.
+
+        Returns:
+            list[nuke.Node]: Instance nodes.
+        """
+        self._ensure_up_to_date()
+        if creator_id is None:
+            nodes = self._instance_nodes
+        else:
+            nodes = self._instance_nodes_by_creator.get(creator_id, {})
+        return self._alive_nodes(nodes)
+
+    def get_avalon_nodes(self):
+        """Nodes with `avalon:` or `ak:` prefixed knobs.
+
+        These are containers and legacy instance nodes.
+
+        Returns:
+            list[nuke.Node]: Nodes with imprinted avalon data.
+        """
+        self._ensure_up_to_date()
+        return self._alive_nodes(self._avalon_nodes)
+
+    def get_container_nodes(self, representation_id):
+        """Container nodes loaded from representation.
+
+        Args:
+            representation_id (str): Representation id.
+
+        Returns:
+            list[nuke.Node]: Container nodes.
+        """
+        self._ensure_up_to_date()
+        return self._alive_nodes(
+            self._avalon_nodes_by_representation.get(representation_id, {})
+        )
+
+    def get_member_nodes(self, container_id):
+        """Nodes sharing the same `containerId` knob value.
+
+        Args:
+            container_id (str): Value of `containerId` knob.
+
+        Returns:
+            list[nuke.Node]: Member nodes.
+        """
+        self._ensure_up_to_date()
+        return self._alive_nodes(
+            self._members_by_container_id.get(container_id, {})
+        )
+
+    def _ensure_up_to_date(self):
+        if not self._built or not (self.tracking or self._batch_depth):
+            self.reset()
+            for node in nuke.allNodes(recurseGroups=True):
+                self._index_node(node)
+            self._built = True
+            return
+
+        if not self._pending:
+            return
+
+        pending = list(self._pending)
+        self._pending.clear()
+        for node in pending:
+            self._remove_node(node)
+            if _is_node_alive(node):
+                self._index_node(node)
+
+    def _alive_nodes(self, nodes):
+        output = []
+        for node in list(nodes):
+            if _is_node_alive(node):
+                output.append(node)
+            else:
+                self._remove_node(node)
+        return output
+
+    def _index_node(self, node):
+        knobs = node.knobs()
+        creator_id = representation_id = container_id = None
+        is_indexed = False
+
+        if INSTANCE_DATA_KNOB in knobs:
+            is_indexed = True
+            self._instance_nodes[node] = None
+            node_data = get_node_data_view(node, INSTANCE_DATA_KNOB)
+            creator_id = node_data.get("creator_identifier")
+            if creator_id:
+                self._instance_nodes_by_creator[creator_id][node] = None
+
+        if any(
+            knob_name.startswith(AVALON_KNOB_PREFIXES)
+            for knob_name in knobs
+        ):
+            is_indexed = True
+            self._avalon_nodes[node] = None
+            for prefix in AVALON_KNOB_PREFIXES:
+                knob = knobs.get(prefix + "representation")
+                if knob is not None:
+                    representation_id = knob.value()
+                    break
+            if representation_id:
+                self._avalon_nodes_by_representation[
+                    representation_id][node] = None
+
+        container_id_knob = knobs.get(CONTAINER_ID_KNOB)
+        if container_id_knob is not None:
+            container_id = container_id_knob.value()
+            if container_id:
+                is_indexed = True
+                self._members_by_container_id[container_id][node] = None
+
+        if is_indexed:
+            self._node_keys[node] = (
+                creator_id, representation_id, container_id
+            )
+
+    def _remove_node(self, node):
+        keys = self._node_keys.pop(node, None)
+        if keys is None:
+            return
+        creator_id, representation_id, container_id = keys
+        self._instance_nodes.pop(node, None)
+        self._avalon_nodes.pop(node, None)
+        for mapping, key in (
+            (self._instance_nodes_by_creator, creator_id),
+            (self._avalon_nodes_by_representation, representation_id),
+            (self._members_by_container_id, container_id),
+        ):
+            if not key or key not in mapping:
+                continue
+            mapping[key].pop(node, None)
+            if not mapping[key]:
+                mapping.pop(key)
+
+
+_scene_registry = SceneRegistry()
+
+
+def get_scene_registry():
+    """Scene registry of current Nuke session.
+
+    Returns:
+        SceneRegistry: Registry singleton.
+    """
+    return _scene_registry
+
+
+@contextlib.contextmanager
+def scene_registry_batch():
+    """Batch queries of the registry singleton (see `SceneRegistry.batch`).
+
+    Use as a decorator of loader entry points like `update` or `remove`,
+    so all queries of one container operation share one index.
+
+    Examples:
+        >>> @scene_registry_batch()
+        >>> def remove(self, container):
+        >>>    ...
+    """
+    with _scene_registry.batch() as registry:
+        yield registry
+
+
+def mark_node_dirty(node):
+    """Let the registry know node data changed."""
+    _scene_registry.mark_dirty(node)
+
+
+def on_node_create():
+    _scene_registry.mark_dirty(nuke.thisNode())
+
+
+def on_node_destroy():
+    _scene_registry.discard(nuke.thisNode())
+
+
+def on_knob_changed():
+    knob = nuke.thisKnob()
+    if knob is None:
+        return
+    knob_name = knob.name()
+    if (
+        knob_name in (INSTANCE_DATA_KNOB, CONTAINER_ID_KNOB)
+        or knob_name.startswith(AVALON_KNOB_PREFIXES)
+    ):
+        _scene_registry.mark_dirty(nuke.thisNode())
+
+
+def on_script_close():
+    _scene_registry.reset()
+
+
+def install_callbacks():
+    """Keep the registry up to date with Nuke callbacks."""
+    from .instrumentation import instrument
+
+    nuke.addOnCreate(instrument("registry.on_node_create", on_node_create))
+    nuke.addOnDestroy(
+        instrument("registry.on_node_destroy", on_node_destroy)
+    )
+    nuke.addKnobChanged(
+        instrument("registry.on_knob_changed", on_knob_changed)
+    )
+    nuke.addOnScriptClose(
+        instrument("registry.on_script_close", on_script_close)
+    )
+    _scene_registry.reset()
+    _scene_registry.tracking = True
@@ -0,0 +1,73 @@
+"""Project settings shared by the Nuke integration.
+
+Settings are loaded once per project and handed out as read-only views,
+so reading settings in the integration is a dictionary lookup. Cached
+settings are dropped with `invalidate_project_settings`, which is called on
+context change and on `reload_config`.
+"""
+from ayon_core.settings import get_project_settings
+from ayon_core.pipeline import get_current_project_name
+
+from ayon_nuke.node_data_codec import freeze_node_data, thaw_node_data
+
+
+class ProjectSettingsCache:
+    """Read-only project settings by project name."""
+    _settings_by_project = {}
+
+    @classmethod
+    def get(cls, project_name):
+        settings = cls._settings_by_project.get(project_name)
+        if settings is None:
+            settings = freeze_node_data(get_project_settings(project_name))
+            cls._settings_by_project[project_name] = settings
+        return settings
+
+    @classmethod
+    def invalidate(cls, project_name=None):
+        if project_name is None:
+            cls._settings_by_project.clear()
+        else:
+            cls._settings_by_project.pop(project_name, None)
+
+
+def get_project_settings_view(project_name=None):
+    """Read-only project settings.
+
+    Dictionaries are `MappingProxyType` and lists are tuples. Use
+    `get_project_settings_copy` when settings are passed to an api
+    which expects regular dictionaries.
+
+    Args:
+        project_name (Optional[str]): Project name. Current project is
+            used if not passed.
+
+    Returns:
+        MappingProxyType: Project settings.
+    """
+    if project_name is None:
+        project_name = get_current_project_name()
+    return ProjectSettingsCache.get(project_name)
+
+
+def get_project_settings_copy(project_name=None):
+    """Mutable copy of cached project settings.
+
+    Args:
+        project_name (Optional[str]): Project name. Current project is
+            used if not passed.
+
+    Returns:
+        dict[str, Any]: Project settings.
+    """
+    return thaw_node_data(get_project_settings_view(project_name))
+
+
+def invalidate_project_settings(project_name=None):
+    """Drop cached project settings.
+
+    Args:
+        project_name (Optional[str]): Invalidate only settings of the
+            project. All cached settings are dropped if not passed.
+    """
+    ProjectSettingsCache.invalidate(project_name)
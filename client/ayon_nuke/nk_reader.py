@@ -0,0 +1,460 @@
+"""Streaming reader of Nuke `.nk` scripts.
+
+Reads node definitions from `.nk` script without `nuke` module, e.g. for
+farm pre-checks or reports of published workfiles. The script is processed
+line by line and only requested knob values are kept, so memory usage does
+not grow with the size of the script (only node names stored in TCL stack
+variables are remembered to resolve node inputs).
+
+Example:
+    >>> from ayon_nuke.nk_reader import iter_nk_nodes
+    >>> for node in iter_nk_nodes("/path/to/script.nk"):
+    ...     instance_data = node.get_node_data()
+    ...     if instance_data:
+    ...         print(node.full_name, instance_data["productName"])
+"""
+import re
+
+from .node_data_codec import (
+    AVALON_KNOB_PREFIXES,
+    INSTANCE_DATA_KNOB,
+    ROOT_DATA_KNOB,
+    decode_node_data,
+)
+
+# Node classes which are always followed by their children and 'end_group'
+GROUP_NODE_CLASSES = {"Group", "LiveGroup"}
+
+TAB_KNOB_TYPE = 20
+TEXT_KNOB_TYPE = 26
+# User knobs with default value are not stored in script
+USER_KNOB_DEFAULTS = {
+    3: 0,  # Int Knob
+    6: False,  # Boolean Knob
+    7: 0.0,  # Double Knob
+}
+USER_KNOB_CONVERTORS = {
+    3: int,
+    6: lambda value: value in ("true", "1"),
+    7: float,
+}
+
+_SPECIAL_CHARS_REGEX = re.compile(r'[\\{}"]')
+_ESCAPE_REGEX = re.compile(r"\\(.)", re.DOTALL)
+_ESCAPED_CHARS = {"n": "\n", "t": "\t", "r": "\r"}
+_NODE_START_REGEX = re.compile(r"^(\S+(?: \S+)*) \{$")
+_STACK_INDEX_REGEX = re.compile(r"\[stack (\d+)\]")
+
+
+def _unescape(text):
+    if "\\" not in text:
+        return text
+    return _ESCAPE_REGEX.sub(
+        lambda match: _ESCAPED_CHARS.get(match.group(1), match.group(1)),
+        text
+    )
+
+
+def split_tcl_words(text):
+    """Split TCL command arguments into words.
+
+    Quoted words are unescaped and braced words are returned without
+    the outer braces.
+
+    Args:
+        text (str): Arguments string.
+
+    Returns:
+        list[str]: Words.
+    """
+    words = []
+    idx = 0
+    length = len(text)
+    while idx < length:
+        char = text[idx]
+        if char.isspace():
+            idx += 1
+            continue
+
+        end = idx
+        if char == '"':
+            end += 1
+            while end < length and text[end] != '"':
+                end += 2 if text[end] == "\\" else 1
+            words.append(_unescape(text[idx + 1:end]))
+
+        elif char == "{":
+            depth = 0
+            while end < length:
+                char = text[end]
+                if char == "\\":
+                    end += 2
+                    continue
+                if char == "{":
+                    depth += 1
+                elif char == "}":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                end += 1
+            words.append(text[idx + 1:end])
+
+        else:
+            while end < length and not text[end].isspace():
+                end += 2 if text[end] == "\\" else 1
+            words.append(_unescape(text[idx:end]))
+            # bare word does not have closing character
+            end -= 1
+
+        idx = end + 1
+    return words
+
+
+def parse_knob_value(text):
+    """Convert knob value from script to string.
+
+    Args:
+        text (str): Value part of knob line.
+
+    Returns:
+        str: Unescaped value or stripped text if value has multiple words.
+    """
+    text = text.strip()
+    words = split_tcl_words(text)
+    if len(words) == 1:
+        return words[0]
+    return text
+
+
+class NkNode:
+    """Node definition read from `.nk` script.
+
+    Attributes:
+        node_class (str): Node class.
+        name (str): Node name, 'root' for Root node.
+        group_path (str): Full name of parent group, empty for top level.
+        xpos (Optional[int]): Position in node graph.
+        ypos (Optional[int]): Position in node graph.
+        inputs (list[Optional[str]]): Full names of input nodes.
+        knobs (dict[str, str]): Collected knob values.
+    """
+
+    def __init__(self, node_class, group_path=""):
+        self.node_class = node_class
+        self.group_path = group_path
+        self.name = None
+        self.xpos = None
+        self.ypos = None
+        self.inputs = []
+        self.knobs = {}
+        self.input_count = 0 if node_class == "Root" else 1
+        self._user_knob_types = {}
+
+    def __repr__(self):
+        return "<{} {} '{}'>".format(
+            self.__class__.__name__, self.node_class, self.full_name
+        )
+
+    @property
+    def full_name(self):
+        if self.group_path:
+            return "{}.{}".format(self.group_path, self.name)
+        return self.name
+
+    def get_node_data(self, knob_name=INSTANCE_DATA_KNOB):
+        """Decode data stored by `set_node_data`.
+
+        Args:
+            knob_name (Optional[str]): Knob name.
+
+        Returns:
+            dict: Data stored in knob.
+        """
+        data = decode_node_data(self.knobs.get(knob_name))
+        if data is None:
+            return {}
+        return data
+
+    def read_avalon_data(self):
+        """Read data imprinted by legacy `set_avalon_knob_data`.
+
+        Same rules as `read_avalon_data` in Nuke are used. Tab knobs and
+        empty Text knobs are skipped.
+
+        Returns:
+            dict: Values of prefixed knobs by name without prefix.
+        """
+        data = {}
+        for knob_name, knob_type in self._user_knob_types.items():
+            if knob_type == TAB_KNOB_TYPE:
+                continue
+            value = self.knobs.get(knob_name)
+            if knob_type == TEXT_KNOB_TYPE and not value:
+                continue
+            if value is None:
+                value = USER_KNOB_DEFAULTS.get(knob_type, "")
+            else:
+                convertor = USER_KNOB_CONVERTORS.get(knob_type)
+                if convertor is not None:
+                    try:
+                        value = convertor(value)
+                    except ValueError:
+                        pass
+            data[knob_name.split(":", 1)[1]] = value
+        return data
+
+    def _add_user_knob(self, definition):
+        words = split_tcl_words(definition)
+        if len(words) < 2 or not words[1].startswith(AVALON_KNOB_PREFIXES):
+            return
+        try:
+            knob_type = int(words[0])
+        except ValueError:
+            return
+        knob_name = words[1]
+        self._user_knob_types[knob_name] = knob_type
+        if knob_type == TEXT_KNOB_TYPE and "T" in words[2:]:
+            value_idx = words.index("T", 2) + 1
+            if value_idx < len(words):
+                self.knobs[knob_name] = words[value_idx]
+
+
+class _BalanceState:
+    """Track open braces and quotes across lines."""
+
+    def __init__(self):
+        self.depth = 0
+        self.in_quote = False
+
+    @property
+    def balanced(self):
+        return self.depth == 0 and not self.in_quote
+
+    def reset(self):
+        self.depth = 0
+        self.in_quote = False
+
+    def feed(self, line):
+        escaped_pos = -1
+        for match in _SPECIAL_CHARS_REGEX.finditer(line):
+            pos = match.start()
+            if pos == escaped_pos:
+                continue
+            char = match.group()
+            if char == "\\":
+                escaped_pos = pos + 1
+            elif char == '"':
+                # quotes are literal characters inside braces
+                if self.depth == 0:
+                    self.in_quote = not self.in_quote
+            elif self.in_quote:
+                continue
+            elif char == "{":
+                self.depth += 1
+            elif self.depth > 0:
+                self.depth -= 1
+
+
+class NkScriptParser:
+    """Parse `.nk` script lines into `NkNode` objects.
+
+    Node inputs are resolved from the TCL stack commands (`push`, `set`)
+    the same way Nuke does, first popped node being input 0.
+
+    Args:
+        knob_names (Optional[Iterable[str]]): Names of knobs which values
+            should be collected. Values of AYON data knobs are collected
+            always.
+    """
+
+    def __init__(self, knob_names=None):
+        self._knob_names = set(knob_names or [])
+        self._knob_names.update({INSTANCE_DATA_KNOB, ROOT_DATA_KNOB})
+        self._state = _BalanceState()
+        self._buffer = []
+        self._buffer_indent = 0
+        self._stack = []
+        self._variables = {}
+        # (outer stack, outer group path)
+        self._scopes = []
+        self._group_path = ""
+        self._node = None
+        self._node_indent = 0
+        self._closed_node = None
+        self._closed_indent = 0
+
+    def parse(self, lines):
+        """Parse script lines.
+
+        Args:
+            lines (Iterable[str]): Script lines, e.g. opened file.
+
+        Yields:
+            NkNode: Nodes in order of script.
+        """
+        state = self._state
+        for line in lines:
+            if self._buffer:
+                self._buffer.append(line)
+                state.feed(line)
+                if not state.balanced:
+                    continue
+                statement = "".join(self._buffer).strip()
+                indent = self._buffer_indent
+                self._buffer = []
+            else:
+                statement = line.strip()
+                if not statement:
+                    continue
+                indent = len(line) - len(line.lstrip(" "))
+                state.feed(line)
+                if (
+                    self._node is None
+                    and state.depth == 1
+                    and not state.in_quote
+                ):
+                    match = _NODE_START_REGEX.match(statement)
+                    if match:
+                        state.reset()
+                        self._start_node(match.group(1), indent)
+                        continue
+
+                if not state.balanced:
+                    self._buffer.append(line)
+                    self._buffer_indent = indent
+                    continue
+
+            if self._node is not None:
+                node = self._process_knob(statement)
+                if node is not None:
+                    yield node
+            else:
+                self._process_command(statement, indent)
+
+    def _resolve_closed_node(self, indent):
+        """Push last closed node to stack or enter its group."""
+        node = self._closed_node
+        if node is None:
+            return
+        self._closed_node = None
+        if (
+            node.node_class in GROUP_NODE_CLASSES
+            or indent > self._closed_indent
+        ):
+            self._scopes.append((self._stack, self._group_path))
+            self._stack = []
+            self._group_path = node.full_name
+        else:
+            self._stack.append(node.full_name)
+
+    def _start_node(self, header, indent):
+        self._resolve_closed_node(indent)
+        words = header.split()
+        node_class = words[-1]
+        if words[0] == "clone" and node_class.startswith("$"):
+            node_class = "clone"
+        self._node = NkNode(node_class, self._group_path)
+        self._node_indent = indent
+
+    def _process_knob(self, statement):
+        node = self._node
+        if statement == "}":
+            return self._close_node()
+
+        knob_name, _, value = statement.partition(" ")
+        if knob_name == "name":
+            value = parse_knob_value(value)
+            if node.node_class == "Root":
+                node.knobs["name"] = value
+            else:
+                node.name = value
+        elif knob_name in ("xpos", "ypos"):
+            try:
+                setattr(node, knob_name, int(float(value)))
+            except ValueError:
+                pass
+        elif knob_name == "inputs":
+            try:
+                node.input_count = sum(
+                    int(count) for count in value.split("+")
+                )
+            except ValueError:
+                pass
+        elif knob_name == "addUserKnob":
+            node._add_user_knob(parse_knob_value(value))
+        elif (
+            knob_name in self._knob_names
+            or knob_name.startswith(AVALON_KNOB_PREFIXES)
+        ):
+            node.knobs[knob_name] = parse_knob_value(value)
+        return None
+
+    def _close_node(self):
+        node = self._node
+        self._node = None
+        if node.node_class == "Root":
+            node.name = "root"
+            return node
+
+        stack = self._stack
+        node.inputs = [
+            stack.pop() if stack else None
+            for _ in range(node.input_count)
+        ]
+        self._closed_node = node
+        self._closed_indent = self._node_indent
+        return node
+
+    def _process_command(self, statement, indent):
+        self._resolve_closed_node(indent)
+        words = statement.split(None, 2)
+        command = words[0]
+        if command == "push" and len(words) > 1:
+            argument = words[1]
+            if argument.startswith("$"):
+                self._stack.append(self._variables.get(argument[1:]))
+            else:
+                self._stack.append(None)
+
+        elif command == "set" and len(words) > 2:
+            match = _STACK_INDEX_REGEX.search(words[2])
+            if match:
+                index = int(match.group(1)) + 1
+                stack = self._stack
+                self._variables[words[1]] = (
+                    stack[-index] if len(stack) >= index else None
+                )
+
+        elif command == "end_group" and self._scopes:
+            group_name = self._group_path
+            self._stack, self._group_path = self._scopes.pop()
+            self._stack.append(group_name)
+
+
+def iter_nk_lines(lines, knob_names=None):
+    """Iterate nodes defined in script lines.
+
+    Args:
+        lines (Iterable[str]): Script lines.
+        knob_names (Optional[Iterable[str]]): Names of knobs which values
+            should be collected.
+
+    Yields:
+        NkNode: Nodes in order of script.
+    """
+    yield from NkScriptParser(knob_names).parse(lines)
+
+
+def iter_nk_nodes(filepath, knob_names=None):
+    """Iterate nodes defined in `.nk` script file.
+
+    Args:
+        filepath (str): Path to script.
+        knob_names (Optional[Iterable[str]]): Names of knobs which values
+            should be collected.
+
+    Yields:
+        NkNode: Nodes in order of script.
+    """
+    with open(filepath, "r", encoding="utf-8", errors="replace") as stream:
+        yield from iter_nk_lines(stream, knob_names)
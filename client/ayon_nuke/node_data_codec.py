@@ -0,0 +1,312 @@
+"""Codecs used to store AYON data in node knobs.
+
+Data are stored as a string prefixed with codec identifier so any reader can
+pick the matching codec. Plain JSON is the default because it stays human
+readable in `.nk` files. The compact codec compresses the JSON payload with
+zlib and stores it base64 encoded, which makes both the script size and the
+parse time smaller for instance heavy scripts.
+
+Default codec used for writing can be changed with
+`AYON_NUKE_NODE_DATA_CODEC` environment variable (`json` or `zjson`).
+
+This module does not depend on `nuke` so it can be used to decode data
+outside of Nuke (see `nk_reader`).
+"""
+import os
+import abc
+import json
+import zlib
+import base64
+import binascii
+from types import MappingProxyType
+from collections import OrderedDict
+
+NODE_DATA_CODEC_ENV = "AYON_NUKE_NODE_DATA_CODEC"
+DEFAULT_CODEC_NAME = "json"
+
+ROOT_DATA_KNOB = "publish_context"
+INSTANCE_DATA_KNOB = "publish_instance"
+# Prefixes of knobs imprinted by legacy `set_avalon_knob_data`
+AVALON_KNOB_PREFIXES = ("avalon:", "ak:")
+
+
+class NodeDataCodec(abc.ABC):
+    """Base class of node data codec.
+
+    Attributes:
+        name (str): Name used to choose codec for writing.
+        prefix (str): Prefix of encoded string identifying the codec and
+            version of the payload format.
+    """
+    name = None
+    prefix = None
+
+    @abc.abstractmethod
+    def encode(self, data):
+        """Encode data to string stored in knob without prefix.
+
+        Args:
+            data (dict): Data to encode.
+
+        Returns:
+            str: Encoded payload.
+        """
+        pass
+
+    @abc.abstractmethod
+    def decode(self, payload):
+        """Decode payload without prefix.
+
+        Args:
+            payload (str): Encoded payload.
+
+        Returns:
+            dict: Decoded data.
+
+        Raises:
+            ValueError: When payload can't be decoded.
+        """
+        pass
+
+
+class JsonNodeDataCodec(NodeDataCodec):
+    """Human readable JSON payload."""
+    name = "json"
+    prefix = "JSON:::"
+
+    def encode(self, data):
+        return json.dumps(data)
+
+    def decode(self, payload):
+        return json.loads(payload)
+
+
+class CompactJsonNodeDataCodec(NodeDataCodec):
+    """Compressed JSON payload encoded to base64 (version 1)."""
+    name = "zjson"
+    prefix = "ZJSON1:::"
+    compress_level = 6
+
+    def encode(self, data):
+        raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        return base64.b64encode(
+            zlib.compress(raw, self.compress_level)
+        ).decode("ascii")
+
+    def decode(self, payload):
+        try:
+            raw = zlib.decompress(base64.b64decode(payload))
+        except (binascii.Error, zlib.error) as exc:
+            raise ValueError(f"Invalid compact payload: {exc}") from exc
+        return json.loads(raw.decode("utf-8"))
+
+
+_codecs_by_name = {}
+_codecs_by_prefix = {}
+
+
+def register_node_data_codec(codec):
+    """Register codec so it can be used for reading and writing.
+
+    Args:
+        codec (NodeDataCodec): Codec instance.
+    """
+    _codecs_by_name[codec.name] = codec
+    _codecs_by_prefix[codec.prefix] = codec
+
+
+def get_node_data_codec(name=None):
+    """Get codec by name.
+
+    Args:
+        name (Optional[str]): Codec name. Codec from environment variable
+            or plain JSON is used when not passed.
+
+    Returns:
+        NodeDataCodec: Codec instance.
+
+    Raises:
+        ValueError: When codec with the name is not registered.
+    """
+    if not name:
+        name = os.getenv(NODE_DATA_CODEC_ENV) or DEFAULT_CODEC_NAME
+    codec = _codecs_by_name.get(name)
+    if codec is None:
+        raise ValueError(f"Unknown node data codec '{name}'")
+    return codec
+
+
+def find_node_data_codec(rawdata):
+    """Find codec which was used to encode the string.
+
+    Args:
+        rawdata (str): Knob value.
+
+    Returns:
+        Optional[NodeDataCodec]: Matching codec or None.
+    """
+    if not isinstance(rawdata, str):
+        return None
+    prefix_end = rawdata.find(":::")
+    if prefix_end < 0:
+        return None
+    return _codecs_by_prefix.get(rawdata[:prefix_end + 3])
+
+
+def encode_node_data(data, codec_name=None):
+    """Encode data to knob value including codec prefix.
+
+    Args:
+        data (dict): Data to encode.
+        codec_name (Optional[str]): Codec to use, default codec is used
+            when not passed.
+
+    Returns:
+        str: Knob value.
+    """
+    codec = get_node_data_codec(codec_name)
+    return codec.prefix + codec.encode(data)
+
+
+def decode_node_data(rawdata):
+    """Decode knob value encoded by any registered codec.
+
+    Args:
+        rawdata (str): Knob value.
+
+    Returns:
+        Optional[dict]: Decoded data or None if value is not encoded by
+            known codec or is corrupted.
+    """
+    codec = find_node_data_codec(rawdata)
+    if codec is None:
+        return None
+    try:
+        return codec.decode(rawdata[len(codec.prefix):])
+    except ValueError:
+        # 'json.JSONDecodeError' is subclass of 'ValueError'
+        return None
+
+
+def freeze_node_data(value):
+    """Convert decoded data to read-only structure.
+
+    Dictionaries are converted to `MappingProxyType` and lists to tuples.
+
+    Args:
+        value (Any): Decoded data.
+
+    Returns:
+        Any: Read-only copy of data.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({
+            key: freeze_node_data(item)
+            for key, item in value.items()
+        })
+    if isinstance(value, list):
+        return tuple(freeze_node_data(item) for item in value)
+    return value
+
+
+def thaw_node_data(value):
+    """Create mutable copy of data frozen by `freeze_node_data`.
+
+    Args:
+        value (Any): Read-only data.
+
+    Returns:
+        Any: Mutable copy using dictionaries and lists.
+    """
+    if isinstance(value, MappingProxyType):
+        return {
+            key: thaw_node_data(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, tuple):
+        return [thaw_node_data(item) for item in value]
+    return value
+
+
+class NodeDataCache:
+    """Bounded LRU cache of decoded knob values.
+
+    Cache is keyed by the raw knob string, so any change of the knob value
+    results in a new key and stale data are never returned. Values are
+    stored frozen so cached data can't be changed by callers.
+
+    Args:
+        maxsize (int): Maximum number of cached values.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def get(self, rawdata):
+        """Decoded read-only data for raw knob value.
+
+        Args:
+            rawdata (str): Knob value.
+
+        Returns:
+            Optional[MappingProxyType]: Read-only data or None if value is
+                not encoded by known codec.
+        """
+        if not isinstance(rawdata, str):
+            return None
+
+        try:
+            data = self._items[rawdata]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._items.move_to_end(rawdata)
+            return data
+
+        self.misses += 1
+        data = decode_node_data(rawdata)
+        if data is not None:
+            data = freeze_node_data(data)
+        self._items[rawdata] = data
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+        return data
+
+    def clear(self):
+        """Remove cached values and reset counters."""
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Cache statistics.
+
+        Returns:
+            dict[str, int]: Hits, misses, current and maximum size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._items),
+            "maxsize": self.maxsize,
+        }
+
+
+_node_data_cache = NodeDataCache()
+
+
+def get_node_data_cache():
+    """Process wide cache of decoded node data.
+
+    Returns:
+        NodeDataCache: Cache singleton.
+    """
+    return _node_data_cache
+
+
+register_node_data_codec(JsonNodeDataCodec())
+register_node_data_codec(CompactJsonNodeDataCodec())
@@ -22,6 +22,7 @@ from ayon_nuke.api import (
     colorspace_exists_on_node
 )
 from ayon_nuke.api.command import undo_chunk
+from ayon_nuke.api.scene_registry import scene_registry_batch
 
 from ayon_core.lib.transcoding import (
     VIDEO_EXTENSIONS,
@@ -60,8 +61,6 @@ class LoadClip(plugin.NukeLoader):
     # Loaded from settings
     representations_include = []
 
-    script_start = int(nuke.root()["first_frame"].value())
-
     # option gui
     options_defaults = {
         "set_frame_range": True,
@@ -104,6 +103,7 @@ class LoadClip(plugin.NukeLoader):
         return cls.representations_include or cls.representations
 
     @undo_chunk("Load Clip")
+    @scene_registry_batch()
     def load(self, context, name, namespace, options):
         """Load asset via database."""
         project_name = context["project"]["name"]
@@ -281,6 +281,7 @@ class LoadClip(plugin.NukeLoader):
         return new_repre_entity
 
     @undo_chunk("Update Clip")
+    @scene_registry_batch()
     def update(self, container, context):
         """Update the Loader's path
 
@@ -430,6 +431,7 @@ class LoadClip(plugin.NukeLoader):
             self.log.info("Colorspace not set...")
 
     @undo_chunk("Remove Clip")
+    @scene_registry_batch()
     def remove(self, container):
         read_node = container["node"]
         assert read_node.Class() == "Read", "Must be Read"
@@ -444,6 +446,10 @@ class LoadClip(plugin.NukeLoader):
         for member in members:
             nuke.delete(member)
 
+    @property
+    def script_start(self):
+        return int(nuke.root()["first_frame"].value())
+
     def _set_range_to_node(
         self, read_node: nuke.Node, first: int, last: int
     ):
@@ -465,10 +471,10 @@ class LoadClip(plugin.NukeLoader):
         last_node = None
         source_id = self.get_container_id(parent_node)
         self.log.debug("__ source_id: {}".format(source_id))
-        self.log.debug("__ members: {}".format(
-            self.get_members(parent_node)))
 
         handle_start = version_attributes.get("handleStart") or 0
+        self.log.debug("__ members: {}".format(
+            self.get_members(parent_node)))
         dependent_nodes = self.clear_members(parent_node)
 
         with maintained_selection():
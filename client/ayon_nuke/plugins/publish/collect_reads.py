@@ -3,6 +3,8 @@ import re
 import nuke
 import pyblish.api
 
+from ayon_nuke.api.directory_snapshot import get_directory_snapshot
+
 
 class CollectNukeReads(pyblish.api.InstancePlugin):
     """Collect all read nodes."""
@@ -62,7 +64,8 @@ class CollectNukeReads(pyblish.api.InstancePlugin):
         self.log.debug('source dir: {}'.format(source_dir))
 
         if isSequence:
-            source_files = [f for f in os.listdir(source_dir)
+            snapshot = get_directory_snapshot(instance.context)
+            source_files = [f for f in snapshot.list_files(source_dir)
                             if ext in f
                             if items[0] in f]
         else:
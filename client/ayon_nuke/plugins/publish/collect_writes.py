@@ -3,6 +3,8 @@ import os
 import pyblish.api
 from ayon_core.pipeline import publish
 from ayon_nuke import api as napi
+from ayon_nuke.api.frame_paths import get_frame_paths
+from ayon_nuke.api.directory_snapshot import get_directory_snapshot
 
 import nuke  # noqa
 
@@ -370,8 +372,9 @@ class CollectNukeWrites(pyblish.api.InstancePlugin,
         expected_slate_frame = first_frame - 1
         expected_slate_path = write_node["file"].evaluate(expected_slate_frame)
 
+        snapshot = get_directory_snapshot(instance.context)
         if (
-            os.path.exists(expected_slate_path)
+            snapshot.exists(expected_slate_path)
             or (
                 # When submitting to farm using existing frames on disk
                 # and slate generation is enabled then ensure to add
@@ -428,13 +431,8 @@ class CollectNukeWrites(pyblish.api.InstancePlugin,
         write_file_path = nuke.filename(write_node)
         output_dir = os.path.dirname(write_file_path)
 
-        # get file path knob
-        node_file_knob = write_node["file"]
         # list file paths based on input frames
-        expected_paths = list(sorted({
-            node_file_knob.evaluate(frame)
-            for frame in range(first_frame, last_frame + 1)
-        }))
+        expected_paths = get_frame_paths(write_node, first_frame, last_frame)
 
         # convert only to base names
         expected_filenames = {
@@ -443,9 +441,10 @@ class CollectNukeWrites(pyblish.api.InstancePlugin,
         }
 
         # make sure files are existing at folder
+        snapshot = get_directory_snapshot(instance.context)
         collected_frames = [
             filename
-            for filename in os.listdir(output_dir)
+            for filename in snapshot.list_files(output_dir)
             if filename in expected_filenames
         ]
 
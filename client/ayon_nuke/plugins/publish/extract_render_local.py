@@ -5,6 +5,8 @@ import pyblish.api
 import clique
 import nuke
 from ayon_nuke import api as napi
+from ayon_nuke.api.frame_paths import get_frame_paths
+from ayon_nuke.api.directory_snapshot import get_directory_snapshot
 from ayon_core.pipeline import publish
 from ayon_core.lib import collect_frames
 
@@ -46,14 +48,10 @@ class NukeRenderLocal(publish.Extractor,
         last_frame = instance.data.get("frameEndHandle", None)
 
         filenames = []
-        node_file = node["file"]
         # Collect expected filepaths for each frame
         # - for cases that output is still image is first created set of
         #   paths which is then sorted and converted to list
-        expected_paths = list(sorted({
-            node_file.evaluate(frame)
-            for frame in range(first_frame, last_frame + 1)
-        }))
+        expected_paths = get_frame_paths(node, first_frame, last_frame)
         # Extract only filenames for representation
         filenames.extend([
             os.path.basename(filepath)
@@ -94,6 +92,10 @@ class NukeRenderLocal(publish.Extractor,
                     description="Check Nuke console for more information.",
                     detail=str(exc),
                 ) from exc
+            finally:
+                # rendered files are not in directory listings collected
+                #   before the render
+                get_directory_snapshot(instance.context).invalidate(out_dir)
 
         # Determine defined file type
         path = node["file"].value()
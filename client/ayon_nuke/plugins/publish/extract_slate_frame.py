@@ -11,6 +11,7 @@ from ayon_nuke.api import (
     duplicate_node,
     get_view_process_node
 )
+from ayon_nuke.api.directory_snapshot import get_directory_snapshot
 
 
 class ExtractSlateFrame(publish.Extractor):
@@ -106,9 +107,10 @@ class ExtractSlateFrame(publish.Extractor):
             test_path_template = fpath.replace(
                 repl_string, "%0{}d".format(padding))
 
+        snapshot = get_directory_snapshot(instance.context)
         for frame in range(first, last + 1):
             test_file = test_path_template % frame
-            if not os.path.exists(test_file):
+            if not snapshot.exists(test_file):
                 self.log.debug("__ test_file: `{}`".format(test_file))
                 return None
 
@@ -307,6 +309,11 @@ class ExtractSlateFrame(publish.Extractor):
             if limit_on:
                 write_node["use_limit"].setValue(1)
 
+            # slate frame was written next to rendered frames
+            get_directory_snapshot(instance.context).invalidate(
+                os.path.dirname(instance.data["path"])
+            )
+
         # Add file to representation files
         # - evaluate filepaths for first frame and slate frame
         first_filename = os.path.basename(
@@ -34,6 +34,7 @@ class ValidateKnobs(pyblish.api.ContextPlugin):
     settings_category = "nuke"
 
     knobs = "{}"
+    _settings_knobs_cache = None
 
     def process(self, context):
         invalid = self.get_invalid(context, compute=True)
@@ -62,57 +63,91 @@ class ValidateKnobs(pyblish.api.ContextPlugin):
         return invalid
 
     @classmethod
-    def get_invalid_knobs(cls, context):
-        invalid_knobs = []
+    def get_settings_knobs(cls):
+        """Parsed knobs settings, parsed only once per settings value.
+
+        Returns:
+            dict[str, dict[str, Any]]: Expected knob values by family.
+        """
+        cached = cls._settings_knobs_cache
+        if cached is None or cached[0] != cls.knobs:
+            cached = (cls.knobs, json.loads(cls.knobs))
+            cls._settings_knobs_cache = cached
+        return cached[1]
 
-        for instance in context:
-            # Load fresh knobs data for each instance
-            settings_knobs = json.loads(cls.knobs)
+    @classmethod
+    def get_expected_knobs_index(cls, context):
+        """Expected values by knob name for all instances in context.
+
+        Knob values of families are merged per instance, so the value of
+        a later family overrides the value of an earlier one. Instances
+        with the same families share the merged values.
 
+        Args:
+            context (pyblish.api.Context): Publish context.
+
+        Returns:
+            dict[str, list[Any]]: Unique expected values by knob name.
+        """
+        settings_knobs = cls.get_settings_knobs()
+        knobs_by_families = {}
+        for instance in context:
             # Filter families.
             families = [instance.data["productBaseType"]]
             families += instance.data.get("families", [])
+            families = tuple(family.split(".")[0] for family in families)
+            if families in knobs_by_families:
+                continue
 
             # Get all knobs to validate.
             knobs = {}
             for family in families:
-                # check if dot in family
-                if "." in family:
-                    family = family.split(".")[0]
-
                 # avoid families not in settings
-                if family not in settings_knobs:
-                    continue
-
-                # get presets of knobs
-                for preset in settings_knobs[family]:
-                    knobs[preset] = settings_knobs[family][preset]
-
-            # Get invalid knobs.
-            nodes = []
-
-            for node in nuke.allNodes():
-                nodes.append(node)
-                if node.Class() == "Group":
-                    node.begin()
-                    nodes.extend(iter(nuke.allNodes()))
-                    node.end()
+                if family in settings_knobs:
+                    knobs.update(settings_knobs[family])
+            knobs_by_families[families] = knobs
+
+        index = {}
+        for knobs in knobs_by_families.values():
+            for knob_name, expected in knobs.items():
+                values = index.setdefault(knob_name, [])
+                if expected not in values:
+                    values.append(expected)
+        return index
 
-            for node in nodes:
-                for knob in node.knobs():
-                    if knob not in knobs.keys():
-                        continue
+    @classmethod
+    def get_invalid_knobs(cls, context):
+        invalid_knobs = []
+        index = cls.get_expected_knobs_index(context)
+        if not index:
+            context.data["invalid_knobs"] = invalid_knobs
+            return invalid_knobs
+
+        # Get invalid knobs.
+        nodes = []
+        for node in nuke.allNodes():
+            nodes.append(node)
+            if node.Class() == "Group":
+                nodes.extend(nuke.allNodes(group=node))
+
+        for node in nodes:
+            node_knobs = node.knobs()
+            for knob_name, expected_values in index.items():
+                knob = node_knobs.get(knob_name)
+                if knob is None:
+                    continue
 
-                    expected = knobs[knob]
-                    if node[knob].value() != expected:
+                current = knob.value()
+                for expected in expected_values:
+                    if current != expected:
                         invalid_knobs.append(
                             {
                                 "node_name": node.name(),
-                                "knob": node[knob],
-                                "name": node[knob].name(),
-                                "label": node[knob].label(),
+                                "knob": knob,
+                                "name": knob.name(),
+                                "label": knob.label(),
                                 "expected": expected,
-                                "current": node[knob].value()
+                                "current": current
                             }
                         )
 
@@ -1,3 +1,6 @@
+import os
+
+import nuke
 import pyblish.api
 import clique
 
@@ -6,6 +9,51 @@ from ayon_core.pipeline import (
     OptionalPyblishPluginMixin,
 )
 from ayon_core.pipeline.publish import get_errored_instances_from_context
+from ayon_nuke.api.directory_snapshot import get_directory_snapshot
+from ayon_nuke.api.frame_paths import (
+    get_frame_filename_parts,
+    parse_frame_files,
+)
+
+def get_missing_frame_ranges(frames, first_frame, last_frame):
+    """Ranges of frames missing in frame range.
+
+    Args:
+        frames (list[int]): Sorted unique frames.
+        first_frame (int): First expected frame.
+        last_frame (int): Last expected frame.
+
+    Returns:
+        list[tuple[int, int]]: Missing ranges, both ends included.
+    """
+    missing = []
+    expected = first_frame
+    for frame in frames:
+        if frame < first_frame:
+            continue
+        if frame > last_frame:
+            break
+        if frame > expected:
+            missing.append((expected, frame - 1))
+        expected = frame + 1
+    if expected <= last_frame:
+        missing.append((expected, last_frame))
+    return missing
+
+
+def format_frame_ranges(frame_ranges):
+    """Frame ranges as string, e.g. "1001-1005, 1010".
+
+    Args:
+        frame_ranges (list[tuple[int, int]]): Frame ranges.
+
+    Returns:
+        str: Formatted ranges.
+    """
+    return ", ".join(
+        str(start) if start == end else "{}-{}".format(start, end)
+        for start, end in frame_ranges
+    )
 
 
 class RepairActionBase(pyblish.api.Action):
@@ -47,11 +95,38 @@ class RepairCollectionActionToFarm(RepairActionBase):
         self.repair_knob(context, instances, "farm")
 
 
+class RepairActionRenderMissingFrames(RepairActionBase):
+    label = "Repair - render missing frames"
+
+    def process(self, context, plugin):
+        snapshot = get_directory_snapshot(context)
+        for instance in self.get_instance(context, plugin):
+            missing_ranges = instance.data.get("missingFrameRanges")
+            if not missing_ranges:
+                continue
+
+            for first_frame, last_frame in missing_ranges:
+                self.log.info("Rendering frames {}-{} of {}".format(
+                    first_frame, last_frame, instance.data["name"]))
+                nuke.execute(
+                    instance.data["name"], first_frame, last_frame
+                )
+            snapshot.invalidate(os.path.dirname(instance.data["path"]))
+        self.log.info("Reload publisher to collect rendered frames.")
+
+
 class ValidateRenderedFrames(
     OptionalPyblishPluginMixin,
     pyblish.api.InstancePlugin
 ):
-    """Validates file output."""
+    """Validates file output.
+
+    Rendered files have to form one frame sequence covering the frame
+    range including handles, frames missing inside the range or at its
+    start or end are reported. Files are matched against the output path
+    (`path` in instance data) around its padding token. When the path is
+    not available the frame number has to be right before the extension.
+    """
 
     order = pyblish.api.ValidatorOrder + 0.1
     optional = False
@@ -59,7 +134,11 @@ class ValidateRenderedFrames(
 
     label = "Validate rendered frame"
     hosts = ["nuke", "nukestudio"]
-    actions = [RepairCollectionActionToLocal, RepairCollectionActionToFarm]
+    actions = [
+        RepairActionRenderMissingFrames,
+        RepairCollectionActionToLocal,
+        RepairCollectionActionToFarm,
+    ]
 
     settings_category = "nuke"
 
@@ -87,33 +166,56 @@ class ValidateRenderedFrames(
             if isinstance(repre["files"], str):
                 return
 
-            collections, remainder = clique.assemble(repre["files"])
-            self.log.debug("collections: {}".format(str(collections)))
+            # Frame files are matched against output path of the node,
+            #   frame number has to be right before extension otherwise
+            filename_parts = None
+            if instance.data.get("path"):
+                filename_parts = get_frame_filename_parts(
+                    instance.data["path"]
+                )
+            frames_by_sequence, remainder = parse_frame_files(
+                repre["files"], filename_parts
+            )
+            self.log.debug("sequences: {}".format(
+                ", ".join(head + "#" + tail
+                          for head, tail in frames_by_sequence)
+            ))
             self.log.debug("remainder: {}".format(str(remainder)))
 
-            collection = collections[0]
-
             f_start_h = instance.data["frameStartHandle"]
             f_end_h = instance.data["frameEndHandle"]
 
             frame_length = int(f_end_h - f_start_h + 1)
 
+            if not frames_by_sequence:
+                msg = (
+                    "Rendered files are not a frame sequence: {}"
+                ).format(", ".join(remainder))
+                self.log.error(msg)
+                raise PublishXmlValidationError(
+                    self, msg, formatting_data=f_data)
+
+            if len(frames_by_sequence) != 1:
+                msg = "There are multiple collections in the folder"
+                self.log.error(msg)
+                raise PublishXmlValidationError(
+                    self, msg, formatting_data=f_data)
+
+            (head, tail), frame_strs = next(iter(frames_by_sequence.items()))
+            frames = sorted({int(frame) for frame in frame_strs})
+            coll_start = frames[0]
+            coll_end = frames[-1]
+            collected_frames_len = len(frames)
+
             if frame_length != 1:
-                if len(collections) != 1:
-                    msg = "There are multiple collections in the folder"
-                    self.log.error(msg)
-                    raise PublishXmlValidationError(
-                        self, msg, formatting_data=f_data)
-
-                if not collection.is_contiguous():
-                    msg = "Some frames appear to be missing"
-                    self.log.error(msg)
-                    raise PublishXmlValidationError(
-                        self, msg, formatting_data=f_data)
-
-            collected_frames_len = len(collection.indexes)
-            coll_start = min(collection.indexes)
-            coll_end = max(collection.indexes)
+                # Frames missing in expected range including handles
+                missing_ranges = get_missing_frame_ranges(
+                    frames, f_start_h, f_end_h
+                )
+                if missing_ranges:
+                    self._raise_missing_frames(
+                        instance, f_data, missing_ranges
+                    )
 
             self.log.debug("frame_length: {}".format(frame_length))
             self.log.debug("collected_frames_len: {}".format(
@@ -123,10 +225,6 @@ class ValidateRenderedFrames(
             self.log.debug(
                 "coll_start-coll_end: {}-{}".format(coll_start, coll_end))
 
-            self.log.debug(
-                "len(collection.indexes): {}".format(collected_frames_len)
-            )
-
             if ("slate" in instance.data["families"]) \
                     and (frame_length != collected_frames_len):
                 collected_frames_len -= 1
@@ -144,6 +242,28 @@ class ValidateRenderedFrames(
                     ).format(__name__), formatting_data=f_data
                 )
 
+            # Padding matches `clique` - only frames with leading zeros
+            #   are padded
+            padding = 0
+            if any(
+                len(frame) > 1 and frame.startswith("0")
+                for frame in frame_strs
+            ):
+                padding = len(frame_strs[0])
+            collection = clique.Collection(
+                head, tail, padding, indexes=set(frames)
+            )
+
             instance.data["collection"] = collection
 
             return
+
+    def _raise_missing_frames(self, instance, f_data, missing_ranges):
+        instance.data["missingFrameRanges"] = missing_ranges
+        missing_ranges_str = format_frame_ranges(missing_ranges)
+        msg = "Missing frames: {}".format(missing_ranges_str)
+        self.log.error(msg)
+        raise PublishXmlValidationError(
+            self, msg, "missing_frames",
+            formatting_data=dict(f_data, missing_ranges=missing_ranges_str)
+        )
@@ -0,0 +1,247 @@
+import os
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+import nuke
+import pyblish.api
+
+from ayon_core.pipeline import (
+    PublishXmlValidationError,
+    OptionalPyblishPluginMixin,
+)
+from ayon_core.pipeline.publish import get_errored_instances_from_context
+from ayon_nuke.api.directory_snapshot import get_directory_snapshot
+from ayon_nuke.api.frame_paths import (
+    get_frame_filename_parts,
+    parse_frame_files,
+)
+
+# First bytes of supported file types by extension
+HEADER_MAGIC_BY_EXT = {
+    "exr": (b"\x76\x2f\x31\x01",),
+    "dpx": (b"SDPX", b"XPDS"),
+    "png": (b"\x89PNG\r\n\x1a\n",),
+    "jpg": (b"\xff\xd8\xff",),
+    "jpeg": (b"\xff\xd8\xff",),
+    # classic TIFF and BigTIFF
+    "tif": (b"II*\x00", b"MM\x00*", b"II+\x00", b"MM\x00+"),
+    "tiff": (b"II*\x00", b"MM\x00*", b"II+\x00", b"MM\x00+"),
+}
+
+
+def has_valid_header(filepath, magics):
+    """File starts with one of header magic bytes.
+
+    Args:
+        filepath (str): Path to file.
+        magics (tuple[bytes, ...]): Allowed header magic bytes.
+
+    Returns:
+        bool: File header is valid.
+    """
+    try:
+        with open(filepath, "rb") as stream:
+            header = stream.read(max(len(magic) for magic in magics))
+    except OSError:
+        return False
+    return header.startswith(magics)
+
+
+def frames_to_ranges(frames):
+    """Convert frames to ranges.
+
+    Args:
+        frames (Iterable[int]): Frames.
+
+    Returns:
+        list[tuple[int, int]]: Ranges, both ends included.
+    """
+    ranges = []
+    for frame in sorted(set(frames)):
+        if ranges and ranges[-1][1] == frame - 1:
+            ranges[-1] = (ranges[-1][0], frame)
+        else:
+            ranges.append((frame, frame))
+    return ranges
+
+
+class RepairActionRenderBadFrames(pyblish.api.Action):
+    label = "Repair - render bad frames"
+    icon = "wrench"
+    on = "failed"
+
+    def process(self, context, plugin):
+        snapshot = get_directory_snapshot(context)
+        instances = get_errored_instances_from_context(context, plugin=plugin)
+        for instance in instances:
+            bad_ranges = instance.data.get("badFrameRanges")
+            if not bad_ranges:
+                continue
+
+            for first_frame, last_frame in bad_ranges:
+                self.log.info("Rendering frames {}-{} of {}".format(
+                    first_frame, last_frame, instance.data["name"]))
+                nuke.execute(
+                    instance.data["name"], first_frame, last_frame
+                )
+            snapshot.invalidate(os.path.dirname(instance.data["path"]))
+        self.log.info("Reload publisher to collect rendered frames.")
+
+
+class ValidateRenderedFramesIntegrity(
+    OptionalPyblishPluginMixin,
+    pyblish.api.InstancePlugin
+):
+    """Validate rendered frames are not empty or truncated.
+
+    Each frame is checked for non-zero size, size much smaller than median
+    size of the sequence and header of EXR, DPX, PNG, JPEG and TIFF files.
+    Slate frame is not compared with median size, it is mostly black.
+    Frames are parsed from file names the same way as in
+    `ValidateRenderedFrames`. Sizes are taken from directory listing,
+    headers are read in thread pool.
+    """
+
+    order = pyblish.api.ValidatorOrder + 0.11
+    optional = True
+    families = ["render", "prerender", "still"]
+
+    label = "Validate Rendered Frames Integrity"
+    hosts = ["nuke"]
+    actions = [RepairActionRenderBadFrames]
+
+    settings_category = "nuke"
+
+    enabled = False
+    max_workers = 8
+    # Frame smaller than the ratio of median size is reported
+    size_outlier_ratio = 0.1
+
+    def process(self, instance):
+        if not self.is_active(instance.data):
+            return
+
+        snapshot = get_directory_snapshot(instance.context)
+        slate_frame = None
+        if "slate" in instance.data.get("families", []):
+            slate_frame = instance.data["frameStartHandle"] - 1
+
+        bad_frames = set()
+        for repre in instance.data.get("representations", []):
+            files = repre.get("files")
+            staging_dir = repre.get("stagingDir")
+            if not files or not staging_dir:
+                continue
+            if isinstance(files, str):
+                files = [files]
+
+            bad_frames.update(self._get_bad_frames(
+                snapshot,
+                staging_dir,
+                self._get_frame_by_filename(instance, files),
+                slate_frame,
+            ))
+
+        if not bad_frames:
+            return
+
+        bad_ranges = frames_to_ranges(bad_frames)
+        instance.data["badFrameRanges"] = bad_ranges
+        # Same format as 'frames_to_fix' publish attribute
+        frames_to_fix = ",".join(
+            str(start) if start == end else "{}-{}".format(start, end)
+            for start, end in bad_ranges
+        )
+        node = instance.data["transientData"]["node"]
+        msg = "Invalid rendered frames: {}".format(frames_to_fix)
+        self.log.error(msg)
+        raise PublishXmlValidationError(
+            self, msg, formatting_data={
+                "node_name": node.name(),
+                "frames_to_fix": frames_to_fix,
+            }
+        )
+
+    @staticmethod
+    def _get_frame_by_filename(instance, filenames):
+        path = instance.data.get("path")
+        filename_parts = None
+        if path:
+            filename_parts = get_frame_filename_parts(path)
+            if filename_parts is None:
+                # Output path without padding is a single still image,
+                #   digits in its name are not a frame number
+                frame = instance.data["frameStartHandle"]
+                return {filename: frame for filename in filenames}
+
+        frames_by_sequence, _ = parse_frame_files(filenames, filename_parts)
+        return {
+            head + frame + tail: int(frame)
+            for (head, tail), frame_strs in frames_by_sequence.items()
+            for frame in frame_strs
+        }
+
+    def _get_bad_frames(
+        self, snapshot, staging_dir, frame_by_filename, slate_frame
+    ):
+        if not frame_by_filename:
+            return set()
+
+        entries = snapshot.get_entries(staging_dir)
+        bad_filenames = set()
+        size_by_filename = {}
+        for filename in frame_by_filename:
+            entry = entries.get(filename)
+            try:
+                size = entry.size if entry is not None else 0
+            except OSError:
+                size = 0
+            if size == 0:
+                bad_filenames.add(filename)
+            else:
+                size_by_filename[filename] = size
+
+        # Slate is not compared with rendered frames
+        size_by_filename = {
+            filename: size
+            for filename, size in size_by_filename.items()
+            if frame_by_filename[filename] != slate_frame
+        }
+        if size_by_filename and self.size_outlier_ratio:
+            min_size = (
+                statistics.median(size_by_filename.values())
+                * self.size_outlier_ratio
+            )
+            for filename, size in size_by_filename.items():
+                if size < min_size:
+                    self.log.debug(
+                        "Size of '{}' is outlier: {}B".format(
+                            filename, size))
+                    bad_filenames.add(filename)
+
+        to_check = [
+            filename
+            for filename in frame_by_filename
+            if filename not in bad_filenames
+        ]
+        ext = os.path.splitext(
+            next(iter(frame_by_filename)))[1].lstrip(".").lower()
+        magics = HEADER_MAGIC_BY_EXT.get(ext)
+        if magics and to_check:
+            filepaths = [
+                os.path.join(staging_dir, filename)
+                for filename in to_check
+            ]
+            max_workers = max(1, min(self.max_workers, len(filepaths)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    lambda filepath: has_valid_header(filepath, magics),
+                    filepaths
+                )
+                for filename, valid in zip(to_check, results):
+                    if not valid:
+                        self.log.debug(
+                            "Invalid header of '{}'".format(filename))
+                        bad_filenames.add(filename)
+
+        return {frame_by_filename[filename] for filename in bad_filenames}
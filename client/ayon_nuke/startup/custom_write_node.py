@@ -2,12 +2,13 @@
 import os
 import nuke
 import nukescripts
-from ayon_core.pipeline import Anatomy, get_current_project_name
+from ayon_core.pipeline import get_current_project_name
 from ayon_nuke.api.lib import (
+    ContextEntityCache,
     set_node_knobs_from_settings,
     get_nuke_imageio_settings,
-    get_current_project_settings,
 )
+from ayon_nuke.api.settings import get_project_settings_view
 
 
 knobs_setting = {
@@ -102,9 +103,11 @@ class WriteNodeKnobSettingPanel(nukescripts.PythonPanel):
                 "\nPlease add one to complete setting up the node")
             return
 
-        anatomy = Anatomy(get_current_project_name())
+        anatomy = ContextEntityCache.get_anatomy(
+            get_current_project_name()
+        )
 
-        project_settings = get_current_project_settings()
+        project_settings = get_project_settings_view()
         write_settings = project_settings["nuke"]["create"][
             "CreateWriteRender"
         ]
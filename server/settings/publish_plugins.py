@@ -100,6 +100,29 @@ class ValidateKnobsModel(BaseSettingsModel):
         return validate_json_dict(value)
 
 
+class ValidateRenderedFramesIntegrityModel(BaseSettingsModel):
+    """Check rendered frames are not empty or truncated."""
+    enabled: bool = SettingsField(title="Enabled")
+    optional: bool = SettingsField(title="Optional")
+    active: bool = SettingsField(title="Active")
+    max_workers: int = SettingsField(
+        8,
+        title="Max threads",
+        ge=1,
+        description="Number of threads reading headers of frames."
+    )
+    size_outlier_ratio: float = SettingsField(
+        0.1,
+        title="Size outlier ratio",
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Frames smaller than the ratio of median frame size are"
+            " reported. Set to 0 to disable."
+        )
+    )
+
+
 class ExtractReviewDataModel(BaseSettingsModel):
     """Add a raw reviewable representation from the output of a write node.
 
@@ -307,6 +330,12 @@ class PublishPluginsModel(BaseSettingsModel):
         title="Validate Rendered Frames",
         default_factory=OptionalPluginModel
     )
+    ValidateRenderedFramesIntegrity: ValidateRenderedFramesIntegrityModel = (
+        SettingsField(
+            title="Validate Rendered Frames Integrity",
+            default_factory=ValidateRenderedFramesIntegrityModel
+        )
+    )
     ValidateNukeWriteNode: OptionalPluginModel = SettingsField(
         title="Validate Nuke Write Node",
         default_factory=OptionalPluginModel
@@ -410,6 +439,13 @@ DEFAULT_PUBLISH_PLUGIN_SETTINGS = {
         "optional": False,  # match how it was before it was made optional
         "active": True
     },
+    "ValidateRenderedFramesIntegrity": {
+        "enabled": False,
+        "optional": True,
+        "active": True,
+        "max_workers": 8,
+        "size_outlier_ratio": 0.1
+    },
     "ValidateNukeWriteNode": {
         "enabled": True,
         "optional": False,  # match how it was before it was made optional
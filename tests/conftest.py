@@ -0,0 +1,70 @@
+import os
+import sys
+import types
+import importlib
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(TESTS_DIR)
+CLIENT_DIR = os.path.join(REPO_ROOT, "client")
+
+for path in (CLIENT_DIR, REPO_ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+try:
+    import nuke  # noqa: F401
+except ImportError:
+    from benchmarks import install_nuke_stub
+
+    install_nuke_stub()
+
+
+@pytest.fixture
+def nuke_stub():
+    """Empty script in stand-in `nuke` module without callbacks."""
+    nuke = sys.modules["nuke"]
+    nuke.removeAllCallbacks()
+    nuke.scriptClear()
+    yield nuke
+    nuke.removeAllCallbacks()
+    nuke.scriptClear()
+
+
+@pytest.fixture
+def stub_module(monkeypatch):
+    """Register fake module for the test, e.g. part of ayon-core.
+
+    Returns:
+        Callable[[str, ...], types.ModuleType]: Function creating module
+            with name and attributes passed as keyword arguments.
+    """
+    def _stub_module(name, **attributes):
+        module = sys.modules.get(name)
+        if module is None or not getattr(module, "_test_stub", False):
+            module = types.ModuleType(name)
+            module._test_stub = True
+            monkeypatch.setitem(sys.modules, name, module)
+            parent_name, _, child_name = name.rpartition(".")
+            if parent_name:
+                parent = sys.modules.get(parent_name)
+                if parent is None:
+                    parent = _stub_module(parent_name)
+                monkeypatch.setattr(parent, child_name, module, raising=False)
+        for key, value in attributes.items():
+            setattr(module, key, value)
+        return module
+    return _stub_module
+
+
+@pytest.fixture
+def import_fresh(monkeypatch):
+    """Import module again, e.g. after its dependencies were stubbed.
+
+    Module is removed from `sys.modules` after the test.
+    """
+    def _import_fresh(name):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+        return importlib.import_module(name)
+    return _import_fresh
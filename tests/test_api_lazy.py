@@ -0,0 +1,85 @@
+import os
+import ast
+import sys
+import subprocess
+
+import pytest
+
+import ayon_nuke
+from ayon_nuke import api
+
+API_DIR = os.path.dirname(api.__file__)
+
+
+def _get_defined_names(module_name):
+    """Names defined or imported on top level of api submodule."""
+    filepath = os.path.join(API_DIR, module_name + ".py")
+    with open(filepath, encoding="utf-8") as stream:
+        tree = ast.parse(stream.read(), filepath)
+
+    names = set()
+    for item in tree.body:
+        if isinstance(item, (
+            ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef
+        )):
+            names.add(item.name)
+        elif isinstance(item, ast.Assign):
+            for target in item.targets:
+                if isinstance(target, ast.Name):
+                    names.add(target.id)
+        elif isinstance(item, (ast.Import, ast.ImportFrom)):
+            for alias in item.names:
+                names.add(alias.asname or alias.name)
+    return names
+
+
+def test_all_names_are_mapped():
+    assert len(api.__all__) == len(set(api.__all__))
+    assert set(api.__all__) == set(api._ATTRIBUTE_MODULES)
+
+
+@pytest.mark.parametrize(
+    "name, module_name", sorted(api._ATTRIBUTE_MODULES.items())
+)
+def test_mapped_module_defines_name(name, module_name):
+    assert name in _get_defined_names(module_name)
+
+
+def test_dir_lists_public_names():
+    assert set(api.__all__) <= set(dir(api))
+    assert {"NUKE_ROOT_DIR", "NukeAddon"} <= set(dir(ayon_nuke))
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        api.unknown_attribute
+    with pytest.raises(AttributeError):
+        ayon_nuke.unknown_attribute
+
+
+def test_attribute_is_imported_on_access(nuke_stub):
+    from ayon_nuke.api import node_data
+
+    assert api.get_node_data_view is node_data.get_node_data_view
+    assert "get_node_data_view" in vars(api)
+
+
+def test_import_does_not_load_submodules():
+    code = (
+        "import sys\n"
+        "import ayon_nuke.api\n"
+        "print(sorted(\n"
+        "    name for name in sys.modules\n"
+        "    if name.startswith(('ayon_nuke.', 'ayon_core', 'qtpy', 'nuke'))\n"
+        "))\n"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(ayon_nuke.__file__))]
+        + [path for path in env.get("PYTHONPATH", "").split(os.pathsep)
+           if path]
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], env=env, text=True
+    )
+    assert output.strip() == "['ayon_nuke.api', 'ayon_nuke.version']"
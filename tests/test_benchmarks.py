@@ -0,0 +1,78 @@
+import sys
+import json
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.cases import CASES
+
+
+@pytest.fixture(autouse=True)
+def restore_modules(monkeypatch):
+    """Drop stand-ins and modules imported with them after the test."""
+    modules = dict(sys.modules)
+    monkeypatch.setattr(sys, "meta_path", list(sys.meta_path))
+    yield
+    for name in set(sys.modules) - set(modules):
+        del sys.modules[name]
+        parent_name, _, child_name = name.rpartition(".")
+        parent = modules.get(parent_name)
+        if parent is not None and getattr(parent, child_name, None):
+            delattr(parent, child_name)
+
+
+def test_benchmarks_write_results(nuke_stub, tmp_path):
+    output = tmp_path / "results.json"
+    main([
+        "--sizes", "300",
+        "--instances", "3",
+        "--containers", "5",
+        "--repeat", "1",
+        "--output", str(output),
+    ])
+    data = json.loads(output.read_text())
+    results = data["results"]
+    assert [result["case"] for result in results] == [
+        name for name, _ in CASES
+    ]
+    for result in results:
+        assert result["size"] == 300
+        if result["status"] == "ok":
+            assert result["min"] >= 0
+        else:
+            assert result["status"] == "skipped"
+            assert result["reason"]
+
+    status_by_case = {result["case"]: result["status"] for result in results}
+    for case_name in (
+        "codec.decode[zjson]",
+        "registry.queries[batch]",
+        "frame_paths.template",
+        "dirmap.resolve[cold]",
+        "nk_reader.parse",
+        "pipeline.list_instances",
+        "pipeline.ls",
+        "plugin._collect_and_cache_nodes",
+        "lib.get_backdrop_nodes",
+        "publish.collect_writes",
+        "publish.collect_reads",
+        "publish.collect_backdrop",
+    ):
+        assert status_by_case[case_name] == "ok"
+
+
+def test_benchmarks_case_filter(nuke_stub, capsys):
+    main([
+        "--sizes", "100",
+        "--instances", "1",
+        "--containers", "1",
+        "--repeat", "1",
+        "--case", "codec.*",
+    ])
+    data = json.loads(capsys.readouterr().out)
+    assert {result["case"] for result in data["results"]} == {
+        "codec.encode[json]",
+        "codec.decode[json]",
+        "codec.encode[zjson]",
+        "codec.decode[zjson]",
+    }
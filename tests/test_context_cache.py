@@ -0,0 +1,139 @@
+import types
+
+import pytest
+
+
+class FakeServer:
+    def __init__(self):
+        self.calls = []
+
+    def get_project(self, project_name):
+        self.calls.append(("project", project_name))
+        return {"name": project_name}
+
+    def get_folder_by_path(self, project_name, folder_path):
+        self.calls.append(("folder", folder_path))
+        return {"id": folder_path.replace("/", "_"), "path": folder_path}
+
+    def get_task_by_name(self, project_name, folder_id, task_name):
+        self.calls.append(("task", task_name))
+        return {"name": task_name, "folderId": folder_id}
+
+
+class FakeAnatomy:
+    def __init__(self, project_name, project_entity=None):
+        self.project_name = project_name
+        self.project_entity = project_entity
+
+
+@pytest.fixture
+def context(stub_module, import_fresh):
+    server = FakeServer()
+    template_data_calls = []
+
+    def get_template_data(
+        project_entity, folder_entity, task_entity, host_name
+    ):
+        template_data_calls.append(host_name)
+        return {
+            "project": {"name": project_entity["name"]},
+            "folder": {"path": (folder_entity or {}).get("path")},
+            "task": {"name": (task_entity or {}).get("name")},
+            "app": host_name,
+        }
+
+    stub_module(
+        "ayon_api",
+        get_project=server.get_project,
+        get_folder_by_path=server.get_folder_by_path,
+        get_task_by_name=server.get_task_by_name,
+    )
+    stub_module("ayon_core.pipeline", Anatomy=FakeAnatomy)
+    stub_module(
+        "ayon_core.pipeline.template_data",
+        get_template_data=get_template_data,
+    )
+    module = import_fresh("ayon_nuke.api.context_cache")
+    yield types.SimpleNamespace(
+        cache=module.ContextEntityCache,
+        server=server,
+        template_data_calls=template_data_calls,
+    )
+    module.ContextEntityCache.clear()
+
+
+def test_entities_are_cached(context):
+    project, folder, task = context.cache.get_entities(
+        "project", "/shots/sh010", "comp")
+    assert project == {"name": "project"}
+    assert folder["path"] == "/shots/sh010"
+    assert task == {"name": "comp", "folderId": folder["id"]}
+    assert context.server.calls == [
+        ("project", "project"),
+        ("folder", "/shots/sh010"),
+        ("task", "comp"),
+    ]
+
+    assert context.cache.get_entities("project", "/shots/sh010", "comp") == (
+        project, folder, task
+    )
+    assert len(context.server.calls) == 3
+
+    # Other context is queried separately
+    context.cache.get_entities("project", "/shots/sh010", "roto")
+    assert len(context.server.calls) == 6
+
+
+def test_context_without_folder(context):
+    assert context.cache.get_entities("project", None, "comp") == (
+        {"name": "project"}, None, None
+    )
+    assert context.server.calls == [("project", "project")]
+
+
+def test_entities_expire(context, monkeypatch):
+    context.cache.get_entities("project", "/shots/sh010", "comp")
+    monkeypatch.setattr(context.cache, "timeout", -1)
+    context.cache.get_entities("project", "/shots/sh010", "comp")
+    assert len(context.server.calls) == 6
+
+
+def test_clear(context):
+    context.cache.get_entities("project", "/shots/sh010", "comp")
+    anatomy = context.cache.get_anatomy("project")
+    context.cache.clear()
+    context.cache.get_entities("project", "/shots/sh010", "comp")
+    assert len(context.server.calls) == 6
+    assert context.cache.get_anatomy("project") is not anatomy
+
+
+def test_template_data(context):
+    template_data = context.cache.get_template_data(
+        "project", "/shots/sh010", "comp", "nuke")
+    assert template_data == {
+        "project": {"name": "project"},
+        "folder": {"path": "/shots/sh010"},
+        "task": {"name": "comp"},
+        "app": "nuke",
+    }
+    # Returned data are a copy which can be modified
+    template_data["folder"]["path"] = "changed"
+    template_data["frame"] = "####"
+    assert context.cache.get_template_data(
+        "project", "/shots/sh010", "comp", "nuke"
+    )["folder"] == {"path": "/shots/sh010"}
+    assert context.template_data_calls == ["nuke"]
+
+    context.cache.get_template_data("project", "/shots/sh010", "comp", "nukex")
+    assert context.template_data_calls == ["nuke", "nukex"]
+    # Entities are shared by template data of all hosts
+    assert len(context.server.calls) == 3
+
+
+def test_anatomy_is_shared(context):
+    project_entity = {"name": "project"}
+    anatomy = context.cache.get_anatomy("project", project_entity)
+    assert anatomy.project_name == "project"
+    assert anatomy.project_entity is project_entity
+    assert context.cache.get_anatomy("project") is anatomy
+    assert context.cache.get_anatomy("other") is not anatomy
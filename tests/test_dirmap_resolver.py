@@ -0,0 +1,109 @@
+import pytest
+
+from ayon_nuke.api.dirmap_resolver import DirmapResolver
+
+
+def _resolver(pairs, case_sensitive=True):
+    return DirmapResolver(
+        {
+            "source_path": [source for source, _ in pairs],
+            "destination_path": [destination for _, destination in pairs],
+        },
+        case_sensitive=case_sensitive,
+    )
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("/mnt/projects/shot/file.exr", "/data/shot/file.exr"),
+    ("/mnt/projects", "/data"),
+    # longest source path wins
+    ("/mnt/projects/library/tex.png", "/library/tex.png"),
+    # source path must end on segment boundary
+    ("/mnt/projects_old/shot/file.exr", None),
+    ("/mnt/projects2/file.exr", None),
+    ("/other/mnt/projects/file.exr", None),
+    ("/mnt", None),
+    # windows separators are normalized
+    ("\\mnt\\projects\\shot\\file.exr", "/data/shot/file.exr"),
+])
+def test_map_path(path, expected):
+    resolver = _resolver([
+        ("/mnt/projects/", "/data/"),
+        ("/mnt/projects/library", "/library"),
+    ])
+    assert resolver.map_path(path) == expected
+
+
+def test_windows_source_paths():
+    resolver = _resolver(
+        [("P:\\Projects", "/mnt/projects")], case_sensitive=False
+    )
+    assert resolver.map_path("p:/projects/Shot/File.exr") == (
+        "/mnt/projects/Shot/File.exr"
+    )
+    assert resolver.map_path("P:\\ProjectsOld\\file.exr") is None
+
+
+def test_case_sensitive():
+    resolver = _resolver([("/Mnt/Projects", "/data")])
+    assert resolver.map_path("/mnt/projects/file.exr") is None
+    assert resolver.map_path("/Mnt/Projects/file.exr") == "/data/file.exr"
+
+
+def test_mismatched_mapping():
+    resolver = DirmapResolver(
+        {"source_path": ["/a", "/b"], "destination_path": ["/c"]},
+        case_sensitive=True,
+    )
+    assert resolver.map_path("/a/file") == "/c/file"
+    assert resolver.map_path("/b/file") is None
+    assert DirmapResolver({}).map_path("/a/file") is None
+
+
+def test_resolve_existing_paths(tmp_path):
+    destination = tmp_path / "data"
+    (destination / "shot").mkdir(parents=True)
+    (destination / "shot" / "file.exr").write_bytes(b"")
+    resolver = _resolver([("/mnt/projects", str(destination))])
+
+    assert resolver.resolve("/mnt/projects/shot/file.exr") == (
+        destination.as_posix() + "/shot/file.exr"
+    )
+    # Original path is kept when mapped path does not exist
+    assert resolver.resolve("/mnt/projects/shot/missing.exr") == (
+        "/mnt/projects/shot/missing.exr"
+    )
+    assert resolver.resolve("/other/file.exr") == "/other/file.exr"
+
+
+def test_resolve_cache(tmp_path, monkeypatch):
+    resolver = _resolver([("/mnt/projects", tmp_path.as_posix())])
+    path = "/mnt/projects/file.exr"
+    assert resolver.resolve(path) == path
+
+    # Existence is cached until timeout
+    (tmp_path / "file.exr").write_bytes(b"")
+    assert resolver.resolve(path) == path
+    monkeypatch.setattr(resolver, "exists_timeout", 0)
+    assert resolver.resolve(path) == tmp_path.as_posix() + "/file.exr"
+
+    resolver.clear_cache()
+    monkeypatch.setattr(resolver, "exists_timeout", None)
+    (tmp_path / "file.exr").unlink()
+    assert resolver.resolve(path) == path
+    (tmp_path / "file.exr").write_bytes(b"")
+    assert resolver.resolve(path) == path
+
+
+def test_resolve_cache_size(monkeypatch):
+    resolver = _resolver([("/mnt/projects", "/data")])
+    monkeypatch.setattr(resolver, "max_cache_size", 2)
+    mapped_paths = []
+    monkeypatch.setattr(
+        resolver, "map_path",
+        lambda path: mapped_paths.append(path)
+    )
+    for path in ("/a", "/b", "/a", "/c", "/a", "/b"):
+        resolver.resolve(path)
+    # '/b' was evicted as least recently used
+    assert mapped_paths == ["/a", "/b", "/c", "/b"]
@@ -0,0 +1,169 @@
+import pytest
+
+from ayon_nuke.api.frame_paths import (
+    FramePathTemplate,
+    get_frame_filename_parts,
+    get_frame_paths,
+    parse_frame_files,
+)
+
+
+@pytest.fixture
+def write_node(nuke_stub):
+    def _write_node(path):
+        node = nuke_stub.createNode("Write")
+        node["file"].setValue(path)
+        return node
+    return _write_node
+
+
+def _count_evaluations(node, monkeypatch):
+    knob = node["file"]
+    evaluate = knob.evaluate
+    frames = []
+
+    def counting_evaluate(frame=None):
+        frames.append(frame)
+        return evaluate(frame)
+
+    monkeypatch.setattr(knob, "evaluate", counting_evaluate)
+    return frames
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("/renders/sh010.%04d.exr", "/renders/sh010.{:04d}.exr"),
+    ("/renders/sh010.####.exr", "/renders/sh010.{:04d}.exr"),
+    ("/renders/sh010.##.exr", "/renders/sh010.{:02d}.exr"),
+    ("/renders/sh010.$F4.exr", "/renders/sh010.{:04d}.exr"),
+    ("/renders/sh010.%d.exr", "/renders/sh010.{:d}.exr"),
+    ("/renders/sh010.$F.exr", "/renders/sh010.{:d}.exr"),
+    # only last token is the frame padding
+    ("/renders/v%03d/sh010.%04d.exr", "/renders/v%03d/sh010.{:04d}.exr"),
+])
+def test_padding(write_node, monkeypatch, path, expected):
+    node = write_node(path)
+    monkeypatch.setattr(
+        node["file"],
+        "evaluate",
+        lambda frame=None: expected.format(frame),
+    )
+    template = FramePathTemplate(node)
+    assert template.format(7) == expected.format(7)
+    assert get_frame_paths(node, 8, 12) == sorted(
+        expected.format(frame) for frame in range(8, 13)
+    )
+
+
+def test_knob_is_evaluated_on_boundaries_only(write_node, monkeypatch):
+    node = write_node("/renders/sh010.%04d.exr")
+    frames = _count_evaluations(node, monkeypatch)
+
+    paths = get_frame_paths(node, 1001, 1100)
+    assert len(paths) == 100
+    assert paths[0] == "/renders/sh010.1001.exr"
+    assert paths[-1] == "/renders/sh010.1100.exr"
+    assert sorted(frames) == [1001, 1100]
+
+
+def test_static_path(write_node):
+    node = write_node("/renders/sh010.mov")
+    assert get_frame_paths(node, 1001, 1100) == ["/renders/sh010.mov"]
+
+
+def test_frame_expression_is_evaluated_per_frame(write_node, monkeypatch):
+    node = write_node("/renders/sh010.[format %04d [frame]].exr")
+    monkeypatch.setattr(
+        node["file"],
+        "evaluate",
+        lambda frame=None: "/renders/sh010.{:04d}.exr".format(frame),
+    )
+    frames = _count_evaluations(node, monkeypatch)
+
+    paths = get_frame_paths(node, 1, 5)
+    assert paths == [
+        "/renders/sh010.{:04d}.exr".format(frame) for frame in range(1, 6)
+    ]
+    assert sorted(frames) == [1, 2, 3, 4, 5]
+
+
+def test_mismatched_template_falls_back(write_node, monkeypatch):
+    # Evaluated path differs from the template, e.g. frame offset
+    node = write_node("/renders/sh010.%04d.exr")
+    monkeypatch.setattr(
+        node["file"],
+        "evaluate",
+        lambda frame=None: "/renders/sh010.{:04d}.exr".format(frame + 100),
+    )
+    assert get_frame_paths(node, 1, 3) == [
+        "/renders/sh010.0101.exr",
+        "/renders/sh010.0102.exr",
+        "/renders/sh010.0103.exr",
+    ]
+
+
+def test_paths_are_unique_and_sorted(write_node, monkeypatch):
+    node = write_node("/renders/sh010.[expr [frame] / 2].exr")
+    monkeypatch.setattr(
+        node["file"],
+        "evaluate",
+        lambda frame=None: "/renders/sh010.{}.exr".format(frame // 2),
+    )
+    assert get_frame_paths(node, 1, 6) == [
+        "/renders/sh010.0.exr",
+        "/renders/sh010.1.exr",
+        "/renders/sh010.2.exr",
+        "/renders/sh010.3.exr",
+    ]
+
+
+def test_empty_path(write_node):
+    node = write_node("")
+    assert get_frame_paths(node, 1, 3) == [""]
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("/renders/sh010.%04d.exr", ("sh010.", ".exr")),
+    ("/renders/sh010_####_beauty.exr", ("sh010_", "_beauty.exr")),
+    ("/renders/v%03d/sh010.$F4.exr", ("sh010.", ".exr")),
+    ("/renders/sh010_v001.exr", None),
+])
+def test_get_frame_filename_parts(path, expected):
+    assert get_frame_filename_parts(path) == expected
+
+
+def test_parse_frame_files_with_output_path():
+    frames_by_sequence, remainder = parse_frame_files(
+        [
+            "sh010_1001_beauty.exr",
+            "sh010_1002_beauty.exr",
+            "sh010_0999_beauty.exr",
+            "sh010_v001_beauty.exr",
+            "sh010__beauty.exr",
+            "other_1001_beauty.exr",
+        ],
+        ("sh010_", "_beauty.exr"),
+    )
+    assert dict(frames_by_sequence) == {
+        ("sh010_", "_beauty.exr"): ["1001", "1002", "0999"],
+    }
+    assert remainder == [
+        "sh010_v001_beauty.exr",
+        "sh010__beauty.exr",
+        "other_1001_beauty.exr",
+    ]
+
+
+def test_parse_frame_files_without_output_path():
+    frames_by_sequence, remainder = parse_frame_files([
+        "sh010.1001.exr",
+        "sh010.1002.exr",
+        "sh010_v001.exr",
+        "sh010_1001_beauty.exr",
+        "notes.txt",
+    ])
+    assert dict(frames_by_sequence) == {
+        ("sh010.", ".exr"): ["1001", "1002"],
+        ("sh010_v", ".exr"): ["001"],
+    }
+    # frame number has to be right before the extension
+    assert remainder == ["sh010_1001_beauty.exr", "notes.txt"]
@@ -0,0 +1,284 @@
+import logging
+import threading
+import collections
+
+import pytest
+
+FilteredContainers = collections.namedtuple(
+    "FilteredContainers", ["latest", "outdated", "not_found", "invalid"]
+)
+COLOR_BY_CATEGORY = {
+    "latest": 0x4ecd25ff,
+    "outdated": 0xd84f20ff,
+    "invalid": 0xff0000ff,
+    "not_found": 0xffff00ff,
+}
+
+
+class FakeServer:
+    """Categories of representations returned by `filter_containers`."""
+
+    def __init__(self):
+        self.category_by_repre_id = {}
+        self.calls = []
+        self.on_call = None
+
+    def filter_containers(self, containers, project_name):
+        self.calls.append((
+            [container["representation"] for container in containers],
+            project_name,
+            threading.current_thread(),
+        ))
+        if self.on_call is not None:
+            self.on_call()
+        output = {field: [] for field in FilteredContainers._fields}
+        for container in containers:
+            category = self.category_by_repre_id[
+                container["representation"]]
+            output[category].append(container)
+        return FilteredContainers(**output)
+
+
+class FakeHost:
+    def __init__(self):
+        self.containers = []
+
+    def get_containers(self):
+        return list(self.containers)
+
+
+@pytest.fixture
+def inventory(nuke_stub, stub_module, import_fresh):
+    server = FakeServer()
+    host = FakeHost()
+    context = {"project_name": "project"}
+
+    class Logger:
+        @staticmethod
+        def get_logger(name):
+            return logging.getLogger(name)
+
+    stub_module("ayon_core.lib", Logger=Logger)
+    stub_module(
+        "ayon_core.pipeline",
+        registered_host=lambda: host,
+        get_current_project_name=lambda: context["project_name"],
+    )
+    stub_module(
+        "ayon_core.pipeline.load",
+        filter_containers=server.filter_containers,
+    )
+    module = import_fresh("ayon_nuke.api.inventory_versions")
+    state = module.InventoryVersionState()
+
+    def add_container(representation_id, category):
+        node = nuke_stub.createNode("Read")
+        host.containers.append({
+            "representation": representation_id,
+            "node": node,
+        })
+        server.category_by_repre_id[representation_id] = category
+        return node
+
+    return {
+        "module": module,
+        "state": state,
+        "server": server,
+        "host": host,
+        "context": context,
+        "add_container": add_container,
+    }
+
+
+def _color(node):
+    return node["tile_color"].value()
+
+
+def test_colors_by_category(inventory):
+    nodes = {
+        category: inventory["add_container"](category + "_repre", category)
+        for category in COLOR_BY_CATEGORY
+    }
+    inventory["state"].refresh()
+
+    for category, node in nodes.items():
+        assert _color(node) == COLOR_BY_CATEGORY[category]
+    assert len(inventory["server"].calls) == 1
+    repre_ids, project_name, _ = inventory["server"].calls[0]
+    assert sorted(repre_ids) == sorted(
+        category + "_repre" for category in COLOR_BY_CATEGORY
+    )
+    assert project_name == "project"
+
+
+def test_cached_categories_are_reused(inventory, monkeypatch):
+    server = inventory["server"]
+    state = inventory["state"]
+    first = inventory["add_container"]("repre1", "latest")
+    state.refresh()
+
+    second = inventory["add_container"]("repre2", "outdated")
+    # second container of cached representation
+    third = inventory["add_container"]("repre1", "latest")
+    state.refresh()
+    assert [call[0] for call in server.calls] == [["repre1"], ["repre2"]]
+    assert _color(second) == COLOR_BY_CATEGORY["outdated"]
+    assert _color(third) == COLOR_BY_CATEGORY["latest"]
+
+    # colors which did not change are not set again
+    set_values = []
+    monkeypatch.setattr(
+        first["tile_color"], "setValue", set_values.append
+    )
+    state.refresh()
+    assert len(server.calls) == 2
+    assert set_values == []
+
+    # category is queried again only after invalidation
+    server.category_by_repre_id["repre1"] = "outdated"
+    state.invalidate("repre1")
+    state.refresh()
+    assert sorted(server.calls[-1][0]) == ["repre1", "repre1"]
+    assert set_values == [COLOR_BY_CATEGORY["outdated"]]
+
+
+def test_project_change_resets_cache(inventory):
+    inventory["add_container"]("repre1", "latest")
+    inventory["state"].refresh()
+    inventory["context"]["project_name"] = "other"
+    inventory["state"].refresh()
+
+    calls = inventory["server"].calls
+    assert [(call[0], call[1]) for call in calls] == [
+        (["repre1"], "project"),
+        (["repre1"], "other"),
+    ]
+
+
+def test_reset_during_query_drops_results(inventory):
+    state = inventory["state"]
+    node = inventory["add_container"]("repre1", "outdated")
+    inventory["server"].on_call = state.reset
+    state.refresh()
+    assert _color(node) == 0
+
+    inventory["server"].on_call = None
+    state.refresh()
+    assert len(inventory["server"].calls) == 2
+    assert _color(node) == COLOR_BY_CATEGORY["outdated"]
+
+
+def test_query_thread(inventory, nuke_stub, monkeypatch):
+    state = inventory["state"]
+    server = inventory["server"]
+    node = inventory["add_container"]("repre1", "invalid")
+    monkeypatch.setattr(nuke_stub, "GUI", True)
+
+    # synchronous refresh before save stays on main thread
+    state.refresh(asynchronous=False)
+    assert server.calls[-1][2] is threading.current_thread()
+    assert _color(node) == COLOR_BY_CATEGORY["invalid"]
+
+    state.reset()
+    node["tile_color"].setValue(0)
+    threads = []
+    monkeypatch.setattr(
+        threading.Thread, "start",
+        lambda thread: threads.append(thread)
+    )
+    state.refresh()
+    assert len(threads) == 1
+    assert _color(node) == 0
+    threads[0].run()
+    assert _color(node) == COLOR_BY_CATEGORY["invalid"]
+
+
+def test_check_inventory_versions_logs_errors(inventory, caplog):
+    module = inventory["module"]
+    inventory["add_container"]("repre1", "latest")
+    inventory["server"].category_by_repre_id.clear()
+
+    # KeyError raised by server is caught and logged
+    module.check_inventory_versions()
+    assert "repre1" in caplog.text
+
+
+@pytest.fixture
+def worker_threads(monkeypatch):
+    threads = []
+    monkeypatch.setattr(
+        threading.Thread, "start",
+        lambda thread: threads.append(thread)
+    )
+    return threads
+
+
+def test_apply_cached_does_not_wait_for_server(
+    inventory, nuke_stub, monkeypatch, worker_threads
+):
+    state = inventory["state"]
+    server = inventory["server"]
+    first = inventory["add_container"]("repre1", "latest")
+    state.refresh()
+    assert len(server.calls) == 1
+
+    second = inventory["add_container"]("repre2", "outdated")
+    first["tile_color"].setValue(0)
+    # save in terminal mode does not query server either
+    for gui in (True, False):
+        monkeypatch.setattr(nuke_stub, "GUI", gui)
+        state.apply_cached()
+    assert _color(first) == COLOR_BY_CATEGORY["latest"]
+    assert len(server.calls) == 1
+    # representation which is being queried is not queued again
+    assert len(worker_threads) == 1
+
+    # worker results are not applied right after save
+    worker_threads[0].run()
+    assert server.calls[-1][0] == ["repre2"]
+    assert _color(second) == 0
+
+    # but on next save
+    state.apply_cached()
+    assert _color(second) == COLOR_BY_CATEGORY["outdated"]
+    assert len(server.calls) == 2
+    assert len(worker_threads) == 1
+
+
+def test_failed_query_is_retried(inventory, worker_threads):
+    state = inventory["state"]
+    server = inventory["server"]
+    node = inventory["add_container"]("repre1", "latest")
+    server.category_by_repre_id.clear()
+    state.apply_cached()
+    worker_threads[0].run()
+
+    server.category_by_repre_id["repre1"] = "latest"
+    state.apply_cached()
+    assert len(worker_threads) == 2
+    worker_threads[1].run()
+    state.apply_cached()
+    assert _color(node) == COLOR_BY_CATEGORY["latest"]
+
+
+def test_representation_change_invalidates_cache(inventory, nuke_stub):
+    module = inventory["module"]
+    server = inventory["server"]
+    node = inventory["add_container"]("repre1", "latest")
+    knob = nuke_stub.String_Knob("avalon:representation")
+    knob.setValue("repre1")
+    node.addKnob(knob)
+    nuke_stub.addKnobChanged(module.on_knob_changed)
+
+    module.check_inventory_versions()
+    module.check_inventory_versions()
+    assert len(server.calls) == 1
+
+    # other knobs keep the cache
+    nuke_stub.knobChanged(node, node["tile_color"])
+    module.check_inventory_versions()
+    assert len(server.calls) == 1
+
+    nuke_stub.knobChanged(node, knob)
+    module.check_inventory_versions()
+    assert [call[0] for call in server.calls] == [["repre1"], ["repre1"]]
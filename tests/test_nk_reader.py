@@ -0,0 +1,181 @@
+import re
+import textwrap
+
+from ayon_nuke.nk_reader import (
+    iter_nk_lines,
+    iter_nk_nodes,
+    parse_knob_value,
+    split_tcl_words,
+)
+from ayon_nuke.node_data_codec import INSTANCE_DATA_KNOB, encode_node_data
+
+
+def _parse(script, knob_names=None):
+    lines = textwrap.dedent(script).lstrip("\n").splitlines(True)
+    return {
+        node.full_name: node
+        for node in iter_nk_lines(lines, knob_names)
+    }
+
+
+def _tcl_quote(value):
+    """Quote value the way Nuke writes string knobs to script."""
+    return '"{}"'.format(re.sub(r'([\\"{}\[\]$])', r"\\\1", value))
+
+
+def test_split_tcl_words():
+    assert split_tcl_words(r'a "b \"c\"" {d {e} f}') == [
+        "a", 'b "c"', "d {e} f"
+    ]
+    assert parse_knob_value(r' "x\ty" ') == "x\ty"
+    assert parse_knob_value("{1 2 3}") == "1 2 3"
+    assert parse_knob_value("1 2") == "1 2"
+
+
+def test_stacked_inputs():
+    nodes = _parse("""
+        Root {
+         inputs 0
+         name /path/to/script.nk
+        }
+        Read {
+         inputs 0
+         name Read1
+         xpos 10
+         ypos -20
+        }
+        set N1 [stack 0]
+        Grade {
+         name Grade1
+        }
+        push $N1
+        Merge2 {
+         inputs 2
+         name Merge1
+        }
+        push 0
+        push $N1
+        Merge2 {
+         inputs 2+1
+         name Merge2
+        }
+    """)
+    assert nodes["root"].knobs["name"] == "/path/to/script.nk"
+    assert nodes["root"].inputs == []
+    assert nodes["Read1"].inputs == []
+    assert (nodes["Read1"].xpos, nodes["Read1"].ypos) == (10, -20)
+    assert nodes["Grade1"].inputs == ["Read1"]
+    # first popped node is input 0
+    assert nodes["Merge1"].inputs == ["Read1", "Grade1"]
+    assert nodes["Merge2"].inputs == ["Read1", None, "Merge1"]
+
+
+def test_nested_groups():
+    nodes = _parse("""
+        Read {
+         inputs 0
+         name Read1
+        }
+        Group {
+         name Group1
+        }
+         Input {
+          inputs 0
+          name Input1
+         }
+         Group {
+          name Group2
+         }
+          Input {
+           inputs 0
+           name Input1
+          }
+          Blur {
+           name Blur1
+          }
+          Output {
+           name Output1
+          }
+         end_group
+         Output {
+          name Output1
+         }
+        end_group
+        Write {
+         name Write1
+        }
+    """)
+    assert list(nodes) == [
+        "Read1",
+        "Group1",
+        "Group1.Input1",
+        "Group1.Group2",
+        "Group1.Group2.Input1",
+        "Group1.Group2.Blur1",
+        "Group1.Group2.Output1",
+        "Group1.Output1",
+        "Write1",
+    ]
+    assert nodes["Group1"].inputs == ["Read1"]
+    assert nodes["Group1.Group2"].group_path == "Group1"
+    assert nodes["Group1.Group2"].inputs == ["Group1.Input1"]
+    assert nodes["Group1.Group2.Blur1"].inputs == ["Group1.Group2.Input1"]
+    assert nodes["Group1.Output1"].inputs == ["Group1.Group2"]
+    assert nodes["Write1"].inputs == ["Group1"]
+
+
+def test_escaped_json_knob_value():
+    data = {
+        "productName": "renderMain",
+        "label": 'quoted "name" {braced} [tcl] $var',
+        "path": "C:\\renders\\file.####.exr",
+        "notes": "first\nsecond",
+    }
+    for codec_name in ("json", "zjson"):
+        knob_value = _tcl_quote(encode_node_data(data, codec_name))
+        nodes = _parse("""
+            Write {{
+             {knob} {value}
+             name Write1
+            }}
+        """.format(knob=INSTANCE_DATA_KNOB, value=knob_value))
+        assert nodes["Write1"].get_node_data() == data
+
+
+def test_multiline_brace_value():
+    nodes = _parse("""
+        StickyNote {
+         inputs 0
+         label {first line
+        second {nested} "quoted"
+        third}
+         note_font_size 20
+         name StickyNote1
+        }
+        NoOp {
+         name NoOp1
+        }
+    """, knob_names={"label", "note_font_size"})
+    sticky = nodes["StickyNote1"]
+    assert sticky.knobs["label"] == (
+        'first line\nsecond {nested} "quoted"\nthird'
+    )
+    assert sticky.knobs["note_font_size"] == "20"
+    assert nodes["NoOp1"].inputs == ["StickyNote1"]
+
+
+def test_iter_nk_nodes(tmp_path):
+    filepath = tmp_path / "script.nk"
+    filepath.write_text(textwrap.dedent("""\
+        Root {
+         inputs 0
+        }
+        Blur {
+         inputs 0
+         size 4
+         name Blur1
+        }
+    """))
+    nodes = list(iter_nk_nodes(str(filepath), knob_names={"size"}))
+    assert [node.full_name for node in nodes] == ["root", "Blur1"]
+    assert nodes[1].knobs == {"size": "4"}
@@ -0,0 +1,91 @@
+import pytest
+
+from ayon_nuke.api.node_data import (
+    NodeDataTransaction,
+    get_node_data,
+    node_data_transaction,
+    read_avalon_data,
+    set_node_data,
+)
+
+
+def _add_knob(nuke_stub, node, knob_class, knob_name, value):
+    knob = getattr(nuke_stub, knob_class)(knob_name)
+    knob.setValue(value)
+    node.addKnob(knob)
+    return knob
+
+
+def test_node_without_prefixed_knobs(nuke_stub, monkeypatch):
+    node = nuke_stub.createNode("Grade")
+    knob = _add_knob(nuke_stub, node, "String_Knob", "containerId", "abc")
+    monkeypatch.setattr(knob, "value", pytest.fail)
+    assert read_avalon_data(node) == {}
+
+
+def test_prefixed_knobs(nuke_stub):
+    node = nuke_stub.createNode("Read")
+    _add_knob(nuke_stub, node, "Tab_Knob", "avalon:tab", "")
+    _add_knob(nuke_stub, node, "String_Knob", "avalon:id", "ayon.load")
+    _add_knob(nuke_stub, node, "String_Knob", "ak:name", "plateMain")
+    _add_knob(nuke_stub, node, "Int_Knob", "avalon:version", 3)
+    _add_knob(nuke_stub, node, "Boolean_Knob", "avalon:active", True)
+    _add_knob(nuke_stub, node, "Text_Knob", "avalon:divider", "")
+    _add_knob(nuke_stub, node, "Text_Knob", "avalon:schema", "ayon:1.0")
+    _add_knob(nuke_stub, node, "String_Knob", "containerId", "abc")
+
+    assert read_avalon_data(node) == {
+        "id": "ayon.load",
+        "name": "plateMain",
+        "version": 3,
+        "active": True,
+        "schema": "ayon:1.0",
+    }
+
+
+def test_broken_knob_is_skipped(nuke_stub, monkeypatch):
+    node = nuke_stub.createNode("Read")
+    _add_knob(nuke_stub, node, "String_Knob", "avalon:id", "ayon.load")
+    broken = _add_knob(nuke_stub, node, "String_Knob", "avalon:name", "x")
+
+    def value():
+        raise RuntimeError("Knob is broken")
+
+    monkeypatch.setattr(broken, "value", value)
+    assert read_avalon_data(node) == {"id": "ayon.load"}
+
+
+def test_matches_tcl_parsing(nuke_stub):
+    from benchmarks.cases import _read_avalon_data_tcl
+    from benchmarks.scenes import build_scene
+
+    build_scene(300, instance_count=3, container_count=5)
+    for node in nuke_stub.allNodes(recurseGroups=True):
+        assert read_avalon_data(node) == _read_avalon_data_tcl(node)
+
+
+def test_transaction_writes_data_once_at_end(nuke_stub):
+    node = nuke_stub.createNode("Write")
+    with node_data_transaction():
+        set_node_data(node, "publish_instance", {"active": True})
+        set_node_data(node, "publish_instance", {"variant": "Main"})
+        assert "publish_instance" not in node.knobs()
+
+    assert NodeDataTransaction.active is None
+    assert get_node_data(node, "publish_instance") == {
+        "active": True, "variant": "Main"
+    }
+
+
+def test_transaction_discards_data_on_error(nuke_stub):
+    node = nuke_stub.createNode("Write")
+    set_node_data(node, "publish_instance", {"active": True})
+    with pytest.raises(RuntimeError):
+        with node_data_transaction():
+            set_node_data(node, "publish_instance", {"active": False})
+            with node_data_transaction():
+                set_node_data(node, "publish_instance", {"variant": "Main"})
+            raise RuntimeError("Update failed")
+
+    assert NodeDataTransaction.active is None
+    assert get_node_data(node, "publish_instance") == {"active": True}
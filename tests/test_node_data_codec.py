@@ -0,0 +1,153 @@
+from types import MappingProxyType
+
+import pytest
+
+from ayon_nuke.node_data_codec import (
+    NODE_DATA_CODEC_ENV,
+    CompactJsonNodeDataCodec,
+    JsonNodeDataCodec,
+    NodeDataCache,
+    NodeDataCodec,
+    decode_node_data,
+    encode_node_data,
+    find_node_data_codec,
+    freeze_node_data,
+    get_node_data_codec,
+    thaw_node_data,
+)
+
+
+def _instance_data(idx=0):
+    return {
+        "id": "ayon.create.instance",
+        "productType": "render",
+        "productName": "renderCompositingMain{}".format(idx),
+        "folderPath": "/shots/sq010/sh{:04d}".format(idx),
+        "task": "compositing",
+        "active": True,
+        "creator_identifier": "create_write_render",
+        "creator_attributes": {
+            "render_target": "frames_farm",
+            "review": True,
+            "frame_range": [1001, 1100],
+        },
+        "publish_attributes": {
+            "CollectFramesFixDef": {"frames_to_fix": ""},
+            "ValidateCorrectAssetContext": {"active": True},
+            "ExtractReviewIntermediates": {"active": True},
+        },
+    }
+
+
+@pytest.mark.parametrize("codec_name", ["json", "zjson"])
+def test_round_trip(codec_name):
+    data = _instance_data()
+    rawdata = encode_node_data(data, codec_name)
+    codec = get_node_data_codec(codec_name)
+    assert rawdata.startswith(codec.prefix)
+    assert find_node_data_codec(rawdata) is codec
+    assert decode_node_data(rawdata) == data
+
+
+def test_prefixes():
+    assert encode_node_data({}, "json").startswith("JSON:::")
+    assert encode_node_data({}, "zjson").startswith("ZJSON1:::")
+
+
+def test_compact_codec_is_smaller():
+    data = {
+        "instances": [_instance_data(idx) for idx in range(20)]
+    }
+    json_size = len(encode_node_data(data, "json"))
+    compact_size = len(encode_node_data(data, "zjson"))
+    assert compact_size < json_size / 4
+
+
+def test_default_codec_from_env(monkeypatch):
+    monkeypatch.delenv(NODE_DATA_CODEC_ENV, raising=False)
+    assert isinstance(get_node_data_codec(), JsonNodeDataCodec)
+
+    monkeypatch.setenv(NODE_DATA_CODEC_ENV, "zjson")
+    assert isinstance(get_node_data_codec(), CompactJsonNodeDataCodec)
+    assert encode_node_data({"a": 1}).startswith("ZJSON1:::")
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        get_node_data_codec("unknown")
+
+
+@pytest.mark.parametrize("rawdata", [
+    None,
+    "",
+    "plain text",
+    "UNKNOWN:::{}",
+    "JSON:::{not json",
+    "ZJSON1:::not base64!",
+    "ZJSON1:::aGVsbG8=",
+])
+def test_decode_invalid(rawdata):
+    assert decode_node_data(rawdata) is None
+
+
+def test_codec_is_abstract():
+    with pytest.raises(TypeError):
+        NodeDataCodec()
+
+
+def test_freeze_and_thaw():
+    data = _instance_data()
+    frozen = freeze_node_data(data)
+    assert isinstance(frozen, MappingProxyType)
+    assert isinstance(frozen["creator_attributes"], MappingProxyType)
+    assert frozen["creator_attributes"]["frame_range"] == (1001, 1100)
+    with pytest.raises(TypeError):
+        frozen["productName"] = "other"
+    with pytest.raises(TypeError):
+        frozen["publish_attributes"]["CollectFramesFixDef"]["a"] = 1
+
+    thawed = thaw_node_data(frozen)
+    assert thawed == data
+    assert type(thawed) is dict
+    assert type(thawed["creator_attributes"]["frame_range"]) is list
+    thawed["creator_attributes"]["review"] = False
+    assert frozen["creator_attributes"]["review"] is True
+    assert data["creator_attributes"]["review"] is True
+
+
+def test_cache_returns_frozen_data():
+    cache = NodeDataCache()
+    rawdata = encode_node_data(_instance_data())
+    first = cache.get(rawdata)
+    assert isinstance(first, MappingProxyType)
+    assert cache.get(rawdata) is first
+    assert cache.info() == {
+        "hits": 1, "misses": 1, "size": 1, "maxsize": 1024
+    }
+    assert cache.get(None) is None
+    # invalid values are cached too
+    assert cache.get("plain text") is None
+    assert cache.get("plain text") is None
+    assert cache.info()["hits"] == 2
+
+    cache.clear()
+    assert cache.info() == {
+        "hits": 0, "misses": 0, "size": 0, "maxsize": 1024
+    }
+
+
+def test_cache_lru_eviction():
+    cache = NodeDataCache(maxsize=2)
+    values = [encode_node_data({"idx": idx}) for idx in range(3)]
+    cache.get(values[0])
+    cache.get(values[1])
+    # use first value so second is least recently used
+    cache.get(values[0])
+    cache.get(values[2])
+    assert cache.info()["size"] == 2
+
+    cache.get(values[0])
+    cache.get(values[2])
+    assert cache.info()["hits"] == 3
+    cache.get(values[1])
+    assert cache.info()["misses"] == 4
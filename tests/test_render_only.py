@@ -0,0 +1,119 @@
+import os
+import sys
+import logging
+
+import pytest
+
+
+def _env_value_to_bool(env_key=None, value=None, default=False):
+    if value is None:
+        value = os.getenv(env_key)
+    if value is None:
+        return default
+    return value.lower() in ("1", "yes", "true", "on")
+
+
+class Logger:
+    @staticmethod
+    def get_logger(name):
+        return logging.getLogger(name)
+
+
+@pytest.fixture
+def render_only(nuke_stub, stub_module, import_fresh, monkeypatch):
+    monkeypatch.delenv("AYON_NUKE_RENDER_ONLY", raising=False)
+    monkeypatch.setattr(nuke_stub, "GUI", False)
+    monkeypatch.setattr(nuke_stub, "rawArgs", ["nuke"], raising=False)
+    stub_module(
+        "ayon_core.lib",
+        Logger=Logger,
+        env_value_to_bool=_env_value_to_bool,
+    )
+    return import_fresh("ayon_nuke.api.render_only")
+
+
+@pytest.mark.parametrize("args, expected", [
+    (["nuke", "-x", "script.nk"], True),
+    (["nuke", "-F", "1001-1100", "-X", "Write1", "script.nk"], True),
+    (["nuke", "-t", "publish.py"], False),
+    (["nuke", "script.nk"], False),
+])
+def test_detected_from_arguments(render_only, nuke_stub, monkeypatch, args,
+                                 expected):
+    monkeypatch.setattr(nuke_stub, "rawArgs", args)
+    assert render_only.is_render_only_mode() is expected
+
+
+def test_arguments_fallback_to_sys_argv(render_only, nuke_stub, monkeypatch):
+    monkeypatch.delattr(nuke_stub, "rawArgs")
+    monkeypatch.setattr(sys, "argv", ["nuke", "-x", "script.nk"])
+    assert render_only.is_render_only_mode() is True
+
+
+def test_gui_is_never_render_only(render_only, nuke_stub, monkeypatch):
+    monkeypatch.setattr(nuke_stub, "GUI", True)
+    monkeypatch.setattr(nuke_stub, "rawArgs", ["nuke", "-x", "script.nk"])
+    assert render_only.is_render_only_mode() is False
+
+
+@pytest.mark.parametrize("value, args, expected", [
+    ("1", ["nuke", "-t"], True),
+    ("0", ["nuke", "-x", "script.nk"], False),
+    ("false", ["nuke", "-x", "script.nk"], False),
+])
+def test_environment_variable_wins(
+    render_only, nuke_stub, monkeypatch, value, args, expected
+):
+    monkeypatch.setenv("AYON_NUKE_RENDER_ONLY", value)
+    monkeypatch.setattr(nuke_stub, "rawArgs", args)
+    assert render_only.is_render_only_mode() is expected
+
+
+@pytest.mark.parametrize("dirmap_enabled", [True, False])
+def test_install_render_only(
+    render_only, nuke_stub, stub_module, monkeypatch, dirmap_enabled
+):
+    def dirmap_file_name_filter(file_name):
+        return file_name
+
+    stub_module(
+        "ayon_nuke.api.settings",
+        get_project_settings_view=lambda: {
+            "nuke": {"dirmap": {"enabled": dirmap_enabled}}
+        },
+    )
+    stub_module(
+        "ayon_nuke.api.dirmap",
+        dirmap_file_name_filter=dirmap_file_name_filter,
+    )
+    filters = []
+    monkeypatch.setattr(nuke_stub, "addFilenameFilter", filters.append)
+    callbacks = []
+    for name in ("addOnCreate", "addOnScriptLoad", "addOnScriptSave"):
+        monkeypatch.setattr(nuke_stub, name, callbacks.append)
+
+    render_only.install_render_only()
+    if dirmap_enabled:
+        assert filters == [dirmap_file_name_filter]
+    else:
+        assert filters == []
+    assert callbacks == []
+
+
+def test_render_only_startup_skips_full_install():
+    from benchmarks.startup import run_startup
+
+    render_only = run_startup(render_only=True)
+    full = run_startup(render_only=False)
+
+    assert "ayon_nuke.api.dirmap" in render_only["modules"]
+    for module_name in (
+        "ayon_nuke.api.lib",
+        "ayon_nuke.api.pipeline",
+        "ayon_nuke.api.plugin",
+        "qtpy",
+    ):
+        assert module_name not in render_only["modules"]
+    assert "ayon_nuke.api.lib" in full["modules"]
+    assert set(render_only["modules"]) < set(full["modules"])
+    assert render_only["duration"] < full["duration"]
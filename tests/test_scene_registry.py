@@ -0,0 +1,201 @@
+import pytest
+
+from ayon_nuke.node_data_codec import INSTANCE_DATA_KNOB, encode_node_data
+from ayon_nuke.api import scene_registry
+from ayon_nuke.api.node_data import set_node_data
+from ayon_nuke.api.scene_registry import CONTAINER_ID_KNOB, SceneRegistry
+
+
+def _add_knob(nuke, node, knob_name, value):
+    knob = nuke.String_Knob(knob_name)
+    knob.setValue(value)
+    node.addKnob(knob)
+    return knob
+
+
+def _create_instance(nuke, creator_identifier):
+    node = nuke.createNode("Group")
+    _add_knob(nuke, node, INSTANCE_DATA_KNOB, encode_node_data({
+        "id": "ayon.create.instance",
+        "creator_identifier": creator_identifier,
+    }))
+    return node
+
+
+def _create_container(nuke, representation_id, container_id, member_count):
+    node = nuke.createNode("Read")
+    _add_knob(nuke, node, "avalon:id", "ayon.load.container")
+    _add_knob(nuke, node, "avalon:representation", representation_id)
+    _add_knob(nuke, node, CONTAINER_ID_KNOB, container_id)
+    members = [node]
+    for _ in range(member_count):
+        member = nuke.createNode("Reformat")
+        _add_knob(nuke, member, CONTAINER_ID_KNOB, container_id)
+        members.append(member)
+    return node, members
+
+
+@pytest.fixture
+def all_nodes_calls(nuke_stub, monkeypatch):
+    calls = []
+    all_nodes = nuke_stub.allNodes
+
+    def _all_nodes(*args, **kwargs):
+        calls.append(kwargs)
+        return all_nodes(*args, **kwargs)
+
+    monkeypatch.setattr(nuke_stub, "allNodes", _all_nodes)
+    return calls
+
+
+@pytest.fixture
+def scene_registry_singleton():
+    registry = scene_registry.get_scene_registry()
+    registry.tracking = False
+    registry.reset()
+    yield registry
+    registry.tracking = False
+    registry.reset()
+
+
+def test_index(nuke_stub):
+    render = _create_instance(nuke_stub, "create_write_render")
+    image = _create_instance(nuke_stub, "create_write_image")
+    with render:
+        nested = _create_instance(nuke_stub, "create_write_render")
+    container, members = _create_container(nuke_stub, "repre1", "id1", 2)
+    nuke_stub.createNode("Blur")
+
+    registry = SceneRegistry()
+    assert registry.get_instance_nodes() == [render, nested, image]
+    assert registry.get_instance_nodes("create_write_render") == [
+        render, nested
+    ]
+    assert registry.get_instance_nodes("unknown") == []
+    assert registry.get_avalon_nodes() == [container]
+    assert registry.get_container_nodes("repre1") == [container]
+    assert registry.get_member_nodes("id1") == members
+    assert registry.get_member_nodes("id2") == []
+
+
+def test_rebuild_without_tracking(nuke_stub, all_nodes_calls):
+    registry = SceneRegistry()
+    registry.get_instance_nodes()
+    instance = _create_instance(nuke_stub, "create_write_render")
+    assert registry.get_instance_nodes() == [instance]
+    assert len(all_nodes_calls) == 2
+
+
+def test_batch_builds_index_once(nuke_stub, all_nodes_calls):
+    container_ids = ["id{}".format(idx) for idx in range(20)]
+    for container_id in container_ids:
+        _create_container(nuke_stub, container_id, container_id, 3)
+
+    registry = SceneRegistry()
+    with registry.batch():
+        with registry.batch():
+            for container_id in container_ids:
+                assert len(registry.get_member_nodes(container_id)) == 4
+        for container_id in container_ids:
+            registry.get_container_nodes(container_id)
+    # Number of scene walks does not grow with number of queries
+    assert len(all_nodes_calls) == 1
+    assert all_nodes_calls[0] == {"recurseGroups": True}
+
+    # Index is dropped at the end of the batch
+    registry.get_member_nodes("id0")
+    assert len(all_nodes_calls) == 2
+
+
+def test_scene_registry_batch_decorator(
+    nuke_stub, all_nodes_calls, scene_registry_singleton
+):
+    container_ids = ["id{}".format(idx) for idx in range(5)]
+    for container_id in container_ids:
+        _create_container(nuke_stub, container_id, container_id, 3)
+
+    @scene_registry.scene_registry_batch()
+    def remove(container_id):
+        members = scene_registry_singleton.get_member_nodes(container_id)
+        for member in members:
+            scene_registry_singleton.get_member_nodes(container_id)
+        return members
+
+    # One scene walk per operation
+    assert len(remove("id0")) == 4
+    assert len(all_nodes_calls) == 1
+
+    # Operations in outer batch share the index
+    with scene_registry.get_scene_registry().batch():
+        for container_id in container_ids:
+            remove(container_id)
+    assert len(all_nodes_calls) == 2
+
+
+def test_batch_changes(nuke_stub, all_nodes_calls):
+    _, members = _create_container(nuke_stub, "repre1", "id1", 3)
+    registry = SceneRegistry()
+    with registry.batch():
+        assert registry.get_member_nodes("id1") == members
+
+        # Erased nodes are skipped without notification
+        nuke_stub.delete(members[-1])
+        assert registry.get_member_nodes("id1") == members[:-1]
+
+        # Changed and created nodes are re-indexed when marked dirty
+        members[1][CONTAINER_ID_KNOB].setValue("id2")
+        registry.mark_dirty(members[1])
+        new_member = nuke_stub.createNode("Grade")
+        _add_knob(nuke_stub, new_member, CONTAINER_ID_KNOB, "id2")
+        registry.mark_dirty(new_member)
+        assert registry.get_member_nodes("id1") == [members[0], members[2]]
+        assert registry.get_member_nodes("id2") == [members[1], new_member]
+
+        registry.discard(members[0])
+        assert registry.get_avalon_nodes() == []
+    assert len(all_nodes_calls) == 1
+
+
+def test_tracking_with_callbacks(
+    nuke_stub,
+    stub_module,
+    import_fresh,
+    all_nodes_calls,
+    scene_registry_singleton,
+):
+    stub_module("ayon_core.lib", env_value_to_bool=lambda *args, **kw: False)
+    import_fresh("ayon_nuke.api.instrumentation")
+    registry = scene_registry_singleton
+    first = _create_instance(nuke_stub, "create_write_render")
+    scene_registry.install_callbacks()
+    assert registry.get_instance_nodes() == [first]
+
+    # Created nodes are indexed by 'onCreate' callback
+    second = _create_instance(nuke_stub, "create_write_image")
+    assert registry.get_instance_nodes() == [first, second]
+
+    # Node data written by integration mark node as changed
+    node = nuke_stub.createNode("Write")
+    set_node_data(node, INSTANCE_DATA_KNOB, {
+        "creator_identifier": "create_write_prerender"
+    })
+    assert registry.get_instance_nodes("create_write_prerender") == [node]
+
+    # Changes of data knobs in properties panel
+    container, _ = _create_container(nuke_stub, "repre1", "id1", 0)
+    assert registry.get_container_nodes("repre1") == [container]
+    knob = container["avalon:representation"]
+    knob.setValue("repre2")
+    nuke_stub.knobChanged(container, knob)
+    assert registry.get_container_nodes("repre1") == []
+    assert registry.get_container_nodes("repre2") == [container]
+
+    # Erased nodes are removed by 'onDestroy' callback
+    nuke_stub.delete(first)
+    assert registry.get_instance_nodes() == [second, node]
+    assert len(all_nodes_calls) == 1
+
+    # Index is rebuilt after script close
+    nuke_stub.scriptClear()
+    assert registry.get_instance_nodes() == []
+    assert len(all_nodes_calls) == 2
@@ -0,0 +1,213 @@
+import os
+import logging
+import importlib.util
+
+import pytest
+
+from conftest import CLIENT_DIR
+
+PUBLISH_PLUGINS_DIR = os.path.join(
+    CLIENT_DIR, "ayon_nuke", "plugins", "publish"
+)
+FIRST_FRAME = 1001
+LAST_FRAME = 1005
+
+
+class PublishXmlValidationError(Exception):
+    def __init__(self, plugin, message, key=None, formatting_data=None):
+        super().__init__(message)
+        self.key = key
+        self.formatting_data = formatting_data
+
+
+class OptionalPyblishPluginMixin:
+    def is_active(self, data):
+        return True
+
+
+class InstancePlugin:
+    log = logging.getLogger("pyblish.plugin")
+
+
+class Collection:
+    def __init__(self, head, tail, padding, indexes=None):
+        self.head = head
+        self.tail = tail
+        self.padding = padding
+        self.indexes = indexes
+
+
+class Node:
+    def name(self):
+        return "Write1"
+
+
+class Context:
+    def __init__(self):
+        self.data = {}
+
+
+class Instance:
+    def __init__(self, staging_dir, files, path=None, families=None):
+        self.context = Context()
+        self.data = {
+            "frameStartHandle": FIRST_FRAME,
+            "frameEndHandle": LAST_FRAME,
+            "families": families or ["render"],
+            "transientData": {"node": Node()},
+            "representations": [
+                {"files": files, "stagingDir": staging_dir},
+            ],
+        }
+        if path:
+            self.data["path"] = path
+
+
+@pytest.fixture
+def load_plugin(stub_module, nuke_stub):
+    stub_module(
+        "pyblish.api",
+        ValidatorOrder=1,
+        Action=object,
+        InstancePlugin=InstancePlugin,
+    )
+    stub_module(
+        "ayon_core.pipeline",
+        PublishXmlValidationError=PublishXmlValidationError,
+        OptionalPyblishPluginMixin=OptionalPyblishPluginMixin,
+    )
+    stub_module(
+        "ayon_core.pipeline.publish",
+        get_errored_instances_from_context=lambda context, plugin: [],
+    )
+    stub_module("clique", Collection=Collection)
+
+    def _load_plugin(file_name, class_name):
+        spec = importlib.util.spec_from_file_location(
+            "test_" + file_name,
+            os.path.join(PUBLISH_PLUGINS_DIR, file_name + ".py"),
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return getattr(module, class_name)()
+    return _load_plugin
+
+
+@pytest.fixture
+def validate_frames(load_plugin):
+    return load_plugin("validate_rendered_frames", "ValidateRenderedFrames")
+
+
+@pytest.fixture
+def validate_integrity(load_plugin):
+    plugin = load_plugin(
+        "validate_rendered_frames_integrity",
+        "ValidateRenderedFramesIntegrity",
+    )
+    plugin.max_workers = 1
+    return plugin
+
+
+def _write_files(dirpath, sizes_by_filename):
+    for filename, size in sizes_by_filename.items():
+        with open(os.path.join(dirpath, filename), "wb") as stream:
+            # EXR magic number followed by padding, empty when size is 0
+            stream.write((b"v/1\x01" + b"\0" * size)[:size])
+    return list(sizes_by_filename)
+
+
+def test_frames_in_middle_of_file_name(validate_frames, tmp_path):
+    files = [
+        "sh010_v001_{}_beauty.exr".format(frame)
+        for frame in range(FIRST_FRAME, LAST_FRAME + 1)
+    ]
+    instance = Instance(
+        str(tmp_path), files, path="/renders/sh010_v001_####_beauty.exr"
+    )
+    validate_frames.process(instance)
+
+    collection = instance.data["collection"]
+    assert (collection.head, collection.tail) == (
+        "sh010_v001_", "_beauty.exr"
+    )
+    assert collection.indexes == set(range(FIRST_FRAME, LAST_FRAME + 1))
+
+
+def test_no_sequence_is_reported(validate_frames, tmp_path):
+    instance = Instance(
+        str(tmp_path),
+        ["sh010_v001_beauty.exr", "notes.txt"],
+        path="/renders/sh010_v001_####.exr",
+    )
+    with pytest.raises(PublishXmlValidationError, match="not a frame"):
+        validate_frames.process(instance)
+
+
+def test_multiple_sequences_fail(validate_frames, tmp_path):
+    files = [
+        "{}.{}.exr".format(name, frame)
+        for name in ("beauty", "depth")
+        for frame in range(FIRST_FRAME, LAST_FRAME + 1)
+    ]
+    instance = Instance(str(tmp_path), files)
+    with pytest.raises(PublishXmlValidationError, match="multiple"):
+        validate_frames.process(instance)
+
+
+def test_truncated_sequence_fails(validate_frames, tmp_path):
+    files = [
+        "sh010.{}.exr".format(frame)
+        for frame in range(FIRST_FRAME, LAST_FRAME)
+    ]
+    instance = Instance(str(tmp_path), files, path="/renders/sh010.%04d.exr")
+    with pytest.raises(PublishXmlValidationError) as exc_info:
+        validate_frames.process(instance)
+
+    assert exc_info.value.key == "missing_frames"
+    assert instance.data["missingFrameRanges"] == [(LAST_FRAME, LAST_FRAME)]
+
+
+def test_slate_is_not_size_outlier(validate_integrity, tmp_path):
+    sizes_by_filename = {
+        "sh010.{}.exr".format(frame): 10000
+        for frame in range(FIRST_FRAME, LAST_FRAME + 1)
+    }
+    sizes_by_filename["sh010.{}.exr".format(FIRST_FRAME - 1)] = 100
+    files = _write_files(str(tmp_path), sizes_by_filename)
+    instance = Instance(
+        str(tmp_path),
+        files,
+        path="/renders/sh010.%04d.exr",
+        families=["render", "slate"],
+    )
+    validate_integrity.process(instance)
+
+    assert "badFrameRanges" not in instance.data
+
+
+def test_small_frame_is_reported(validate_integrity, tmp_path):
+    sizes_by_filename = {
+        "sh010.{}.exr".format(frame): 10000
+        for frame in range(FIRST_FRAME, LAST_FRAME + 1)
+    }
+    sizes_by_filename["sh010.{}.exr".format(FIRST_FRAME + 2)] = 100
+    files = _write_files(str(tmp_path), sizes_by_filename)
+    instance = Instance(str(tmp_path), files, path="/renders/sh010.%04d.exr")
+    with pytest.raises(PublishXmlValidationError):
+        validate_integrity.process(instance)
+
+    assert instance.data["badFrameRanges"] == [
+        (FIRST_FRAME + 2, FIRST_FRAME + 2)
+    ]
+
+
+def test_still_version_is_not_frame(validate_integrity, tmp_path):
+    files = _write_files(str(tmp_path), {"plate_v001.exr": 0})
+    instance = Instance(
+        str(tmp_path), files, path="/renders/plate_v001.exr",
+        families=["still"],
+    )
+    with pytest.raises(PublishXmlValidationError):
+        validate_integrity.process(instance)
+
+    assert instance.data["badFrameRanges"] == [(FIRST_FRAME, FIRST_FRAME)]